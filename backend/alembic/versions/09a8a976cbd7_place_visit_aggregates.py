@@ -0,0 +1,53 @@
+"""place visit aggregates
+
+Revision ID: 09a8a976cbd7
+Revises: d5bd684e2818
+Create Date: 2026-10-19 10:12:31.402117
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = '09a8a976cbd7'
+down_revision: Union[str, None] = 'd5bd684e2818'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column('places', sa.Column('visit_count', sa.Integer(), server_default=sa.text('0'), nullable=False))
+    op.add_column('places', sa.Column('last_visited_at', sa.Date(), nullable=True))
+    op.add_column('places', sa.Column('visit_rating_sum', sa.Integer(), server_default=sa.text('0'), nullable=False))
+    op.add_column('places', sa.Column('visit_rating_count', sa.Integer(), server_default=sa.text('0'), nullable=False))
+    op.execute(
+        """
+        UPDATE places AS p
+        SET visit_count = s.visit_count,
+            last_visited_at = s.last_visited_at,
+            visit_rating_sum = s.visit_rating_sum,
+            visit_rating_count = s.visit_rating_count
+        FROM (
+            SELECT place_id,
+                   count(*) AS visit_count,
+                   max(visited_at) AS last_visited_at,
+                   coalesce(sum(rating), 0) AS visit_rating_sum,
+                   count(rating) AS visit_rating_count
+            FROM visits
+            GROUP BY place_id
+        ) AS s
+        WHERE p.id = s.place_id
+        """
+    )
+    op.create_index('idx_places_visit_count', 'places', ['visit_count', 'id'], unique=False)
+    op.create_index('idx_places_last_visited', 'places', ['last_visited_at', 'id'], unique=False, postgresql_where=sa.text('last_visited_at IS NOT NULL'))
+
+
+def downgrade() -> None:
+    op.drop_index('idx_places_last_visited', table_name='places', postgresql_where=sa.text('last_visited_at IS NOT NULL'))
+    op.drop_index('idx_places_visit_count', table_name='places')
+    op.drop_column('places', 'visit_rating_count')
+    op.drop_column('places', 'visit_rating_sum')
+    op.drop_column('places', 'last_visited_at')
+    op.drop_column('places', 'visit_count')
@@ -0,0 +1,62 @@
+"""place search documents
+
+Revision ID: 5d2c8f4a1e93
+Revises: a3f8c6e1d047
+Create Date: 2026-10-19 20:14:37.902615
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+# revision identifiers, used by Alembic.
+revision: str = '5d2c8f4a1e93'
+down_revision: Union[str, None] = 'a3f8c6e1d047'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# 기존 장소 백필 — search_document_service._document_rows와 같은 문서를 만든다
+BACKFILL = """
+INSERT INTO place_search_documents (place_id, document, body)
+SELECT
+    parts.place_id,
+    setweight(to_tsvector('simple', parts.name), 'A')
+        || setweight(to_tsvector('simple', parts.labels), 'B')
+        || setweight(to_tsvector('simple', parts.sources), 'C')
+        || setweight(to_tsvector('simple', parts.notes), 'D'),
+    concat_ws(' ', parts.name, parts.labels, parts.sources, parts.notes)
+FROM (
+    SELECT
+        p.id AS place_id,
+        p.canonical_name AS name,
+        concat_ws(
+            ' ',
+            coalesce((SELECT string_agg(t.name, ' ') FROM tags t JOIN place_tags pt ON pt.tag_id = t.id WHERE pt.place_id = p.id), ''),
+            array_to_string(array_cat(coalesce(p.mood, '{}'), coalesce(p.situations, '{}')), ' ')
+        ) AS labels,
+        coalesce((SELECT string_agg(concat_ws(' ', s.title, s.snippet), ' ') FROM sources s WHERE s.place_id = p.id), '') AS sources,
+        coalesce((SELECT string_agg(n.content, ' ') FROM notes n WHERE n.place_id = p.id), '') AS notes
+    FROM places p
+) parts
+"""
+
+
+def upgrade() -> None:
+    op.create_table('place_search_documents',
+    sa.Column('place_id', sa.UUID(), nullable=False),
+    sa.Column('document', postgresql.TSVECTOR(), nullable=False),
+    sa.Column('body', sa.Text(), nullable=False),
+    sa.Column('updated_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=False),
+    sa.ForeignKeyConstraint(['place_id'], ['places.id'], ondelete='CASCADE'),
+    sa.PrimaryKeyConstraint('place_id')
+    )
+    op.execute(BACKFILL)
+    op.create_index('idx_place_search_documents_body', 'place_search_documents', ['body'], unique=False, postgresql_using='gin', postgresql_ops={'body': 'gin_trgm_ops'})
+    op.create_index('idx_place_search_documents_document', 'place_search_documents', ['document'], unique=False, postgresql_using='gin')
+
+
+def downgrade() -> None:
+    op.drop_index('idx_place_search_documents_document', table_name='place_search_documents', postgresql_using='gin')
+    op.drop_index('idx_place_search_documents_body', table_name='place_search_documents', postgresql_using='gin', postgresql_ops={'body': 'gin_trgm_ops'})
+    op.drop_table('place_search_documents')
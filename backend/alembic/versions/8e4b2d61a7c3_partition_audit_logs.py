@@ -0,0 +1,79 @@
+"""partition audit logs
+
+Revision ID: 8e4b2d61a7c3
+Revises: 5c1e7a3f9d20
+Create Date: 2026-10-19 14:25:48.130675
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = '8e4b2d61a7c3'
+down_revision: Union[str, None] = '5c1e7a3f9d20'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# 기존 데이터가 있는 달부터 이번 달 + 2개월까지 월별 파티션을 만든다
+CREATE_MONTHLY_PARTITIONS = """
+DO $$
+DECLARE
+    month_start date;
+BEGIN
+    FOR month_start IN
+        SELECT generate_series(
+            date_trunc('month', coalesce((SELECT min(created_at) FROM audit_logs_old), now()) AT TIME ZONE 'UTC'),
+            date_trunc('month', now() AT TIME ZONE 'UTC') + interval '2 months',
+            interval '1 month'
+        )::date
+    LOOP
+        EXECUTE format(
+            'CREATE TABLE IF NOT EXISTS %I PARTITION OF audit_logs FOR VALUES FROM (%L) TO (%L)',
+            'audit_logs_y' || to_char(month_start, 'YYYY') || 'm' || to_char(month_start, 'MM'),
+            month_start::text || ' 00:00:00+00',
+            (month_start + interval '1 month')::date::text || ' 00:00:00+00'
+        );
+    END LOOP;
+END
+$$;
+"""
+
+
+def upgrade() -> None:
+    op.execute('ALTER TABLE audit_logs RENAME TO audit_logs_old')
+    op.execute('ALTER TABLE audit_logs_old RENAME CONSTRAINT audit_logs_pkey TO audit_logs_old_pkey')
+    op.create_table('audit_logs',
+    sa.Column('id', sa.UUID(), server_default=sa.text('uuid_generate_v4()'), nullable=False),
+    sa.Column('action', sa.String(length=64), nullable=False),
+    sa.Column('entity_type', sa.String(length=32), nullable=True),
+    sa.Column('entity_id', sa.UUID(), nullable=True),
+    sa.Column('detail', sa.JSON(), nullable=True),
+    sa.Column('created_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=False),
+    sa.Column('updated_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=False),
+    sa.PrimaryKeyConstraint('id', 'created_at'),
+    postgresql_partition_by='RANGE (created_at)'
+    )
+    op.create_index('idx_audit_logs_entity', 'audit_logs', ['entity_type', 'entity_id', 'created_at'], unique=False)
+    op.execute(CREATE_MONTHLY_PARTITIONS)
+    # 파티션 생성이 늦어져도 INSERT가 실패하지 않도록 하는 안전망
+    op.execute('CREATE TABLE audit_logs_default PARTITION OF audit_logs DEFAULT')
+    op.execute('INSERT INTO audit_logs SELECT id, action, entity_type, entity_id, detail, created_at, updated_at FROM audit_logs_old')
+    op.drop_table('audit_logs_old')
+
+
+def downgrade() -> None:
+    op.execute('ALTER TABLE audit_logs RENAME TO audit_logs_partitioned')
+    op.create_table('audit_logs',
+    sa.Column('id', sa.UUID(), server_default=sa.text('uuid_generate_v4()'), nullable=False),
+    sa.Column('action', sa.String(length=64), nullable=False),
+    sa.Column('entity_type', sa.String(length=32), nullable=True),
+    sa.Column('entity_id', sa.UUID(), nullable=True),
+    sa.Column('detail', sa.JSON(), nullable=True),
+    sa.Column('created_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=False),
+    sa.Column('updated_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=False),
+    sa.PrimaryKeyConstraint('id', name='audit_logs_pkey_unpartitioned')
+    )
+    op.execute('INSERT INTO audit_logs SELECT id, action, entity_type, entity_id, detail, created_at, updated_at FROM audit_logs_partitioned')
+    op.execute('DROP TABLE audit_logs_partitioned CASCADE')
+    op.execute('ALTER TABLE audit_logs RENAME CONSTRAINT audit_logs_pkey_unpartitioned TO audit_logs_pkey')
@@ -0,0 +1,35 @@
+"""embedding partial hnsw
+
+Revision ID: a3f8c6e1d047
+Revises: 0b7e3a9c5d14
+Create Date: 2026-10-19 19:36:04.518392
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = 'a3f8c6e1d047'
+down_revision: Union[str, None] = '0b7e3a9c5d14'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+ENTITY_TYPES = ('place', 'note', 'source')
+
+
+def upgrade() -> None:
+    # 검색을 막지 않도록 CONCURRENTLY로 타입별 인덱스를 먼저 만든 뒤 공용 인덱스를 지운다
+    with op.get_context().autocommit_block():
+        for entity_type in ENTITY_TYPES:
+            op.execute(f'DROP INDEX CONCURRENTLY IF EXISTS idx_embeddings_vector_{entity_type}')
+            op.create_index(f'idx_embeddings_vector_{entity_type}', 'embeddings', ['vector'], unique=False, postgresql_using='hnsw', postgresql_with={'m': 16, 'ef_construction': 64}, postgresql_ops={'vector': 'vector_cosine_ops'}, postgresql_where=sa.text(f"entity_type = '{entity_type}'"), postgresql_concurrently=True)
+        op.drop_index('idx_embeddings_vector', table_name='embeddings', postgresql_concurrently=True)
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.execute('DROP INDEX CONCURRENTLY IF EXISTS idx_embeddings_vector')
+        op.create_index('idx_embeddings_vector', 'embeddings', ['vector'], unique=False, postgresql_using='hnsw', postgresql_with={'m': 16, 'ef_construction': 64}, postgresql_ops={'vector': 'vector_cosine_ops'}, postgresql_concurrently=True)
+        for entity_type in ENTITY_TYPES:
+            op.drop_index(f'idx_embeddings_vector_{entity_type}', table_name='embeddings', postgresql_concurrently=True)
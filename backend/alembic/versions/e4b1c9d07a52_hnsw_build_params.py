@@ -0,0 +1,34 @@
+"""hnsw build params
+
+Revision ID: e4b1c9d07a52
+Revises: c7a9e2f41b68
+Create Date: 2026-10-19 17:22:48.604117
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = 'e4b1c9d07a52'
+down_revision: Union[str, None] = 'c7a9e2f41b68'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def _rebuild(**build_params) -> None:
+    # 검색을 막지 않도록 새 인덱스를 CONCURRENTLY로 만든 뒤 교체한다
+    with op.get_context().autocommit_block():
+        op.execute('DROP INDEX CONCURRENTLY IF EXISTS idx_embeddings_vector_rebuild')
+        op.create_index('idx_embeddings_vector_rebuild', 'embeddings', ['vector'], unique=False, postgresql_using='hnsw', postgresql_with=build_params, postgresql_ops={'vector': 'vector_cosine_ops'}, postgresql_concurrently=True)
+        op.drop_index('idx_embeddings_vector', table_name='embeddings', postgresql_concurrently=True)
+    op.execute('ALTER INDEX idx_embeddings_vector_rebuild RENAME TO idx_embeddings_vector')
+
+
+def upgrade() -> None:
+    # 기본값과 같지만 빌드 파라미터를 명시해 이후 튜닝(scripts.rebuild_vector_index)의 기준으로 삼는다
+    _rebuild(m=16, ef_construction=64)
+
+
+def downgrade() -> None:
+    _rebuild()
@@ -0,0 +1,168 @@
+"""Fast JSON responses and conditional-GET helpers for large schema payloads."""
+
+from __future__ import annotations
+
+import hashlib
+import re
+from collections.abc import Mapping, Sequence
+from functools import cache
+from typing import Any
+
+from fastapi import Request, Response
+from pydantic import TypeAdapter
+from starlette.middleware.gzip import GZipMiddleware
+from starlette.types import ASGIApp, Receive, Scope, Send
+
+
+@cache
+def type_adapter(annotation: Any) -> TypeAdapter[Any]:
+    """Return the process-wide TypeAdapter for a schema type (built once per type)."""
+    return TypeAdapter(annotation)
+
+
+class ModelResponse(Response):
+    """JSON response serialized straight from pydantic objects by pydantic-core.
+
+    Returning a Response from an endpoint makes FastAPI skip its own pass over
+    ``response_model`` (dump → re-validate → jsonable_encoder → json.dumps),
+    so the already-validated schema is encoded exactly once. Keep
+    ``response_model`` on the route for the OpenAPI schema.
+
+    Args:
+        content: Schema instance (or list of instances) to encode.
+        annotation: Type to serialize as. Defaults to ``type(content)``; pass it
+            for containers such as ``list[PlaceBrief]``.
+        status_code: HTTP status code.
+        headers: Extra response headers.
+    """
+
+    media_type = "application/json"
+
+    def __init__(
+        self,
+        content: Any,
+        annotation: Any = None,
+        status_code: int = 200,
+        headers: Mapping[str, str] | None = None,
+    ) -> None:
+        self.annotation = annotation if annotation is not None else type(content)
+        super().__init__(content, status_code=status_code, headers=headers)
+
+    @classmethod
+    def validate(
+        cls,
+        annotation: Any,
+        data: Any,
+        status_code: int = 200,
+        headers: Mapping[str, str] | None = None,
+    ) -> ModelResponse:
+        """Validate ORM rows into ``annotation`` in a single pydantic-core call and respond.
+
+        Cheaper than calling ``model_validate`` once per row in Python when
+        building a page of results.
+        """
+        content = type_adapter(annotation).validate_python(data, from_attributes=True)
+        return cls(content, annotation, status_code=status_code, headers=headers)
+
+    def render(self, content: Any) -> bytes:
+        return type_adapter(self.annotation).dump_json(content)
+
+
+def weak_etag(version: Any) -> str:
+    """Weak ETag for a hashable version fingerprint (stable across processes)."""
+    digest = hashlib.blake2b(repr(version).encode("utf-8"), digest_size=12).hexdigest()
+    return f'W/"{digest}"'
+
+
+def not_modified(request: Request, etag: str) -> Response | None:
+    """Return a 304 response when ``If-None-Match`` matches ``etag`` (weak comparison), else None."""
+    header = request.headers.get("if-none-match")
+    if not header:
+        return None
+    opaque = etag.removeprefix("W/")
+    for candidate in header.split(","):
+        candidate = candidate.strip()
+        if candidate == "*" or candidate.removeprefix("W/") == opaque:
+            return Response(status_code=304, headers=conditional_headers(etag))
+    return None
+
+
+def conditional_headers(etag: str) -> dict[str, str]:
+    """Headers that let clients cache a response but revalidate it on every use."""
+    return {"ETag": etag, "Cache-Control": "private, no-cache"}
+
+
+class RangeNotSatisfiableError(ValueError):
+    """The requested byte range lies outside the representation."""
+
+
+def byte_range(header: str | None, size: int) -> tuple[int, int] | None:
+    """Parse a single-range ``Range: bytes=...`` header into an inclusive (start, end).
+
+    Returns None when the header is absent, malformed, not in bytes, or asks
+    for several ranges; the caller then serves the whole representation, as
+    RFC 9110 allows.
+
+    Raises:
+        RangeNotSatisfiableError: No requested byte exists in ``size`` bytes.
+    """
+    if not header:
+        return None
+    unit, _, spec = header.partition("=")
+    if unit.strip().lower() != "bytes" or "," in spec:
+        return None
+    first, dash, last = (part.strip() for part in spec.partition("-"))
+    if not dash or not (first or last) or not all(part.isdigit() for part in (first, last) if part):
+        return None
+    if not first:
+        # 접미 범위: 마지막 N바이트
+        length = int(last)
+        if length == 0 or size == 0:
+            raise RangeNotSatisfiableError(header)
+        return max(size - length, 0), size - 1
+    start = int(first)
+    end = min(int(last), size - 1) if last else size - 1
+    if last and int(last) < start:
+        return None
+    if start >= size:
+        raise RangeNotSatisfiableError(header)
+    return start, end
+
+
+def accepts_encoding(request: Request, coding: str) -> bool:
+    """Whether ``Accept-Encoding`` allows ``coding`` (with a non-zero q-value)."""
+    for part in request.headers.get("accept-encoding", "").split(","):
+        name, _, params = part.partition(";")
+        if name.strip().lower() != coding:
+            continue
+        params = params.strip().replace(" ", "")
+        if not params.startswith("q="):
+            return True
+        try:
+            return float(params[2:]) > 0
+        except ValueError:
+            return False
+    return False
+
+
+class SelectiveGZipMiddleware(GZipMiddleware):
+    """``GZipMiddleware`` that leaves routes negotiating their own encoding alone.
+
+    Responses of paths matching ``exclude_paths`` pass through untouched, so
+    byte ranges and per-encoding strong ETags keep describing the bytes sent.
+
+    Args:
+        app: Wrapped ASGI app.
+        exclude_paths: Regular expressions matched against the full request path.
+        **options: ``GZipMiddleware`` options (``minimum_size``, ``compresslevel``, ...).
+    """
+
+    def __init__(self, app: ASGIApp, *, exclude_paths: Sequence[str] = (), **options: Any) -> None:
+        super().__init__(app, **options)
+        self.exclude_paths = [re.compile(pattern) for pattern in exclude_paths]
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] == "http" and any(pattern.fullmatch(scope["path"]) for pattern in self.exclude_paths):
+            await self.app(scope, receive, send)
+            return
+        await super().__call__(scope, receive, send)
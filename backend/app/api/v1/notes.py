@@ -4,13 +4,15 @@ from __future__ import annotations
 
 import uuid
 
-from fastapi import APIRouter, Depends, HTTPException, Response, status
-from sqlalchemy import select
+from fastapi import APIRouter, Depends, HTTPException, Query, Response, status
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.api.responses import ModelResponse
 from app.deps import get_db
 from app.models.note import Note
+from app.schemas.common import PaginatedResponse
 from app.schemas.note import NoteCreate, NoteResponse, NoteUpdate
+from app.services import outbox_service, place_service
 
 router = APIRouter(prefix="/notes", tags=["notes"])
 
@@ -20,17 +22,23 @@ async def create_note(payload: NoteCreate, db: AsyncSession = Depends(get_db)) -
     """Create note."""
     note = Note(**payload.model_dump())
     db.add(note)
-    await db.commit()
+    await db.flush()
+    outbox_service.record_change(db, "note", "insert", note.place_id, note.id)
+    await outbox_service.commit(db)
     await db.refresh(note)
     return NoteResponse.model_validate(note)
 
 
-@router.get("", response_model=list[NoteResponse])
-async def list_notes(place_id: uuid.UUID, db: AsyncSession = Depends(get_db)) -> list[NoteResponse]:
-    """List notes by place."""
-    stmt = select(Note).where(Note.place_id == place_id).order_by(Note.created_at.desc(), Note.id.desc())
-    rows = (await db.execute(stmt)).scalars().all()
-    return [NoteResponse.model_validate(row) for row in rows]
+@router.get("", response_model=PaginatedResponse[NoteResponse])
+async def list_notes(
+    place_id: uuid.UUID,
+    cursor: str | None = Query(default=None),
+    limit: int = Query(default=20, ge=1, le=100),
+    db: AsyncSession = Depends(get_db),
+) -> ModelResponse:
+    """List notes for a place with cursor pagination."""
+    rows, next_cursor = await place_service.list_children(db, Note, place_id, cursor=cursor, limit=limit)
+    return ModelResponse.validate(PaginatedResponse[NoteResponse], {"items": rows, "next_cursor": next_cursor})
 
 
 @router.patch("/{note_id}", response_model=NoteResponse)
@@ -41,7 +49,8 @@ async def update_note(note_id: uuid.UUID, payload: NoteUpdate, db: AsyncSession
         raise HTTPException(status_code=404, detail="Note not found")
 
     note.content = payload.content
-    await db.commit()
+    outbox_service.record_change(db, "note", "update", note.place_id, note.id)
+    await outbox_service.commit(db)
     await db.refresh(note)
     return NoteResponse.model_validate(note)
 
@@ -54,5 +63,6 @@ async def delete_note(note_id: uuid.UUID, db: AsyncSession = Depends(get_db)) ->
         raise HTTPException(status_code=404, detail="Note not found")
 
     await db.delete(note)
-    await db.commit()
+    outbox_service.record_change(db, "note", "delete", note.place_id, note.id)
+    await outbox_service.commit(db)
     return Response(status_code=status.HTTP_204_NO_CONTENT)
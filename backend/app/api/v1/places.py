@@ -3,13 +3,18 @@
 from __future__ import annotations
 
 import uuid
+from typing import Literal
 
-from fastapi import APIRouter, Depends, HTTPException, Query, Response, status
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response, status
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.api.responses import ModelResponse, conditional_headers, not_modified, weak_etag
 from app.deps import get_db
 from app.schemas.common import PaginatedResponse
+from app.schemas.enrichment import EnrichmentResponse
 from app.schemas.place import (
+    BulkDeleteRequest,
+    BulkDeleteResponse,
     DuplicateCandidate,
     DuplicateCheckRequest,
     MergeRequest,
@@ -20,11 +25,49 @@ from app.schemas.place import (
     PlaceResponse,
     PlaceUpdate,
 )
-from app.services import dedup_service, place_service
+from app.schemas.search import KeywordSearchHit, PlaceFacets, SearchFilters
+from app.services import dedup_service, enrichment_service, facet_service, place_service, search_document_service
 
 router = APIRouter(prefix="/places", tags=["places"])
 
 
+def search_filters(
+    parking: bool | None = Query(default=None),
+    reservation: str | None = Query(default=None),
+    mood: list[str] | None = Query(default=None),
+    situations: list[str] | None = Query(default=None),
+    companions: list[str] | None = Query(default=None),
+    category_primary: str | None = Query(default=None),
+    price_range: str | None = Query(default=None),
+    tags: list[str] | None = Query(default=None),
+    is_favorite: bool | None = Query(default=None),
+    min_rating: int | None = Query(default=None, ge=1, le=5),
+    max_distance_km: float | None = Query(default=None, gt=0),
+    lat: float | None = Query(default=None, ge=-90, le=90),
+    lng: float | None = Query(default=None, ge=-180, le=180),
+    ontology_nodes: list[uuid.UUID] | None = Query(default=None),
+) -> SearchFilters:
+    """PRD filter object from query parameters (repeat a list parameter for several values)."""
+    if max_distance_km is not None and (lat is None or lng is None):
+        raise HTTPException(status_code=400, detail="max_distance_km requires lat and lng")
+    return SearchFilters(
+        parking=parking,
+        reservation=reservation,
+        mood=mood,
+        situations=situations,
+        companions=companions,
+        category_primary=category_primary,
+        price_range=price_range,
+        tags=tags,
+        is_favorite=is_favorite,
+        min_rating=min_rating,
+        max_distance_km=max_distance_km,
+        lat=lat,
+        lng=lng,
+        ontology_nodes=ontology_nodes,
+    )
+
+
 @router.post("", response_model=PlaceCreateResponse, status_code=status.HTTP_201_CREATED)
 async def create_place(payload: PlaceCreate, db: AsyncSession = Depends(get_db)) -> PlaceCreateResponse:
     """Create a place and return duplicate candidates."""
@@ -44,25 +87,36 @@ async def create_place(payload: PlaceCreate, db: AsyncSession = Depends(get_db))
 
 @router.get("", response_model=PaginatedResponse[PlaceBrief])
 async def list_places(
+    request: Request,
     cursor: str | None = Query(default=None),
     limit: int = Query(default=20, ge=1, le=100),
-    category_primary: str | None = Query(default=None),
-    is_favorite: bool | None = Query(default=None),
+    sort: Literal["created", "most_visited", "recently_visited"] = Query(default="created"),
+    filters: SearchFilters = Depends(search_filters),
     db: AsyncSession = Depends(get_db),
-) -> PaginatedResponse[PlaceBrief]:
-    """List places with cursor pagination."""
+) -> Response:
+    """List places with cursor pagination and the PRD filters.
+
+    Sends a weak ETag; a matching ``If-None-Match`` gets 304 without loading places.
+    """
+    total = await place_service.count_places(db, filters, sort)
+    version = await place_service.list_version(db, cursor=cursor, limit=limit, filters=filters, sort=sort)
+    etag = weak_etag(("places", total, version))
+    if (cached := not_modified(request, etag)) is not None:
+        return cached
+
     items, next_cursor, total = await place_service.list_places(
         db,
         cursor=cursor,
         limit=limit,
-        category_primary=category_primary,
-        is_favorite=is_favorite,
-    )
-    return PaginatedResponse[PlaceBrief](
-        items=[PlaceBrief.model_validate(item) for item in items],
-        next_cursor=next_cursor,
+        filters=filters,
+        sort=sort,
         total=total,
     )
+    return ModelResponse.validate(
+        PaginatedResponse[PlaceBrief],
+        {"items": items, "next_cursor": next_cursor, "total": total},
+        headers=conditional_headers(etag),
+    )
 
 
 @router.post("/check-duplicates", response_model=list[DuplicateCandidate])
@@ -80,13 +134,66 @@ async def check_duplicates(
     )
 
 
+@router.get("/search", response_model=list[KeywordSearchHit])
+async def keyword_search(
+    q: str = Query(min_length=1, max_length=200),
+    limit: int = Query(default=20, ge=1, le=100),
+    filters: SearchFilters = Depends(search_filters),
+    db: AsyncSession = Depends(get_db),
+) -> ModelResponse:
+    """Keyword search over place names, tags, mood/situations, sources and notes, with the PRD filters."""
+    try:
+        hits = await search_document_service.keyword_search(db, q, limit, filters)
+    except ValueError as exc:
+        raise HTTPException(status_code=400, detail=str(exc)) from exc
+    return ModelResponse.validate(list[KeywordSearchHit], hits)
+
+
+@router.get("/facets", response_model=PlaceFacets)
+async def place_facets(
+    filters: SearchFilters = Depends(search_filters),
+    db: AsyncSession = Depends(get_db),
+) -> ModelResponse:
+    """Counts per category, region, price range, mood value and tag for the places matching the filters."""
+    return ModelResponse(await facet_service.place_facets(db, filters))
+
+
+@router.post("/bulk-delete", response_model=BulkDeleteResponse)
+async def bulk_delete_places(payload: BulkDeleteRequest, db: AsyncSession = Depends(get_db)) -> BulkDeleteResponse:
+    """Delete many places (and everything attached to them) in one statement."""
+    deleted = await place_service.delete_places(db, payload.place_ids)
+    removed = set(deleted)
+    not_found = [place_id for place_id in dict.fromkeys(payload.place_ids) if place_id not in removed]
+    return BulkDeleteResponse(deleted=deleted, not_found=not_found)
+
+
 @router.get("/{place_id}", response_model=PlaceDetail)
-async def get_place(place_id: uuid.UUID, db: AsyncSession = Depends(get_db)) -> PlaceDetail:
-    """Get place detail."""
-    place = await place_service.get_place(db, place_id)
-    if place is None:
+async def get_place(place_id: uuid.UUID, request: Request, db: AsyncSession = Depends(get_db)) -> Response:
+    """Get place detail.
+
+    Sends a weak ETag; a matching ``If-None-Match`` gets 304 without loading the place.
+    The body comes from the in-process detail cache when it is still current.
+    """
+    version = await place_service.detail_version(db, place_id)
+    if version is None:
+        raise HTTPException(status_code=404, detail="Place not found")
+    etag = weak_etag(("place", version))
+    if (cached := not_modified(request, etag)) is not None:
+        return cached
+
+    payload = await place_service.get_place_detail_json(db, place_id, version)
+    if payload is None:
         raise HTTPException(status_code=404, detail="Place not found")
-    return PlaceDetail.model_validate(place)
+    return Response(payload, media_type="application/json", headers=conditional_headers(etag))
+
+
+@router.get("/{place_id}/enrich", response_model=EnrichmentResponse)
+async def enrich_place(place_id: uuid.UUID, db: AsyncSession = Depends(get_db)) -> EnrichmentResponse:
+    """Look the place up at external providers at request time (not stored)."""
+    enriched = await enrichment_service.enrich_place(db, place_id)
+    if enriched is None:
+        raise HTTPException(status_code=404, detail="Place not found")
+    return enriched
 
 
 @router.patch("/{place_id}", response_model=PlaceResponse)
@@ -108,7 +215,7 @@ async def delete_place(place_id: uuid.UUID, db: AsyncSession = Depends(get_db))
 
 
 @router.post("/{place_id}/merge", response_model=PlaceDetail)
-async def merge_place(place_id: uuid.UUID, payload: MergeRequest, db: AsyncSession = Depends(get_db)) -> PlaceDetail:
+async def merge_place(place_id: uuid.UUID, payload: MergeRequest, db: AsyncSession = Depends(get_db)) -> ModelResponse:
     """Merge two places into place_id."""
     try:
         merged = await dedup_service.merge_places(db, keep_id=place_id, merge_id=payload.merge_with)
@@ -117,4 +224,7 @@ async def merge_place(place_id: uuid.UUID, payload: MergeRequest, db: AsyncSessi
 
     if merged is None:
         raise HTTPException(status_code=404, detail="Place not found")
-    return PlaceDetail.model_validate(merged)
+    detail = await place_service.get_place_detail(db, merged.id)
+    if detail is None:
+        raise HTTPException(status_code=404, detail="Place not found")
+    return ModelResponse(detail)
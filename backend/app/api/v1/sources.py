@@ -2,43 +2,32 @@
 
 from __future__ import annotations
 
-import base64
 import uuid
-from datetime import UTC, datetime
 
-from fastapi import APIRouter, Depends, HTTPException, Query, Response, status
-from sqlalchemy import and_, or_, select
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response, status
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.api.responses import (
+    ModelResponse,
+    RangeNotSatisfiableError,
+    accepts_encoding,
+    byte_range,
+    conditional_headers,
+    not_modified,
+)
 from app.deps import get_db
 from app.models.source import Source
 from app.schemas.common import PaginatedResponse
 from app.schemas.source import SourceCreate, SourceResponse
+from app.services import place_service, source_service
 
 router = APIRouter(prefix="/sources", tags=["sources"])
 
 
-def _encode_cursor(created_at: datetime, source_id: uuid.UUID) -> str:
-    raw = f"{created_at.isoformat()}|{source_id}"
-    return base64.urlsafe_b64encode(raw.encode("utf-8")).decode("utf-8")
-
-
-def _decode_cursor(cursor: str) -> tuple[datetime, uuid.UUID]:
-    decoded = base64.urlsafe_b64decode(cursor.encode("utf-8")).decode("utf-8")
-    created_at_str, source_id_str = decoded.split("|", 1)
-    created_at = datetime.fromisoformat(created_at_str)
-    if created_at.tzinfo is None:
-        created_at = created_at.replace(tzinfo=UTC)
-    return created_at, uuid.UUID(source_id_str)
-
-
 @router.post("", response_model=SourceResponse, status_code=status.HTTP_201_CREATED)
 async def create_source(payload: SourceCreate, db: AsyncSession = Depends(get_db)) -> SourceResponse:
     """Create source entry."""
-    source = Source(**payload.model_dump())
-    db.add(source)
-    await db.commit()
-    await db.refresh(source)
+    source = await source_service.create_source(db, payload)
     return SourceResponse.model_validate(source)
 
 
@@ -48,40 +37,60 @@ async def list_sources(
     cursor: str | None = Query(default=None),
     limit: int = Query(default=20, ge=1, le=100),
     db: AsyncSession = Depends(get_db),
-) -> PaginatedResponse[SourceResponse]:
+) -> ModelResponse:
     """List sources for a place with cursor pagination."""
-    stmt = select(Source).where(Source.place_id == place_id)
-    if cursor:
-        cursor_created_at, cursor_id = _decode_cursor(cursor)
-        stmt = stmt.where(
-            or_(
-                Source.created_at < cursor_created_at,
-                and_(Source.created_at == cursor_created_at, Source.id < cursor_id),
-            )
-        )
-
-    stmt = stmt.order_by(Source.created_at.desc(), Source.id.desc()).limit(limit + 1)
-    rows = (await db.execute(stmt)).scalars().all()
-
-    next_cursor = None
-    if len(rows) > limit:
-        last = rows[limit - 1]
-        next_cursor = _encode_cursor(last.created_at, last.id)
-        rows = rows[:limit]
-
-    return PaginatedResponse[SourceResponse](
-        items=[SourceResponse.model_validate(row) for row in rows],
-        next_cursor=next_cursor,
-        total=None,
-    )
+    rows, next_cursor = await place_service.list_children(db, Source, place_id, cursor=cursor, limit=limit)
+    return ModelResponse.validate(PaginatedResponse[SourceResponse], {"items": rows, "next_cursor": next_cursor})
 
 
 @router.delete("/{source_id}", status_code=status.HTTP_204_NO_CONTENT)
 async def delete_source(source_id: uuid.UUID, db: AsyncSession = Depends(get_db)) -> Response:
     """Delete source."""
-    source = await db.get(Source, source_id)
-    if source is None:
+    if not await source_service.delete_source(db, source_id):
         raise HTTPException(status_code=404, detail="Source not found")
-    await db.delete(source)
-    await db.commit()
     return Response(status_code=status.HTTP_204_NO_CONTENT)
+
+
+@router.get(
+    "/{source_id}/raw",
+    response_class=Response,
+    responses={200: {"content": {"text/plain": {}}}, 206: {"description": "Partial content"}},
+)
+async def get_source_raw(source_id: uuid.UUID, request: Request, db: AsyncSession = Depends(get_db)) -> Response:
+    """Raw source text, with single byte-range and conditional GET support."""
+    blob = await source_service.get_raw_blob(db, source_id)
+    if blob is None:
+        raise HTTPException(status_code=404, detail="Raw text not found")
+
+    etag = f'"{blob.content_hash}"'
+    requested = request.headers.get("range")
+    if request.headers.get("if-range", etag) != etag:
+        requested = None
+    deflated = requested is None and accepts_encoding(request, "deflate")
+    if deflated:
+        # 인코딩이 다른 표현은 다른 strong ETag를 가져야 한다
+        etag = f'"{blob.content_hash}-deflate"'
+    headers = {**conditional_headers(etag), "Accept-Ranges": "bytes", "Vary": "Accept-Encoding"}
+    if (cached := not_modified(request, etag)) is not None:
+        return cached
+
+    if deflated:
+        # 저장된 zlib 스트림이 곧 HTTP deflate 인코딩이므로 압축을 풀지 않고 그대로 보낸다
+        return Response(blob.data, media_type="text/plain", headers={**headers, "Content-Encoding": "deflate"})
+
+    try:
+        selected = byte_range(requested, blob.size)
+    except RangeNotSatisfiableError:
+        return Response(
+            status_code=status.HTTP_416_RANGE_NOT_SATISFIABLE, headers={"Content-Range": f"bytes */{blob.size}"}
+        )
+    data = source_service.decompress(blob)
+    if selected is None:
+        return Response(data, media_type="text/plain", headers=headers)
+    start, end = selected
+    return Response(
+        data[start : end + 1],
+        status_code=status.HTTP_206_PARTIAL_CONTENT,
+        media_type="text/plain",
+        headers={**headers, "Content-Range": f"bytes {start}-{end}/{blob.size}"},
+    )
@@ -10,6 +10,7 @@ from sqlalchemy.ext.asyncio import AsyncSession
 from app.deps import get_db
 from app.models.tag import Tag
 from app.schemas.tag import TagCreate, TagResponse
+from app.services import outbox_service
 
 router = APIRouter(prefix="/tags", tags=["tags"])
 
@@ -20,7 +21,9 @@ async def create_tag(payload: TagCreate, db: AsyncSession = Depends(get_db)) ->
     tag = Tag(name=payload.name.strip(), type=payload.type)
     db.add(tag)
     try:
-        await db.commit()
+        await db.flush()
+        outbox_service.record_change(db, "tag", "insert", None, tag.id, {"name": tag.name})
+        await outbox_service.commit(db)
     except IntegrityError as exc:
         await db.rollback()
         raise HTTPException(status_code=409, detail="Tag already exists") from exc
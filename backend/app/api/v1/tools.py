@@ -0,0 +1,60 @@
+"""Agent tool API endpoints."""
+
+from __future__ import annotations
+
+from fastapi import APIRouter, Depends, HTTPException
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.deps import get_db
+from app.schemas.search import ParsedQuery, ParseQueryRequest, QueryParserStats
+from app.schemas.tool import (
+    BuildComparisonTableRequest,
+    ComparisonTableResponse,
+    DraftItineraryRequest,
+    DraftItineraryResponse,
+)
+from app.services import comparison_service, itinerary_service, query_parser_service
+
+router = APIRouter(prefix="/tools", tags=["tools"])
+
+
+@router.post("/draft_itinerary", response_model=DraftItineraryResponse)
+async def draft_itinerary(
+    payload: DraftItineraryRequest,
+    db: AsyncSession = Depends(get_db),
+) -> DraftItineraryResponse:
+    """Order places into a route with travel-time estimates."""
+    try:
+        return await itinerary_service.draft_itinerary(db, payload.place_ids, payload.start_location)
+    except LookupError as exc:
+        raise HTTPException(status_code=404, detail=str(exc)) from exc
+
+
+@router.post("/build_comparison_table", response_model=ComparisonTableResponse)
+async def build_comparison_table(
+    payload: BuildComparisonTableRequest,
+    db: AsyncSession = Depends(get_db),
+) -> ComparisonTableResponse:
+    """Render a Markdown comparison table for candidate places."""
+    try:
+        markdown, columns = await comparison_service.build_comparison_table(db, payload.place_ids, payload.columns)
+    except ValueError as exc:
+        raise HTTPException(status_code=400, detail=str(exc)) from exc
+    except LookupError as exc:
+        raise HTTPException(status_code=404, detail=str(exc)) from exc
+    return ComparisonTableResponse(markdown=markdown, columns=columns)
+
+
+@router.post("/parse_query", response_model=ParsedQuery)
+async def parse_query(
+    payload: ParseQueryRequest,
+    db: AsyncSession = Depends(get_db),
+) -> ParsedQuery:
+    """Split a natural-language query into search text and filters."""
+    return await query_parser_service.parse_query(db, payload.query)
+
+
+@router.get("/parse_query/stats", response_model=QueryParserStats)
+async def parse_query_stats() -> QueryParserStats:
+    """Rule-based fast-path hit rate since process start."""
+    return query_parser_service.parser_stats()
@@ -4,13 +4,15 @@ from __future__ import annotations
 
 import uuid
 
-from fastapi import APIRouter, Depends, status
-from sqlalchemy import select
+from fastapi import APIRouter, Depends, HTTPException, Query, Response, status
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.api.responses import ModelResponse
 from app.deps import get_db
 from app.models.visit import Visit
+from app.schemas.common import PaginatedResponse
 from app.schemas.visit import VisitCreate, VisitResponse
+from app.services import outbox_service, place_service, visit_stats_service
 
 router = APIRouter(prefix="/visits", tags=["visits"])
 
@@ -20,14 +22,35 @@ async def create_visit(payload: VisitCreate, db: AsyncSession = Depends(get_db))
     """Create visit record."""
     visit = Visit(**payload.model_dump())
     db.add(visit)
-    await db.commit()
+    await db.flush()
+    await visit_stats_service.record_visit(db, visit)
+    outbox_service.record_change(db, "visit", "insert", visit.place_id, visit.id)
+    await outbox_service.commit(db)
     await db.refresh(visit)
     return VisitResponse.model_validate(visit)
 
 
-@router.get("", response_model=list[VisitResponse])
-async def list_visits(place_id: uuid.UUID, db: AsyncSession = Depends(get_db)) -> list[VisitResponse]:
-    """List visits by place."""
-    stmt = select(Visit).where(Visit.place_id == place_id).order_by(Visit.visited_at.desc(), Visit.id.desc())
-    rows = (await db.execute(stmt)).scalars().all()
-    return [VisitResponse.model_validate(row) for row in rows]
+@router.get("", response_model=PaginatedResponse[VisitResponse])
+async def list_visits(
+    place_id: uuid.UUID,
+    cursor: str | None = Query(default=None),
+    limit: int = Query(default=20, ge=1, le=100),
+    db: AsyncSession = Depends(get_db),
+) -> ModelResponse:
+    """List visits for a place with cursor pagination."""
+    rows, next_cursor = await place_service.list_children(db, Visit, place_id, cursor=cursor, limit=limit)
+    return ModelResponse.validate(PaginatedResponse[VisitResponse], {"items": rows, "next_cursor": next_cursor})
+
+
+@router.delete("/{visit_id}", status_code=status.HTTP_204_NO_CONTENT)
+async def delete_visit(visit_id: uuid.UUID, db: AsyncSession = Depends(get_db)) -> Response:
+    """Delete visit record."""
+    visit = await db.get(Visit, visit_id)
+    if visit is None:
+        raise HTTPException(status_code=404, detail="Visit not found")
+    await db.delete(visit)
+    await db.flush()
+    await visit_stats_service.forget_visit(db, visit)
+    outbox_service.record_change(db, "visit", "delete", visit.place_id, visit.id)
+    await outbox_service.commit(db)
+    return Response(status_code=status.HTTP_204_NO_CONTENT)
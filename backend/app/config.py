@@ -11,6 +11,7 @@ class Settings(BaseSettings):
 
     # 인증
     api_key: str = "dev-api-key"
+    cursor_secret: str = ""  # 페이지 커서 HMAC 키. 비어 있으면 api_key 사용
 
     # OpenAI
     openai_api_key: str = ""
@@ -24,6 +25,15 @@ class Settings(BaseSettings):
     # 기본 LLM Provider
     default_llm_provider: str = "gemini"  # "gemini" | "openai" | "anthropic"
 
+    # LLM 호출 제어
+    llm_timeout_seconds: float = 20.0
+    llm_max_concurrency: int = 4  # provider별 동시 호출 수
+    llm_hedge_after_seconds: float = 0.0  # 0이면 hedging 비활성
+    llm_hedge_provider: str = ""
+
+    # 검색 질의 파싱 — 룰 기반 커버리지가 이 값 미만이면 LLM으로 위임
+    query_parser_min_confidence: float = 0.6
+
     # 카카오
     kakao_rest_api_key: str = ""
 
@@ -36,6 +46,59 @@ class Settings(BaseSettings):
     # 구글
     google_places_api_key: str = ""
 
+    # 외부 보강 (런타임 조회 캐시)
+    enrichment_cache_ttl_seconds: int = 3600
+    enrichment_cache_maxsize: int = 1024
+
+    # 임베딩 — 재임베딩 작업은 배치 크기/간격으로 API 호출 속도를 제한
+    embedding_model: str = "text-embedding-3-small"
+    embedding_dimensions: int = 1536
+    reembed_batch_size: int = 64
+    reembed_interval_seconds: float = 0.2
+
+    # 벡터 검색 — 요청 종류별 hnsw.ef_search, 정확 재정렬 후보 수, 인덱스 빌드 파라미터·표현식
+    hnsw_ef_search_interactive: int = 40
+    hnsw_ef_search_agent: int = 100
+    hnsw_ef_search_batch: int = 200
+    vector_rerank: bool = False
+    vector_rerank_candidates: int = 200
+    hnsw_m: int = 16
+    hnsw_ef_construction: int = 64
+    # 인덱스 표현식: vector | halfvec (메모리 1/2) | bit (이진 양자화, 항상 재정렬) — rebuild_vector_index로 전환
+    vector_index_type: str = "vector"
+    # 후보 장소 제한 검색에서 이 수 이하면 HNSW 없이 후보 행만 정확 검색
+    vector_prefilter_exact_max: int = 2000
+
+    # 변경 이벤트 outbox — 커밋 시 NOTIFY로 다른 워커를 깨우고, 폴링은 놓친 알림에 대한 안전망
+    outbox_batch_size: int = 200
+    outbox_poll_interval_seconds: float = 1.0
+    outbox_retention_days: int = 7
+    outbox_listen: bool = True
+
+    # 장소 상세 응답 캐시 (프로세스 로컬, outbox 이벤트로 무효화)
+    place_detail_cache_maxsize: int = 1024
+    place_detail_cache_ttl_seconds: int = 600
+
+    # 패싯 집계 캐시 — (필터 해시, 데이터 버전)별 결과
+    facet_cache_maxsize: int = 256
+    facet_cache_ttl_seconds: int = 300
+
+    # 태그·온톨로지·mood·situation → 장소 비트맵 역색인 (프로세스 로컬, 시작 시 구축)
+    bitmap_index_enabled: bool = True
+    # 후보가 이보다 많으면 색인 대신 SQL 조건으로 거른다
+    bitmap_index_max_candidates: int = 10000
+
+    # 감사 로그 — 버퍼링 후 배치 INSERT, 월별 파티션 보존 기간
+    audit_batch_size: int = 500
+    audit_flush_interval_seconds: float = 2.0
+    audit_max_buffer: int = 10000
+    audit_partition_months_ahead: int = 2
+    audit_retention_months: int = 12
+
+    # 응답 압축 — 이 크기(bytes) 미만 응답은 압축하지 않음
+    gzip_minimum_size: int = 1024
+    gzip_compresslevel: int = 6
+
     # 비용 제어
     monthly_cost_limit_krw: int = 10000
 
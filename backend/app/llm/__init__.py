@@ -0,0 +1,6 @@
+"""LLM provider package."""
+
+from app.llm.base import BaseLLM, LLMCompletion, LLMError, LLMTimeoutError
+from app.llm.router import LLMRouter, get_llm_router
+
+__all__ = ["BaseLLM", "LLMCompletion", "LLMError", "LLMRouter", "LLMTimeoutError", "get_llm_router"]
@@ -0,0 +1,52 @@
+"""Anthropic Messages API provider."""
+
+from __future__ import annotations
+
+from typing import Any
+
+from app.config import settings
+from app.llm.base import BaseLLM, LLMCompletion
+from app.utils.http_client import get_http_client
+
+
+class AnthropicLLM(BaseLLM):
+    """Anthropic Claude over the shared HTTP pool."""
+
+    name = "anthropic"
+    input_krw_per_mtok = 4_200.0
+    output_krw_per_mtok = 21_000.0
+
+    def __init__(self, api_key: str | None = None, model: str = "claude-sonnet-4-20250514") -> None:
+        self.api_key = api_key if api_key is not None else settings.anthropic_api_key
+        self.model = model
+
+    async def complete(self, messages: list[dict[str, str]], **kwargs: Any) -> LLMCompletion:
+        client = get_http_client("anthropic", base_url="https://api.anthropic.com/v1")
+        system = "\n\n".join(m["content"] for m in messages if m["role"] == "system")
+        body: dict[str, Any] = {
+            "model": self.model,
+            "max_tokens": kwargs.get("max_tokens", 1024),
+            "messages": [m for m in messages if m["role"] != "system"],
+        }
+        if system:
+            body["system"] = system
+        if "temperature" in kwargs:
+            body["temperature"] = kwargs["temperature"]
+
+        response = await client.post(
+            "/messages",
+            json=body,
+            headers={"x-api-key": self.api_key, "anthropic-version": "2023-06-01"},
+        )
+        response.raise_for_status()
+        data = response.json()
+        usage = data.get("usage") or {}
+        tokens_in, tokens_out = usage.get("input_tokens"), usage.get("output_tokens")
+        return LLMCompletion(
+            text="".join(block.get("text", "") for block in data.get("content", []) if block.get("type") == "text"),
+            provider=self.name,
+            model=self.model,
+            tokens_in=tokens_in,
+            tokens_out=tokens_out,
+            cost_krw=self.estimate_cost_krw(tokens_in, tokens_out),
+        )
@@ -0,0 +1,134 @@
+"""LLM provider abstraction."""
+
+from __future__ import annotations
+
+import json
+import re
+from abc import ABC, abstractmethod
+from dataclasses import dataclass
+from typing import Any
+
+from pydantic import ValidationError
+
+from app.schemas.search import SearchIntent
+
+SEARCH_INTENT_PROMPT = """너는 장소 검색 질의를 구조화하는 파서야.
+사용자의 자연어 질의를 아래 JSON으로 변환해.
+
+{
+  "search_text": "벡터 검색에 사용할 핵심 텍스트",
+  "filters": {
+    "max_distance_km": number | null,
+    "parking": boolean | null,
+    "reservation": "available" | "required" | null,
+    "mood": string[] | null,
+    "situations": string[] | null,
+    "companions": string[] | null,
+    "category_primary": string | null,
+    "price_range": string | null,
+    "min_rating": number | null
+  }
+}
+
+모르는 필드는 null로 둬. 추측하지 마."""
+
+SUMMARIZE_PROMPT = "다음 근거 자료를 맥락에 맞게 한국어로 간결하게 요약해. 근거에 없는 내용은 추가하지 마."
+
+COMPARISON_PROMPT = "다음 장소 데이터를 비교하는 Markdown 표를 만들어. 데이터에 없는 값은 '-'로 표시해."
+
+_CODE_FENCE_PATTERN = re.compile(r"^```(?:json)?\s*|\s*```$")
+
+
+class LLMError(RuntimeError):
+    """Raised when no provider produced a completion."""
+
+
+class LLMTimeoutError(LLMError):
+    """Raised when a completion misses its deadline."""
+
+
+@dataclass(frozen=True)
+class LLMCompletion:
+    """Completion text plus usage metadata for cost accounting."""
+
+    text: str
+    provider: str
+    model: str
+    tokens_in: int | None = None
+    tokens_out: int | None = None
+    cost_krw: float | None = None
+
+
+class BaseLLM(ABC):
+    """Abstract LLM provider.
+
+    Subclasses implement ``complete``; the task-level helpers (search intent
+    parsing, summaries, comparisons) are shared on top of it.
+    """
+
+    name: str = "base"
+    model: str = ""
+    # 원화 기준 100만 토큰당 추정 단가
+    input_krw_per_mtok: float = 0.0
+    output_krw_per_mtok: float = 0.0
+
+    @abstractmethod
+    async def complete(self, messages: list[dict[str, str]], **kwargs: Any) -> LLMCompletion:
+        """Run a chat completion.
+
+        Args:
+            messages: Chat messages with ``role`` ("system" | "user" | "assistant") and ``content``.
+            **kwargs: Provider options such as ``temperature`` or ``max_tokens``.
+
+        Returns:
+            Completion with token usage when the provider reports it.
+        """
+
+    def estimate_cost_krw(self, tokens_in: int | None, tokens_out: int | None) -> float:
+        """Estimate KRW cost from token usage."""
+        return ((tokens_in or 0) * self.input_krw_per_mtok + (tokens_out or 0) * self.output_krw_per_mtok) / 1_000_000
+
+    async def chat(self, messages: list[dict[str, str]], **kwargs: Any) -> str:
+        """Run a chat completion and return only the text."""
+        return (await self.complete(messages, **kwargs)).text
+
+    async def parse_search_intent(self, query: str) -> SearchIntent:
+        """Parse a natural-language query into search text and filters.
+
+        Falls back to using the whole query as search text when the model
+        output is not valid JSON for ``SearchIntent``.
+        """
+        raw = await self.chat(
+            [{"role": "system", "content": SEARCH_INTENT_PROMPT}, {"role": "user", "content": query}],
+            temperature=0,
+            action="parse_intent",
+        )
+        try:
+            payload = json.loads(_CODE_FENCE_PATTERN.sub("", raw.strip()))
+            if not payload.get("search_text"):
+                payload["search_text"] = query
+            payload["filters"] = {k: v for k, v in (payload.get("filters") or {}).items() if v is not None}
+            return SearchIntent.model_validate(payload)
+        except (ValueError, AttributeError, ValidationError):
+            return SearchIntent(search_text=query)
+
+    async def summarize(self, texts: list[str], context: str) -> str:
+        """Summarize evidence texts for the given context."""
+        evidence = "\n".join(f"- {text}" for text in texts)
+        return await self.chat(
+            [
+                {"role": "system", "content": SUMMARIZE_PROMPT},
+                {"role": "user", "content": f"맥락: {context}\n\n근거:\n{evidence}"},
+            ],
+            action="summarize",
+        )
+
+    async def build_comparison(self, places: list[dict[str, Any]]) -> str:
+        """Build a Markdown comparison table from place dicts."""
+        return await self.chat(
+            [
+                {"role": "system", "content": COMPARISON_PROMPT},
+                {"role": "user", "content": json.dumps(places, ensure_ascii=False, default=str)},
+            ],
+            action="comparison",
+        )
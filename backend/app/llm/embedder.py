@@ -0,0 +1,90 @@
+"""Text embedding providers."""
+
+from __future__ import annotations
+
+import hashlib
+import math
+import re
+from abc import ABC, abstractmethod
+from collections.abc import Sequence
+from typing import Any
+
+from app.config import settings
+from app.utils.http_client import get_http_client
+
+_TOKEN_PATTERN = re.compile(r"\w+")
+
+
+class BaseEmbedder(ABC):
+    """Turns texts into fixed-size vectors of one embedding model."""
+
+    model: str
+    dimensions: int
+
+    @abstractmethod
+    async def embed(self, texts: Sequence[str]) -> list[list[float]]:
+        """Embed a batch of texts, preserving order."""
+
+
+class OpenAIEmbedder(BaseEmbedder):
+    """OpenAI Embeddings API over the shared HTTP pool."""
+
+    def __init__(self, model: str, dimensions: int, api_key: str | None = None) -> None:
+        self.model = model
+        self.dimensions = dimensions
+        self.api_key = api_key if api_key is not None else settings.openai_api_key
+
+    async def embed(self, texts: Sequence[str]) -> list[list[float]]:
+        if not texts:
+            return []
+        client = get_http_client("openai", base_url="https://api.openai.com/v1")
+        body: dict[str, Any] = {"model": self.model, "input": list(texts)}
+        if self.model.startswith("text-embedding-3"):
+            # 3세대 모델은 차원 축소를 지원한다
+            body["dimensions"] = self.dimensions
+        response = await client.post(
+            "/embeddings",
+            json=body,
+            headers={"Authorization": f"Bearer {self.api_key}"},
+        )
+        response.raise_for_status()
+        data = sorted(response.json()["data"], key=lambda item: item["index"])
+        return [item["embedding"] for item in data]
+
+
+class StubEmbedder(BaseEmbedder):
+    """Deterministic offline embedder (hashed bag of words) for tests and local runs.
+
+    Texts sharing words get similar vectors, so nearest-neighbour results are
+    meaningful enough to exercise search end to end.
+    """
+
+    def __init__(self, model: str = "stub-embedding", dimensions: int = 1536) -> None:
+        self.model = model
+        self.dimensions = dimensions
+        self.calls = 0
+
+    async def embed(self, texts: Sequence[str]) -> list[list[float]]:
+        self.calls += 1
+        return [self._vector(text) for text in texts]
+
+    def _vector(self, text: str) -> list[float]:
+        vector = [0.0] * self.dimensions
+        for token in _TOKEN_PATTERN.findall(text.lower()) or [""]:
+            digest = hashlib.blake2b(f"{self.model}:{token}".encode(), digest_size=8).digest()
+            value = int.from_bytes(digest, "big")
+            vector[value % self.dimensions] += 1.0 if value & (1 << 63) else -1.0
+        norm = math.sqrt(sum(x * x for x in vector)) or 1.0
+        return [x / norm for x in vector]
+
+
+def get_embedder(model: str | None = None, dimensions: int | None = None) -> BaseEmbedder:
+    """Build the embedder for ``model`` (defaults to the configured model).
+
+    Model names starting with ``stub`` use the offline :class:`StubEmbedder`.
+    """
+    model = model or settings.embedding_model
+    dimensions = dimensions or settings.embedding_dimensions
+    if model.startswith("stub"):
+        return StubEmbedder(model, dimensions)
+    return OpenAIEmbedder(model, dimensions)
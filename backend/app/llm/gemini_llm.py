@@ -0,0 +1,61 @@
+"""Google Gemini provider."""
+
+from __future__ import annotations
+
+from typing import Any
+
+from app.config import settings
+from app.llm.base import BaseLLM, LLMCompletion
+from app.utils.http_client import get_http_client
+
+
+class GeminiLLM(BaseLLM):
+    """Gemini generateContent over the shared HTTP pool."""
+
+    name = "gemini"
+    input_krw_per_mtok = 420.0
+    output_krw_per_mtok = 3_500.0
+
+    def __init__(self, api_key: str | None = None, model: str = "gemini-2.5-flash") -> None:
+        self.api_key = api_key if api_key is not None else settings.gemini_api_key
+        self.model = model
+
+    async def complete(self, messages: list[dict[str, str]], **kwargs: Any) -> LLMCompletion:
+        client = get_http_client("gemini", base_url="https://generativelanguage.googleapis.com/v1beta")
+        system = "\n\n".join(m["content"] for m in messages if m["role"] == "system")
+        body: dict[str, Any] = {
+            "contents": [
+                {"role": "model" if m["role"] == "assistant" else "user", "parts": [{"text": m["content"]}]}
+                for m in messages
+                if m["role"] != "system"
+            ],
+        }
+        if system:
+            body["systemInstruction"] = {"parts": [{"text": system}]}
+        generation_config = {
+            key: kwargs[name]
+            for name, key in (("temperature", "temperature"), ("max_tokens", "maxOutputTokens"))
+            if name in kwargs
+        }
+        if generation_config:
+            body["generationConfig"] = generation_config
+
+        response = await client.post(
+            f"/models/{self.model}:generateContent",
+            json=body,
+            headers={"x-goog-api-key": self.api_key},
+        )
+        response.raise_for_status()
+        data = response.json()
+        usage = data.get("usageMetadata") or {}
+        tokens_in, tokens_out = usage.get("promptTokenCount"), usage.get("candidatesTokenCount")
+        candidates = data.get("candidates") or [{}]
+        parts = (candidates[0].get("content") or {}).get("parts", [])
+        return LLMCompletion(
+            text="".join(part.get("text", "") for part in parts),
+            provider=self.name,
+            model=self.model,
+            tokens_in=tokens_in,
+            tokens_out=tokens_out,
+            cost_krw=self.estimate_cost_krw(tokens_in, tokens_out),
+        )
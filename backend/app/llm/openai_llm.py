@@ -0,0 +1,47 @@
+"""OpenAI chat completion provider."""
+
+from __future__ import annotations
+
+from typing import Any
+
+from app.config import settings
+from app.llm.base import BaseLLM, LLMCompletion
+from app.utils.http_client import get_http_client
+
+
+class OpenAILLM(BaseLLM):
+    """OpenAI Chat Completions over the shared HTTP pool."""
+
+    name = "openai"
+    input_krw_per_mtok = 210.0
+    output_krw_per_mtok = 840.0
+
+    def __init__(self, api_key: str | None = None, model: str = "gpt-4o-mini") -> None:
+        self.api_key = api_key if api_key is not None else settings.openai_api_key
+        self.model = model
+
+    async def complete(self, messages: list[dict[str, str]], **kwargs: Any) -> LLMCompletion:
+        client = get_http_client("openai", base_url="https://api.openai.com/v1")
+        body: dict[str, Any] = {"model": self.model, "messages": messages}
+        if "temperature" in kwargs:
+            body["temperature"] = kwargs["temperature"]
+        if "max_tokens" in kwargs:
+            body["max_tokens"] = kwargs["max_tokens"]
+
+        response = await client.post(
+            "/chat/completions",
+            json=body,
+            headers={"Authorization": f"Bearer {self.api_key}"},
+        )
+        response.raise_for_status()
+        data = response.json()
+        usage = data.get("usage") or {}
+        tokens_in, tokens_out = usage.get("prompt_tokens"), usage.get("completion_tokens")
+        return LLMCompletion(
+            text=data["choices"][0]["message"]["content"] or "",
+            provider=self.name,
+            model=self.model,
+            tokens_in=tokens_in,
+            tokens_out=tokens_out,
+            cost_krw=self.estimate_cost_krw(tokens_in, tokens_out),
+        )
@@ -0,0 +1,201 @@
+"""LLM provider selection with concurrency limits, deadlines and hedging."""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+from collections.abc import Awaitable, Callable
+from functools import lru_cache
+from typing import Any
+
+from app.config import settings
+from app.llm.base import BaseLLM, LLMCompletion, LLMError, LLMTimeoutError
+
+logger = logging.getLogger(__name__)
+
+CostLogger = Callable[[LLMCompletion, str], Awaitable[None]]
+
+
+async def log_completion_cost(completion: LLMCompletion, action: str) -> None:
+    """Record a completion in cost_logs using its own session."""
+    from app.deps import async_session_factory
+    from app.utils.cost_tracker import log_cost
+
+    async with async_session_factory() as db:
+        await log_cost(
+            db,
+            provider=f"{completion.provider}_llm",
+            action=action,
+            tokens_in=completion.tokens_in,
+            tokens_out=completion.tokens_out,
+            cost_krw=completion.cost_krw,
+        )
+
+
+def _build_provider(name: str) -> BaseLLM:
+    if name == "gemini":
+        from app.llm.gemini_llm import GeminiLLM
+
+        return GeminiLLM()
+    if name == "openai":
+        from app.llm.openai_llm import OpenAILLM
+
+        return OpenAILLM()
+    if name == "anthropic":
+        from app.llm.anthropic_llm import AnthropicLLM
+
+        return AnthropicLLM()
+    if name == "stub":
+        from app.llm.stub_llm import StubLLM
+
+        return StubLLM()
+    raise ValueError(f"Unknown LLM provider: {name}")
+
+
+class LLMRouter(BaseLLM):
+    """Routes completions to a provider under per-provider limits.
+
+    * Each provider has its own semaphore, so a slow upstream cannot starve the others.
+    * Every call runs against a deadline; waiting for a semaphore slot counts against it.
+    * When ``hedge_after`` is set and the primary has not answered in that many seconds
+      (or fails outright), the same request is sent to ``hedge_provider`` and the first
+      successful answer wins; the loser is cancelled.
+    * Each successful completion is accounted through ``cost_logger``.
+
+    Args:
+        providers: Pre-built providers by name. Missing names are built lazily.
+        default_provider: Provider used when a call does not name one.
+        max_concurrency: Concurrent in-flight calls allowed per provider.
+        timeout: Default deadline in seconds for a call, including hedged attempts.
+        hedge_after: Latency budget in seconds before hedging. 0 disables hedging.
+        hedge_provider: Provider to hedge to. Empty disables hedging.
+        cost_logger: Coroutine recording a completion's cost. Defaults to ``log_completion_cost``.
+    """
+
+    name = "router"
+    model = "router"
+
+    def __init__(
+        self,
+        providers: dict[str, BaseLLM] | None = None,
+        default_provider: str | None = None,
+        max_concurrency: int | None = None,
+        timeout: float | None = None,
+        hedge_after: float | None = None,
+        hedge_provider: str | None = None,
+        cost_logger: CostLogger | None = None,
+    ) -> None:
+        self._providers: dict[str, BaseLLM] = dict(providers or {})
+        self.default_provider = default_provider or settings.default_llm_provider
+        self.max_concurrency = max_concurrency or settings.llm_max_concurrency
+        self.timeout = timeout if timeout is not None else settings.llm_timeout_seconds
+        self.hedge_after = hedge_after if hedge_after is not None else settings.llm_hedge_after_seconds
+        self.hedge_provider = hedge_provider if hedge_provider is not None else settings.llm_hedge_provider
+        self._cost_logger = cost_logger or log_completion_cost
+        self._semaphores: dict[str, asyncio.Semaphore] = {}
+
+    def get_provider(self, provider: str | None = None) -> BaseLLM:
+        """Return the provider instance for a name (default provider if None)."""
+        name = provider or self.default_provider
+        if name not in self._providers:
+            self._providers[name] = _build_provider(name)
+        return self._providers[name]
+
+    def _semaphore(self, name: str) -> asyncio.Semaphore:
+        if name not in self._semaphores:
+            self._semaphores[name] = asyncio.Semaphore(self.max_concurrency)
+        return self._semaphores[name]
+
+    async def _attempt(
+        self,
+        name: str,
+        messages: list[dict[str, str]],
+        deadline: float,
+        kwargs: dict[str, Any],
+    ) -> LLMCompletion:
+        provider = self.get_provider(name)
+        async with asyncio.timeout_at(deadline), self._semaphore(name):
+            return await provider.complete(messages, **kwargs)
+
+    async def complete(
+        self,
+        messages: list[dict[str, str]],
+        *,
+        provider: str | None = None,
+        timeout: float | None = None,
+        hedge: bool = True,
+        action: str = "chat",
+        **kwargs: Any,
+    ) -> LLMCompletion:
+        """Run a completion with limits, deadline and optional hedging.
+
+        Args:
+            messages: Chat messages.
+            provider: Primary provider name. Defaults to ``default_provider``.
+            timeout: Deadline override in seconds.
+            hedge: Set False to disable hedging for this call.
+            action: Cost log action label.
+            **kwargs: Provider options forwarded to ``complete``.
+
+        Returns:
+            The first successful completion.
+
+        Raises:
+            LLMTimeoutError: If no attempt finished before the deadline.
+            LLMError: If every attempt failed.
+        """
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + (timeout if timeout is not None else self.timeout)
+        primary = provider or self.default_provider
+        hedging = hedge and self.hedge_after > 0 and self.hedge_provider and self.hedge_provider != primary
+        secondary = self.hedge_provider if hedging else None
+
+        tasks: dict[asyncio.Task[LLMCompletion], str] = {
+            asyncio.create_task(self._attempt(primary, messages, deadline, kwargs)): primary
+        }
+        errors: list[BaseException] = []
+        try:
+            while tasks:
+                wait_until = deadline
+                if secondary is not None:
+                    wait_until = min(deadline, loop.time() + self.hedge_after)
+                done, _ = await asyncio.wait(
+                    tasks, timeout=max(0.0, wait_until - loop.time()), return_when=asyncio.FIRST_COMPLETED
+                )
+
+                for task in done:
+                    name = tasks.pop(task)
+                    if task.exception() is None:
+                        completion = task.result()
+                        await self._account(completion, action)
+                        return completion
+                    errors.append(task.exception())  # type: ignore[arg-type]
+                    logger.warning("LLM provider %s failed: %r", name, task.exception())
+
+                if loop.time() >= deadline:
+                    break
+                # 지연(또는 실패) 시 두 번째 provider로 hedge
+                if secondary is not None and (not done or not tasks):
+                    logger.info("Hedging LLM request from %s to %s", primary, secondary)
+                    tasks[asyncio.create_task(self._attempt(secondary, messages, deadline, kwargs))] = secondary
+                    secondary = None
+        finally:
+            for task in tasks:
+                task.cancel()
+
+        if not errors or all(isinstance(error, TimeoutError) for error in errors):
+            raise LLMTimeoutError(f"LLM call to {primary} exceeded its deadline")
+        raise LLMError(f"All LLM providers failed: {errors[-1]!r}") from errors[-1]
+
+    async def _account(self, completion: LLMCompletion, action: str) -> None:
+        # 비용 기록 실패가 응답을 막지 않도록 예외를 삼킨다
+        try:
+            await self._cost_logger(completion, action)
+        except Exception:
+            logger.exception("Failed to record LLM cost for %s", completion.provider)
+
+
+@lru_cache(maxsize=1)
+def get_llm_router() -> LLMRouter:
+    """Process-wide router configured from settings."""
+    return LLMRouter()
@@ -0,0 +1,60 @@
+"""Offline stub provider for tests and local development."""
+
+from __future__ import annotations
+
+import asyncio
+from collections.abc import Callable
+from typing import Any
+
+from app.llm.base import BaseLLM, LLMCompletion
+
+
+class StubLLM(BaseLLM):
+    """Deterministic provider that never leaves the process.
+
+    Args:
+        name: Provider name reported in completions.
+        reply: Fixed reply text, or a callable building it from the messages.
+        latency: Seconds to sleep before answering, to exercise timeouts and hedging.
+        error: Exception raised instead of answering.
+    """
+
+    model = "stub"
+
+    def __init__(
+        self,
+        name: str = "stub",
+        reply: str | Callable[[list[dict[str, str]]], str] = "ok",
+        latency: float = 0.0,
+        error: Exception | None = None,
+    ) -> None:
+        self.name = name
+        self.reply = reply
+        self.latency = latency
+        self.error = error
+        self.calls = 0
+        self.in_flight = 0
+        self.max_in_flight = 0
+
+    async def complete(self, messages: list[dict[str, str]], **kwargs: Any) -> LLMCompletion:
+        self.calls += 1
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        try:
+            if self.latency:
+                await asyncio.sleep(self.latency)
+            if self.error is not None:
+                raise self.error
+            text = self.reply(messages) if callable(self.reply) else self.reply
+        finally:
+            self.in_flight -= 1
+
+        tokens_in = sum(len(m["content"].split()) for m in messages)
+        return LLMCompletion(
+            text=text,
+            provider=self.name,
+            model=self.model,
+            tokens_in=tokens_in,
+            tokens_out=len(text.split()),
+            cost_krw=0.0,
+        )
@@ -1,13 +1,42 @@
 """FastAPI 앱 엔트리포인트."""
 
-from fastapi import FastAPI
+import asyncio
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+
+from fastapi import FastAPI, Request
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import JSONResponse
 from sqlalchemy import text
 
+from app.api.responses import SelectiveGZipMiddleware
 from app.api.router import v1_router
+from app.config import settings
 from app.deps import engine
+from app.services import bitmap_index_service
+from app.services.audit_service import audit_sink
+from app.services.outbox_service import OutboxDispatcher
+from app.utils.http_client import close_http_clients
+from app.utils.pagination import InvalidCursorError
+
+
+@asynccontextmanager
+async def lifespan(_: FastAPI) -> AsyncIterator[None]:
+    """앱 시작/종료 훅 — outbox dispatcher·감사 로그 sink 구동, 비트맵 색인 구축, 공유 리소스 정리."""
+    dispatcher = OutboxDispatcher()
+    dispatcher.start()
+    audit_sink.start()
+    # 구축이 끝나기 전에는 검색이 SQL 필터로 동작하므로 기동을 막지 않는다
+    indexing = asyncio.create_task(bitmap_index_service.warm()) if settings.bitmap_index_enabled else None
+    yield
+    if indexing is not None:
+        indexing.cancel()
+    await dispatcher.stop()
+    await audit_sink.stop()
+    await close_http_clients()
 
-app = FastAPI(title="Place DB", version="0.1.0", description="개인 장소 DB + LLM 시맨틱 서치")
+
+app = FastAPI(title="Place DB", version="0.1.0", description="개인 장소 DB + LLM 시맨틱 서치", lifespan=lifespan)
 
 app.add_middleware(
     CORSMiddleware,
@@ -15,8 +44,24 @@ app.add_middleware(
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
+    expose_headers=["ETag"],
 )
 
+# Accept-Encoding에 gzip이 있는 클라이언트에만 적용된다.
+# 원문 엔드포인트는 Range·인코딩별 ETag를 직접 처리하므로 제외한다 (압축하면 Content-Range가 어긋난다).
+app.add_middleware(
+    SelectiveGZipMiddleware,
+    minimum_size=settings.gzip_minimum_size,
+    compresslevel=settings.gzip_compresslevel,
+    exclude_paths=(r"/api/v1/sources/[^/]+/raw",),
+)
+
+
+@app.exception_handler(InvalidCursorError)
+async def invalid_cursor_handler(_: Request, exc: InvalidCursorError) -> JSONResponse:
+    """잘못되었거나 변조된 페이지 커서 → 400."""
+    return JSONResponse(status_code=400, content={"detail": str(exc)})
+
 
 @app.get("/health")
 async def health_check():
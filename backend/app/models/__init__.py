@@ -9,11 +9,13 @@ class Base(DeclarativeBase):
 
 # Alembic autogenerate가 모든 모델을 인식하도록 import 유지
 from app.models.audit import AuditLog, CostLog  # noqa: E402, F401
-from app.models.embedding import Embedding  # noqa: E402, F401
+from app.models.embedding import Embedding, ReembedJob  # noqa: E402, F401
 from app.models.media import Media  # noqa: E402, F401
 from app.models.note import Note  # noqa: E402, F401
 from app.models.ontology import OntologyNode, Relation  # noqa: E402, F401
+from app.models.outbox import OutboxEvent, OutboxOffset  # noqa: E402, F401
 from app.models.place import Place, ProviderLink  # noqa: E402, F401
-from app.models.source import Source  # noqa: E402, F401
+from app.models.search import PlaceSearchDocument  # noqa: E402, F401
+from app.models.source import Source, SourceBlob  # noqa: E402, F401
 from app.models.tag import PlaceTag, Tag  # noqa: E402, F401
 from app.models.visit import Visit  # noqa: E402, F401
@@ -13,9 +13,17 @@ from app.models import Base
 
 
 class AuditLog(Base):
-    """Audit log model."""
+    """Audit log model.
+
+    Range-partitioned by month on ``created_at`` (partitions are managed by
+    ``audit_service``), so the partition key is part of the primary key.
+    """
 
     __tablename__ = "audit_logs"
+    __table_args__ = (
+        Index("idx_audit_logs_entity", "entity_type", "entity_id", "created_at"),
+        {"postgresql_partition_by": "RANGE (created_at)"},
+    )
 
     id: Mapped[uuid.UUID] = mapped_column(
         UUID(as_uuid=True),
@@ -29,7 +37,7 @@ class AuditLog(Base):
 
     created_at: Mapped[datetime] = mapped_column(
         DateTime(timezone=True),
-        nullable=False,
+        primary_key=True,
         server_default=func.now(),
     )
     updated_at: Mapped[datetime] = mapped_column(
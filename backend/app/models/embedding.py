@@ -6,7 +6,7 @@ import uuid
 from datetime import datetime
 
 from pgvector.sqlalchemy import Vector
-from sqlalchemy import CheckConstraint, DateTime, Index, String, Text, UniqueConstraint, func, text
+from sqlalchemy import CheckConstraint, DateTime, Index, Integer, String, Text, UniqueConstraint, func, text
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import Mapped, mapped_column
 
@@ -20,11 +20,18 @@ class Embedding(Base):
     __table_args__ = (
         CheckConstraint("entity_type IN ('place', 'note', 'source')", name="ck_embeddings_entity_type"),
         UniqueConstraint("entity_type", "entity_id", name="uq_embeddings_entity_type_entity_id"),
-        Index(
-            "idx_embeddings_vector",
-            "vector",
-            postgresql_using="hnsw",
-            postgresql_ops={"vector": "vector_cosine_ops"},
+        # entity_type별 부분 HNSW 인덱스 — 타입 필터 검색이 다른 타입 벡터에 후보를 빼앗기지 않는다
+        # (scripts.rebuild_vector_index --index-type으로 halfvec/bit 양자화 표현식 인덱스로 바꿀 수 있다)
+        *(
+            Index(
+                f"idx_embeddings_vector_{entity_type}",
+                "vector",
+                postgresql_using="hnsw",
+                postgresql_with={"m": 16, "ef_construction": 64},
+                postgresql_ops={"vector": "vector_cosine_ops"},
+                postgresql_where=text(f"entity_type = '{entity_type}'"),
+            )
+            for entity_type in ("place", "note", "source")
         ),
     )
 
@@ -46,3 +53,39 @@ class Embedding(Base):
         server_default=func.now(),
         onupdate=func.now(),
     )
+
+
+class ReembedJob(Base):
+    """Progress of a background re-embedding into the ``embeddings_shadow`` table.
+
+    The shadow table is created per job (its vector dimension depends on the
+    target model) and swapped in for ``embeddings`` at cutover, so it is not
+    part of the ORM metadata.
+    """
+
+    __tablename__ = "reembed_jobs"
+    __table_args__ = (
+        CheckConstraint("status IN ('running', 'completed', 'cancelled')", name="ck_reembed_jobs_status"),
+    )
+
+    id: Mapped[uuid.UUID] = mapped_column(
+        UUID(as_uuid=True),
+        primary_key=True,
+        server_default=text("uuid_generate_v4()"),
+    )
+    target_model: Mapped[str] = mapped_column(String(64), nullable=False)
+    dimensions: Mapped[int] = mapped_column(Integer, nullable=False)
+    status: Mapped[str] = mapped_column(String(16), nullable=False, server_default=text("'running'"))
+    # 백필 keyset 커서 — (entity_type, entity_id) 순서로 마지막 처리 행
+    cursor_entity_type: Mapped[str | None] = mapped_column(String(16))
+    cursor_entity_id: Mapped[uuid.UUID | None] = mapped_column(UUID(as_uuid=True))
+    embedded: Mapped[int] = mapped_column(Integer, nullable=False, server_default=text("0"))
+
+    created_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), nullable=False, server_default=func.now())
+    updated_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True),
+        nullable=False,
+        server_default=func.now(),
+        onupdate=func.now(),
+    )
+    completed_at: Mapped[datetime | None] = mapped_column(DateTime(timezone=True))
@@ -0,0 +1,58 @@
+"""Transactional outbox models — change events and consumer offsets."""
+
+from __future__ import annotations
+
+import uuid
+from datetime import datetime
+
+from sqlalchemy import BigInteger, DateTime, Identity, Index, String, func, text
+from sqlalchemy.dialects.postgresql import JSONB, UUID
+from sqlalchemy.orm import Mapped, mapped_column
+
+from app.models import Base
+
+# 이벤트를 기록한 트랜잭션 id (xid8 → bigint). 스냅샷 xmin 미만이면 커밋 순서가 확정된 것이다.
+CURRENT_TX_ID = text("(pg_current_xact_id()::text)::bigint")
+
+
+class OutboxEvent(Base):
+    """Change event written in the same transaction as the mutation it describes."""
+
+    __tablename__ = "outbox_events"
+    __table_args__ = (Index("idx_outbox_events_tx", "tx_id", "id"),)
+
+    id: Mapped[int] = mapped_column(BigInteger, Identity(), primary_key=True)
+    tx_id: Mapped[int] = mapped_column(BigInteger, nullable=False, server_default=CURRENT_TX_ID)
+    entity_type: Mapped[str] = mapped_column(String(32), nullable=False)
+    entity_id: Mapped[uuid.UUID | None] = mapped_column(UUID(as_uuid=True))
+    place_id: Mapped[uuid.UUID | None] = mapped_column(UUID(as_uuid=True))
+    op: Mapped[str] = mapped_column(String(16), nullable=False)
+    payload: Mapped[dict | None] = mapped_column(JSONB)
+
+    created_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True),
+        nullable=False,
+        server_default=func.now(),
+    )
+
+
+class OutboxOffset(Base):
+    """Last delivered (tx_id, id) position of a durable outbox consumer."""
+
+    __tablename__ = "outbox_offsets"
+
+    consumer: Mapped[str] = mapped_column(String(64), primary_key=True)
+    tx_id: Mapped[int] = mapped_column(BigInteger, nullable=False, server_default=text("0"))
+    event_id: Mapped[int] = mapped_column(BigInteger, nullable=False, server_default=text("0"))
+
+    created_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True),
+        nullable=False,
+        server_default=func.now(),
+    )
+    updated_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True),
+        nullable=False,
+        server_default=func.now(),
+        onupdate=func.now(),
+    )
@@ -3,7 +3,7 @@
 from __future__ import annotations
 
 import uuid
-from datetime import datetime
+from datetime import date, datetime
 from typing import TYPE_CHECKING
 
 from geoalchemy2 import Geography
@@ -11,9 +11,11 @@ from geoalchemy2.elements import WKBElement
 from sqlalchemy import (
     Boolean,
     CheckConstraint,
+    Date,
     DateTime,
     ForeignKey,
     Index,
+    Integer,
     SmallInteger,
     String,
     Text,
@@ -55,7 +57,18 @@ class Place(Base):
             postgresql_ops={"normalized_name": "gin_trgm_ops"},
         ),
         Index("idx_places_location", "location", postgresql_using="gist"),
+        # 속성 배열 필터(@>, &&)용 GIN 인덱스
+        Index("idx_places_mood", "mood", postgresql_using="gin"),
+        Index("idx_places_companions", "companions", postgresql_using="gin"),
+        Index("idx_places_situations", "situations", postgresql_using="gin"),
         Index("idx_places_category", "category_primary", "category_secondary"),
+        Index("idx_places_visit_count", "visit_count", "id"),
+        Index(
+            "idx_places_last_visited",
+            "last_visited_at",
+            "id",
+            postgresql_where=text("last_visited_at IS NOT NULL"),
+        ),
     )
 
     id: Mapped[uuid.UUID] = mapped_column(
@@ -89,6 +102,12 @@ class Place(Base):
     is_favorite: Mapped[bool] = mapped_column(Boolean, nullable=False, server_default=text("false"))
     user_rating: Mapped[int | None] = mapped_column(SmallInteger)
 
+    # 방문 집계 — visits 변경 시 visit_stats_service가 증분 갱신
+    visit_count: Mapped[int] = mapped_column(Integer, nullable=False, server_default=text("0"))
+    last_visited_at: Mapped[date | None] = mapped_column(Date)
+    visit_rating_sum: Mapped[int] = mapped_column(Integer, nullable=False, server_default=text("0"))
+    visit_rating_count: Mapped[int] = mapped_column(Integer, nullable=False, server_default=text("0"))
+
     created_at: Mapped[datetime] = mapped_column(
         DateTime(timezone=True),
         nullable=False,
@@ -101,16 +120,26 @@ class Place(Base):
         onupdate=func.now(),
     )
 
-    provider_links: Mapped[list[ProviderLink]] = relationship(back_populates="place", cascade="all, delete-orphan")
-    sources: Mapped[list[Source]] = relationship(back_populates="place", cascade="all, delete-orphan")
-    notes: Mapped[list[Note]] = relationship(back_populates="place", cascade="all, delete-orphan")
-    visits: Mapped[list[Visit]] = relationship(back_populates="place", cascade="all, delete-orphan")
-    media: Mapped[list[Media]] = relationship(back_populates="place", cascade="all, delete-orphan")
+    # 자식 행 삭제는 FK의 ON DELETE CASCADE에 맡긴다 (삭제 전에 자식을 메모리로 읽지 않음)
+    provider_links: Mapped[list[ProviderLink]] = relationship(
+        back_populates="place", cascade="all, delete-orphan", passive_deletes=True
+    )
+    sources: Mapped[list[Source]] = relationship(
+        back_populates="place", cascade="all, delete-orphan", passive_deletes=True
+    )
+    notes: Mapped[list[Note]] = relationship(back_populates="place", cascade="all, delete-orphan", passive_deletes=True)
+    visits: Mapped[list[Visit]] = relationship(
+        back_populates="place", cascade="all, delete-orphan", passive_deletes=True
+    )
+    media: Mapped[list[Media]] = relationship(
+        back_populates="place", cascade="all, delete-orphan", passive_deletes=True
+    )
 
     tags: Mapped[list[Tag]] = relationship(
         secondary="place_tags",
         back_populates="places",
         lazy="selectin",
+        passive_deletes=True,
     )
 
 
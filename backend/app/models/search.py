@@ -0,0 +1,48 @@
+"""Per-place keyword search document model."""
+
+from __future__ import annotations
+
+import uuid
+from datetime import datetime
+
+from sqlalchemy import DateTime, ForeignKey, Index, Text, func
+from sqlalchemy.dialects.postgresql import TSVECTOR, UUID
+from sqlalchemy.orm import Mapped, mapped_column
+
+from app.models import Base
+
+
+class PlaceSearchDocument(Base):
+    """Denormalized text of a place and its children for keyword search.
+
+    Maintained by ``search_document_service`` from outbox events; never written
+    by request handlers directly.
+    """
+
+    __tablename__ = "place_search_documents"
+    __table_args__ = (
+        Index("idx_place_search_documents_document", "document", postgresql_using="gin"),
+        Index(
+            "idx_place_search_documents_body",
+            "body",
+            postgresql_using="gin",
+            postgresql_ops={"body": "gin_trgm_ops"},
+        ),
+    )
+
+    place_id: Mapped[uuid.UUID] = mapped_column(
+        UUID(as_uuid=True),
+        ForeignKey("places.id", ondelete="CASCADE"),
+        primary_key=True,
+    )
+    # 가중치: A 이름, B 태그·분위기·상황, C 출처 제목/요약, D 메모
+    document: Mapped[str] = mapped_column(TSVECTOR, nullable=False)
+    # 트라이그램 부분 일치용 원문 (한국어는 공백 토큰화만으로는 어절 변형을 못 잡는다)
+    body: Mapped[str] = mapped_column(Text, nullable=False)
+
+    updated_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True),
+        nullable=False,
+        server_default=func.now(),
+        onupdate=func.now(),
+    )
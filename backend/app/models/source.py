@@ -6,7 +6,7 @@ import uuid
 from datetime import datetime
 from typing import TYPE_CHECKING
 
-from sqlalchemy import CheckConstraint, DateTime, ForeignKey, String, Text, func, text
+from sqlalchemy import CheckConstraint, DateTime, ForeignKey, Index, Integer, LargeBinary, String, Text, func, text
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
@@ -20,7 +20,11 @@ class Source(Base):
     """Evidence/source attached to a place."""
 
     __tablename__ = "sources"
-    __table_args__ = (CheckConstraint("type IN ('URL', 'TEXT', 'IMAGE', 'REVIEW_SNIPPET')", name="ck_sources_type"),)
+    __table_args__ = (
+        CheckConstraint("type IN ('URL', 'TEXT', 'IMAGE', 'REVIEW_SNIPPET')", name="ck_sources_type"),
+        Index("idx_sources_place_created", "place_id", "created_at", "id"),
+        Index("idx_sources_raw_text_hash", "raw_text_hash"),
+    )
 
     id: Mapped[uuid.UUID] = mapped_column(
         UUID(as_uuid=True),
@@ -36,7 +40,9 @@ class Source(Base):
     url: Mapped[str | None] = mapped_column(Text)
     title: Mapped[str | None] = mapped_column(Text)
     snippet: Mapped[str | None] = mapped_column(Text)
-    raw_text: Mapped[str | None] = mapped_column(Text)
+    # 원문은 source_blobs에 압축·중복 제거되어 저장되고 /sources/{id}/raw로만 내려간다
+    raw_text_hash: Mapped[str | None] = mapped_column(String(64), ForeignKey("source_blobs.content_hash"))
+    raw_text_size: Mapped[int | None] = mapped_column(Integer)
     captured_at: Mapped[datetime | None] = mapped_column(DateTime(timezone=True), server_default=func.now())
 
     created_at: Mapped[datetime] = mapped_column(
@@ -52,3 +58,20 @@ class Source(Base):
     )
 
     place: Mapped[Place] = relationship(back_populates="sources")
+
+
+class SourceBlob(Base):
+    """Compressed raw source text, stored once per distinct content."""
+
+    __tablename__ = "source_blobs"
+
+    content_hash: Mapped[str] = mapped_column(String(64), primary_key=True)
+    encoding: Mapped[str] = mapped_column(String(16), nullable=False, server_default=text("'deflate'"))
+    data: Mapped[bytes] = mapped_column(LargeBinary, nullable=False)
+    size: Mapped[int] = mapped_column(Integer, nullable=False)
+
+    created_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True),
+        nullable=False,
+        server_default=func.now(),
+    )
@@ -0,0 +1,13 @@
+"""External place provider package."""
+
+from app.providers.base import BaseProvider, EnrichmentQuery, ProviderError, ProviderResult
+from app.providers.gateway import ProviderGateway, get_provider_gateway
+
+__all__ = [
+    "BaseProvider",
+    "EnrichmentQuery",
+    "ProviderError",
+    "ProviderGateway",
+    "ProviderResult",
+    "get_provider_gateway",
+]
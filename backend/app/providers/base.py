@@ -0,0 +1,68 @@
+"""External place provider abstraction."""
+
+from __future__ import annotations
+
+from abc import ABC, abstractmethod
+from dataclasses import dataclass
+from typing import Any
+
+
+class ProviderError(RuntimeError):
+    """Raised when an external provider call fails."""
+
+
+@dataclass(frozen=True)
+class EnrichmentQuery:
+    """What we know about a place when asking a provider about it.
+
+    Hashable so it can be used directly as a cache and coalescing key.
+    """
+
+    name: str
+    address: str | None = None
+    lat: float | None = None
+    lng: float | None = None
+    provider_place_id: str | None = None
+
+
+@dataclass(frozen=True)
+class ProviderResult:
+    """Provider answer. ``data`` is None when the provider found no match."""
+
+    provider: str
+    data: dict[str, Any] | None
+    cached: bool = False
+
+
+class BaseProvider(ABC):
+    """Abstract external place provider.
+
+    Attributes:
+        name: Provider identifier used for cache keys and cost logs.
+        link_provider: ``provider_links.provider`` code holding this provider's place id.
+        rate_per_second: Call budget enforced by the gateway.
+        cost_krw_per_call: Estimated KRW cost of one call, recorded in cost_logs.
+    """
+
+    name: str = "base"
+    link_provider: str = "ETC"
+    rate_per_second: float = 5.0
+    cost_krw_per_call: float = 0.0
+
+    def supports(self, query: EnrichmentQuery) -> bool:
+        """Whether the provider can answer the query (e.g. needs a provider place id)."""
+        return True
+
+    @abstractmethod
+    async def lookup(self, query: EnrichmentQuery) -> dict[str, Any] | None:
+        """Fetch runtime details for a place.
+
+        Args:
+            query: Place identity and location.
+
+        Returns:
+            Provider fields, or None when nothing matched.
+
+        Raises:
+            ProviderError: If the upstream call failed.
+        """
@@ -0,0 +1,53 @@
+"""Offline fake provider for tests and local development."""
+
+from __future__ import annotations
+
+import asyncio
+from collections.abc import Callable
+from typing import Any
+
+from app.providers.base import BaseProvider, EnrichmentQuery
+
+
+class FakeProvider(BaseProvider):
+    """Deterministic provider that never leaves the process.
+
+    Args:
+        name: Provider name used for cache keys and cost logs.
+        data: Fixed answer, or a callable building it from the query. None means "no match".
+        latency: Seconds to sleep before answering, to exercise coalescing.
+        error: Exception raised instead of answering.
+        rate_per_second: Call budget enforced by the gateway.
+        cost_krw_per_call: Cost recorded per call.
+        requires_place_id: Mimic providers that need a linked provider place id.
+    """
+
+    def __init__(
+        self,
+        name: str = "fake",
+        data: dict[str, Any] | Callable[[EnrichmentQuery], dict[str, Any] | None] | None = None,
+        latency: float = 0.0,
+        error: Exception | None = None,
+        rate_per_second: float = 1000.0,
+        cost_krw_per_call: float = 0.0,
+        requires_place_id: bool = False,
+    ) -> None:
+        self.name = name
+        self.data = data
+        self.latency = latency
+        self.error = error
+        self.rate_per_second = rate_per_second
+        self.cost_krw_per_call = cost_krw_per_call
+        self.requires_place_id = requires_place_id
+        self.calls: list[EnrichmentQuery] = []
+
+    def supports(self, query: EnrichmentQuery) -> bool:
+        return not self.requires_place_id or query.provider_place_id is not None
+
+    async def lookup(self, query: EnrichmentQuery) -> dict[str, Any] | None:
+        self.calls.append(query)
+        if self.latency:
+            await asyncio.sleep(self.latency)
+        if self.error is not None:
+            raise self.error
+        return self.data(query) if callable(self.data) else self.data
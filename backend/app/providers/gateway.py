@@ -0,0 +1,124 @@
+"""Provider gateway: caching, coalescing, rate limiting and cost logging."""
+
+from __future__ import annotations
+
+import logging
+from collections.abc import Awaitable, Callable
+from dataclasses import replace
+from functools import lru_cache
+
+from app.config import settings
+from app.providers.base import BaseProvider, EnrichmentQuery, ProviderResult
+from app.utils.cache import SingleFlight, TTLCache
+from app.utils.rate_limit import TokenBucket
+
+logger = logging.getLogger(__name__)
+
+CostLogger = Callable[[BaseProvider, str], Awaitable[None]]
+
+
+async def log_provider_cost(provider: BaseProvider, action: str) -> None:
+    """Record one provider call in cost_logs using its own session."""
+    from app.deps import async_session_factory
+    from app.utils.cost_tracker import log_cost
+
+    async with async_session_factory() as db:
+        await log_cost(
+            db,
+            provider=provider.name,
+            action=action,
+            tokens_in=None,
+            tokens_out=None,
+            cost_krw=provider.cost_krw_per_call,
+        )
+
+
+class ProviderGateway:
+    """Single entry point for runtime lookups against external providers.
+
+    * Answers (including "no match") are kept in a bounded TTL+LRU cache keyed by
+      (provider, query); errors are not cached.
+    * Concurrent identical lookups share one upstream call.
+    * Each provider has a token bucket sized by its ``rate_per_second``.
+    * Every upstream call is recorded through ``cost_logger``.
+
+    Args:
+        providers: Providers by name.
+        cache_ttl: Seconds a lookup result stays cached.
+        cache_maxsize: Maximum cached lookups.
+        cost_logger: Coroutine recording a call's cost. Defaults to ``log_provider_cost``.
+    """
+
+    def __init__(
+        self,
+        providers: list[BaseProvider],
+        cache_ttl: float | None = None,
+        cache_maxsize: int | None = None,
+        cost_logger: CostLogger | None = None,
+    ) -> None:
+        self.providers = {provider.name: provider for provider in providers}
+        self._cache: TTLCache[tuple[str, EnrichmentQuery], ProviderResult] = TTLCache(
+            maxsize=cache_maxsize or settings.enrichment_cache_maxsize,
+            ttl=cache_ttl if cache_ttl is not None else settings.enrichment_cache_ttl_seconds,
+        )
+        self._flight: SingleFlight[tuple[str, EnrichmentQuery], ProviderResult] = SingleFlight()
+        self._buckets = {provider.name: TokenBucket(provider.rate_per_second) for provider in providers}
+        self._cost_logger = cost_logger or log_provider_cost
+
+    async def lookup(self, name: str, query: EnrichmentQuery, action: str = "enrich") -> ProviderResult:
+        """Look a place up at one provider, served from cache when possible.
+
+        Raises:
+            KeyError: If the provider is not registered.
+            ProviderError: If the upstream call failed.
+        """
+        provider = self.providers[name]
+        key = (name, query)
+        cached = self._cache.get(key)
+        if cached is not None:
+            return replace(cached, cached=True)
+        return await self._flight.do(key, lambda: self._fetch(provider, key, action))
+
+    async def _fetch(
+        self,
+        provider: BaseProvider,
+        key: tuple[str, EnrichmentQuery],
+        action: str,
+    ) -> ProviderResult:
+        await self._buckets[provider.name].acquire()
+        try:
+            data = await provider.lookup(key[1])
+        finally:
+            await self._account(provider, action)
+        result = ProviderResult(provider=provider.name, data=data)
+        self._cache.set(key, result)
+        return result
+
+    async def _account(self, provider: BaseProvider, action: str) -> None:
+        # 비용 기록 실패가 보강 응답을 막지 않도록 예외를 삼킨다
+        try:
+            await self._cost_logger(provider, action)
+        except Exception:
+            logger.exception("Failed to record provider cost for %s", provider.name)
+
+    def clear_cache(self) -> None:
+        self._cache.clear()
+
+
+def _configured_providers() -> list[BaseProvider]:
+    providers: list[BaseProvider] = []
+    if settings.kakao_rest_api_key:
+        from app.providers.kakao import KakaoLocalProvider
+
+        providers.append(KakaoLocalProvider())
+    if settings.google_places_api_key:
+        from app.providers.google_places import GooglePlacesProvider
+
+        providers.append(GooglePlacesProvider())
+    return providers
+
+
+@lru_cache(maxsize=1)
+def get_provider_gateway() -> ProviderGateway:
+    """Process-wide gateway over every provider with a configured API key."""
+    return ProviderGateway(_configured_providers())
@@ -0,0 +1,56 @@
+"""Kakao Local API provider."""
+
+from __future__ import annotations
+
+from typing import Any
+
+import httpx
+
+from app.config import settings
+from app.providers.base import BaseProvider, EnrichmentQuery, ProviderError
+from app.utils.http_client import get_http_client
+
+
+class KakaoLocalProvider(BaseProvider):
+    """Kakao Local keyword search: address check and category."""
+
+    name = "kakao"
+    link_provider = "KAKAO"
+    rate_per_second = 10.0
+    cost_krw_per_call = 0.0  # 일 10만 건까지 무료
+
+    def __init__(self, api_key: str | None = None, radius_m: int = 500) -> None:
+        self.api_key = api_key if api_key is not None else settings.kakao_rest_api_key
+        self.radius_m = radius_m
+
+    async def lookup(self, query: EnrichmentQuery) -> dict[str, Any] | None:
+        client = get_http_client("kakao", base_url="https://dapi.kakao.com", timeout=5.0)
+        params: dict[str, Any] = {"query": query.name, "size": 5}
+        if query.lat is not None and query.lng is not None:
+            params.update(x=query.lng, y=query.lat, radius=self.radius_m, sort="distance")
+
+        try:
+            response = await client.get(
+                "/v2/local/search/keyword.json",
+                params=params,
+                headers={"Authorization": f"KakaoAK {self.api_key}"},
+            )
+            response.raise_for_status()
+        except httpx.HTTPError as exc:
+            raise ProviderError(f"Kakao Local request failed: {exc!r}") from exc
+
+        documents = response.json().get("documents") or []
+        if not documents:
+            return None
+        document = next((d for d in documents if d.get("id") == query.provider_place_id), documents[0])
+        return {
+            "provider_place_id": document.get("id"),
+            "name": document.get("place_name"),
+            "address_road": document.get("road_address_name") or None,
+            "address_jibun": document.get("address_name") or None,
+            "category": document.get("category_name") or None,
+            "phone": document.get("phone") or None,
+            "url": document.get("place_url") or None,
+            "lat": float(document["y"]) if document.get("y") else None,
+            "lng": float(document["x"]) if document.get("x") else None,
+        }
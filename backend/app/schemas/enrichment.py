@@ -0,0 +1,31 @@
+"""Enrichment schemas."""
+
+from __future__ import annotations
+
+import uuid
+from datetime import datetime
+from typing import Any, Literal
+
+from pydantic import BaseModel
+
+
+class ProviderEnrichment(BaseModel):
+    """One provider's runtime answer for a place.
+
+    status is "ok", "not_found", "error" (external lookup failed) or "skipped"
+    (provider needs a linked provider place id the place does not have).
+    """
+
+    provider: str
+    status: Literal["ok", "not_found", "error", "skipped"]
+    cached: bool = False
+    data: dict[str, Any] | None = None
+    error: str | None = None
+
+
+class EnrichmentResponse(BaseModel):
+    """GET /places/{id}/enrich response. Nothing here is stored."""
+
+    place_id: uuid.UUID
+    results: list[ProviderEnrichment]
+    fetched_at: datetime
@@ -3,7 +3,7 @@
 from __future__ import annotations
 
 import uuid
-from datetime import datetime
+from datetime import date, datetime
 
 from pydantic import BaseModel, ConfigDict, Field
 
@@ -85,6 +85,8 @@ class PlaceBrief(BaseModel):
     category_primary: str | None
     is_favorite: bool
     user_rating: int | None
+    visit_count: int = 0
+    last_visited_at: date | None = None
     created_at: datetime
 
 
@@ -112,6 +114,8 @@ class PlaceResponse(BaseModel):
     situations: list[str] | None
     is_favorite: bool
     user_rating: int | None
+    visit_count: int = 0
+    last_visited_at: date | None = None
     created_at: datetime
     updated_at: datetime
     provider_links: list[ProviderLinkResponse] = Field(default_factory=list)
@@ -119,11 +123,18 @@ class PlaceResponse(BaseModel):
 
 
 class PlaceDetail(PlaceResponse):
-    """Place detail schema including child entities."""
+    """Place detail schema including the first page of each child collection.
+
+    A non-null ``*_next_cursor`` means more rows are available from the
+    corresponding list endpoint.
+    """
 
     sources: list[SourceResponse] = Field(default_factory=list)
+    sources_next_cursor: str | None = None
     notes: list[NoteResponse] = Field(default_factory=list)
+    notes_next_cursor: str | None = None
     visits: list[VisitResponse] = Field(default_factory=list)
+    visits_next_cursor: str | None = None
 
 
 class DuplicateCandidate(BaseModel):
@@ -148,6 +159,19 @@ class MergeRequest(BaseModel):
     merge_with: uuid.UUID
 
 
+class BulkDeleteRequest(BaseModel):
+    """Places to delete in one request."""
+
+    place_ids: list[uuid.UUID] = Field(min_length=1, max_length=500)
+
+
+class BulkDeleteResponse(BaseModel):
+    """Outcome of a bulk delete."""
+
+    deleted: list[uuid.UUID]
+    not_found: list[uuid.UUID]
+
+
 class DuplicateCheckRequest(BaseModel):
     """Payload for duplicate check endpoint."""
 
@@ -0,0 +1,96 @@
+"""Search schemas."""
+
+from __future__ import annotations
+
+import uuid
+from typing import Literal
+
+from pydantic import BaseModel, ConfigDict, Field
+
+
+class SearchFilters(BaseModel):
+    """Structured search filters (PRD FR-2.1)."""
+
+    max_distance_km: float | None = Field(default=None, gt=0)
+    lat: float | None = None
+    lng: float | None = None
+    parking: bool | None = None
+    reservation: str | None = None
+    mood: list[str] | None = None
+    situations: list[str] | None = None
+    companions: list[str] | None = None
+    category_primary: str | None = None
+    price_range: str | None = None
+    tags: list[str] | None = None
+    is_favorite: bool | None = None
+    min_rating: int | None = Field(default=None, ge=1, le=5)
+    # 이 중 하나(또는 그 하위 노드)와 relations로 연결된 장소
+    ontology_nodes: list[uuid.UUID] | None = None
+
+
+class SearchIntent(BaseModel):
+    """Parsed natural-language query: text for retrieval plus structured filters."""
+
+    search_text: str
+    filters: SearchFilters = Field(default_factory=SearchFilters)
+
+
+class ParseQueryRequest(BaseModel):
+    """parse_query tool input."""
+
+    query: str = Field(min_length=1, max_length=500)
+
+
+class ParsedQuery(BaseModel):
+    """Parsed query plus how it was produced.
+
+    source is "rules" for the deterministic fast path and "llm" when the query
+    was escalated. matched lists recognized terms as "namespace:value".
+    """
+
+    intent: SearchIntent
+    source: Literal["rules", "llm"]
+    confidence: float = Field(ge=0, le=1)
+    matched: list[str] = Field(default_factory=list)
+
+
+class QueryParserStats(BaseModel):
+    """Fast-path counters since process start."""
+
+    total: int
+    fast_path: int
+    llm: int
+    llm_failed: int
+    fast_path_hit_rate: float
+
+
+class KeywordSearchHit(BaseModel):
+    """Keyword search result: a place and its ``ts_rank`` against the query."""
+
+    model_config = ConfigDict(from_attributes=True)
+
+    place_id: uuid.UUID
+    rank: float
+
+
+class FacetCount(BaseModel):
+    """Number of matching places with one facet value.
+
+    ``parent`` is set for nested facets (the ``region_depth1`` of a ``region_depth2`` value).
+    """
+
+    value: str
+    count: int
+    parent: str | None = None
+
+
+class PlaceFacets(BaseModel):
+    """Facet counts over the places matching a filter set."""
+
+    total: int
+    category_primary: list[FacetCount] = Field(default_factory=list)
+    region_depth1: list[FacetCount] = Field(default_factory=list)
+    region_depth2: list[FacetCount] = Field(default_factory=list)
+    price_range: list[FacetCount] = Field(default_factory=list)
+    mood: list[FacetCount] = Field(default_factory=list)
+    tags: list[FacetCount] = Field(default_factory=list)
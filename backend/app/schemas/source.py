@@ -30,7 +30,7 @@ class SourceResponse(BaseModel):
     url: str | None
     title: str | None
     snippet: str | None
-    raw_text: str | None
+    raw_text_size: int | None
     captured_at: datetime | None
     created_at: datetime
     updated_at: datetime
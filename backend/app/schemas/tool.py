@@ -0,0 +1,58 @@
+"""Agent tool schemas."""
+
+from __future__ import annotations
+
+import uuid
+
+from pydantic import BaseModel, Field
+
+from app.schemas.place import PlaceBrief
+
+
+class StartLocation(BaseModel):
+    """Itinerary start coordinates."""
+
+    lat: float = Field(ge=-90, le=90)
+    lng: float = Field(ge=-180, le=180)
+
+
+class DraftItineraryRequest(BaseModel):
+    """draft_itinerary tool input."""
+
+    place_ids: list[uuid.UUID] = Field(min_length=1, max_length=30)
+    start_location: StartLocation | None = None
+
+
+class ItineraryLeg(BaseModel):
+    """Single move between two stops. from_place_id is None for the start location."""
+
+    from_place_id: uuid.UUID | None
+    to_place_id: uuid.UUID
+    distance_m: float
+    travel_minutes: float
+    mode: str
+
+
+class DraftItineraryResponse(BaseModel):
+    """draft_itinerary tool output."""
+
+    markdown: str
+    places_ordered: list[PlaceBrief]
+    legs: list[ItineraryLeg] = Field(default_factory=list)
+    total_distance_m: float = 0.0
+    total_travel_minutes: float = 0.0
+    unlocated_place_ids: list[uuid.UUID] = Field(default_factory=list)
+
+
+class BuildComparisonTableRequest(BaseModel):
+    """build_comparison_table tool input."""
+
+    place_ids: list[uuid.UUID] = Field(min_length=1, max_length=20)
+    columns: list[str] = Field(default_factory=list)
+
+
+class ComparisonTableResponse(BaseModel):
+    """build_comparison_table tool output."""
+
+    markdown: str
+    columns: list[str]
@@ -1,5 +1,39 @@
 """Service package exports."""
 
-from app.services import dedup_service, place_service
+from app.services import (
+    audit_service,
+    bitmap_index_service,
+    cache_service,
+    comparison_service,
+    dedup_service,
+    embedding_service,
+    enrichment_service,
+    facet_service,
+    filter_service,
+    itinerary_service,
+    outbox_service,
+    place_service,
+    query_parser_service,
+    search_document_service,
+    source_service,
+    visit_stats_service,
+)
 
-__all__ = ["dedup_service", "place_service"]
+__all__ = [
+    "audit_service",
+    "bitmap_index_service",
+    "cache_service",
+    "comparison_service",
+    "dedup_service",
+    "embedding_service",
+    "enrichment_service",
+    "facet_service",
+    "filter_service",
+    "itinerary_service",
+    "outbox_service",
+    "place_service",
+    "query_parser_service",
+    "search_document_service",
+    "source_service",
+    "visit_stats_service",
+]
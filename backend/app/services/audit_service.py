@@ -0,0 +1,269 @@
+"""Audit logging — buffered async sink and monthly partition management.
+
+Request handlers call :func:`record`, which only appends to an in-memory
+buffer. The sink writes buffered rows in one multi-row INSERT whenever the
+batch fills or the flush interval passes, so audit writes add no latency to
+user-facing transactions. Rows still buffered when the process dies are lost;
+audit data is best-effort by design.
+
+``audit_logs`` is range-partitioned by month (UTC). :func:`ensure_partitions`
+creates upcoming months and :func:`drop_partitions_before` implements
+retention by dropping whole partitions, so no bulk DELETE is needed. Rows
+written before their month's partition existed land in the DEFAULT
+partition; creating the month moves them out, and retention deletes whatever
+is left there past the cutoff.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import re
+import uuid
+from datetime import UTC, date, datetime
+from typing import Any
+
+from sqlalchemy import insert, text
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from app.config import settings
+from app.deps import async_session_factory
+from app.models.audit import AuditLog
+
+logger = logging.getLogger(__name__)
+
+_PARTITION_NAME = re.compile(r"^audit_logs_y(\d{4})m(\d{2})$")
+# 월 파티션이 없을 때 INSERT를 받아 주는 안전망 (마이그레이션 8e4b2d61a7c3)
+DEFAULT_PARTITION = "audit_logs_default"
+
+
+class AuditSink:
+    """Buffers audit rows and inserts them in batches from a background task.
+
+    Args:
+        session_factory: Session factory used for flushes.
+        batch_size: Rows per INSERT; reaching it wakes the flusher early.
+        flush_interval: Seconds between flushes of a partial batch.
+        max_buffer: Rows kept while the database is unavailable; the oldest
+            rows are dropped beyond this.
+    """
+
+    def __init__(
+        self,
+        session_factory: async_sessionmaker[AsyncSession] = async_session_factory,
+        batch_size: int | None = None,
+        flush_interval: float | None = None,
+        max_buffer: int | None = None,
+    ) -> None:
+        self._session_factory = session_factory
+        self._batch_size = batch_size or settings.audit_batch_size
+        self._flush_interval = flush_interval if flush_interval is not None else settings.audit_flush_interval_seconds
+        self._max_buffer = max_buffer or settings.audit_max_buffer
+        self._buffer: list[dict[str, Any]] = []
+        self._wakeup = asyncio.Event()
+        self._flush_lock = asyncio.Lock()
+        self._task: asyncio.Task[None] | None = None
+        self.dropped = 0
+
+    def record(
+        self,
+        action: str,
+        entity_type: str | None = None,
+        entity_id: uuid.UUID | None = None,
+        detail: dict[str, Any] | None = None,
+    ) -> None:
+        """Queue one audit row (never blocks, never raises)."""
+        self._buffer.append(
+            {
+                "action": action,
+                "entity_type": entity_type,
+                "entity_id": entity_id,
+                "detail": detail,
+                # 버퍼링 지연과 무관하게 실제 발생 시각으로 파티션에 들어가도록 한다
+                "created_at": datetime.now(UTC),
+            }
+        )
+        overflow = len(self._buffer) - self._max_buffer
+        if overflow > 0:
+            del self._buffer[:overflow]
+            self.dropped += overflow
+        if len(self._buffer) >= self._batch_size:
+            self._wakeup.set()
+
+    def pending(self) -> int:
+        """Number of rows waiting to be written."""
+        return len(self._buffer)
+
+    async def flush(self) -> int:
+        """Write all buffered rows now.
+
+        Returns:
+            Number of rows written. On failure the rows go back to the buffer.
+        """
+        async with self._flush_lock:
+            written = 0
+            while self._buffer:
+                batch, self._buffer = self._buffer[: self._batch_size], self._buffer[self._batch_size :]
+                try:
+                    async with self._session_factory() as db:
+                        await db.execute(insert(AuditLog), batch)
+                        await db.commit()
+                except Exception:
+                    self._buffer[:0] = batch
+                    raise
+                written += len(batch)
+            return written
+
+    def start(self) -> None:
+        if self._task is None:
+            self._task = asyncio.create_task(self._run(), name="audit-sink")
+
+    async def stop(self) -> None:
+        """Stop the background task and write whatever is still buffered."""
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+        try:
+            await self.flush()
+        except Exception:
+            logger.exception("Dropping %d audit rows on shutdown", self.pending())
+
+    async def _run(self) -> None:
+        while True:
+            try:
+                await asyncio.wait_for(self._wakeup.wait(), timeout=self._flush_interval)
+            except TimeoutError:
+                pass
+            self._wakeup.clear()
+            try:
+                await self.flush()
+            except Exception:
+                logger.exception("Audit flush failed; %d rows kept for retry", self.pending())
+
+
+audit_sink = AuditSink()
+
+
+def record(
+    action: str,
+    entity_type: str | None = None,
+    entity_id: uuid.UUID | None = None,
+    detail: dict[str, Any] | None = None,
+) -> None:
+    """Queue an audit row on the process-wide sink."""
+    audit_sink.record(action, entity_type, entity_id, detail)
+
+
+def _month_start(day: date, offset: int = 0) -> date:
+    months = day.year * 12 + day.month - 1 + offset
+    return date(months // 12, months % 12 + 1, 1)
+
+
+def _utc_midnight(day: date) -> datetime:
+    return datetime(day.year, day.month, day.day, tzinfo=UTC)
+
+
+def partition_name(month: date) -> str:
+    """Partition table name for the month containing ``month``."""
+    return f"audit_logs_y{month.year:04d}m{month.month:02d}"
+
+
+async def ensure_partitions(db: AsyncSession, months_ahead: int | None = None, today: date | None = None) -> list[str]:
+    """Create monthly partitions from the current month through ``months_ahead``.
+
+    Returns:
+        Names of partitions that were created.
+    """
+    today = today or datetime.now(UTC).date()
+    ahead = months_ahead if months_ahead is not None else settings.audit_partition_months_ahead
+    existing = set(await list_partitions(db))
+    created = []
+    for offset in range(ahead + 1):
+        start = _month_start(today, offset)
+        name = partition_name(start)
+        if name in existing:
+            continue
+        end = _month_start(start, 1)
+        bounds = {"start": _utc_midnight(start), "end": _utc_midnight(end)}
+        create = text(
+            f"CREATE TABLE IF NOT EXISTS {name} PARTITION OF audit_logs "
+            f"FOR VALUES FROM ('{start.isoformat()} 00:00:00+00') TO ('{end.isoformat()} 00:00:00+00')"
+        )
+        stranded = await db.scalar(
+            text(f"SELECT EXISTS (SELECT 1 FROM {DEFAULT_PARTITION} WHERE created_at >= :start AND created_at < :end)"),
+            bounds,
+        )
+        if not stranded:
+            await db.execute(create)
+        else:
+            # DEFAULT에 이미 그 달의 행이 있으면 CREATE가 제약 위반으로 실패한다 —
+            # DEFAULT를 떼어 낸 채 파티션을 만들고 행을 옮긴 뒤 다시 붙인다.
+            # DETACH가 audit_logs를 잠그므로 그동안의 INSERT는 커밋까지 기다린다.
+            await db.execute(text(f"ALTER TABLE audit_logs DETACH PARTITION {DEFAULT_PARTITION}"))
+            await db.execute(create)
+            await db.execute(
+                text(
+                    f"WITH moved AS (DELETE FROM {DEFAULT_PARTITION} "
+                    "WHERE created_at >= :start AND created_at < :end RETURNING *) "
+                    f"INSERT INTO {name} SELECT * FROM moved"
+                ),
+                bounds,
+            )
+            await db.execute(text(f"ALTER TABLE audit_logs ATTACH PARTITION {DEFAULT_PARTITION} DEFAULT"))
+        created.append(name)
+    await db.commit()
+    return created
+
+
+async def list_partitions(db: AsyncSession) -> list[str]:
+    """Names of the monthly partitions attached to ``audit_logs``, oldest first."""
+    rows = await db.execute(
+        text(
+            "SELECT c.relname FROM pg_inherits i "
+            "JOIN pg_class c ON c.oid = i.inhrelid "
+            "WHERE i.inhparent = 'audit_logs'::regclass"
+        )
+    )
+    return sorted(name for (name,) in rows if _PARTITION_NAME.match(name))
+
+
+async def drop_partitions_before(db: AsyncSession, cutoff: date, dry_run: bool = False) -> list[str]:
+    """Drop monthly partitions for months before ``cutoff``'s month.
+
+    Rows in the DEFAULT partition from those months are deleted as well.
+
+    Returns:
+        Names of partitions dropped (or that would be, with ``dry_run``).
+    """
+    first_kept = _month_start(cutoff)
+    doomed = []
+    for name in await list_partitions(db):
+        match = _PARTITION_NAME.match(name)
+        if match and date(int(match[1]), int(match[2]), 1) < first_kept:
+            doomed.append(name)
+    expired = {"cutoff": _utc_midnight(first_kept)}
+    if dry_run:
+        stale = await db.scalar(
+            text(f"SELECT count(*) FROM {DEFAULT_PARTITION} WHERE created_at < :cutoff"),
+            expired,
+        )
+    else:
+        for name in doomed:
+            await db.execute(text(f"DROP TABLE IF EXISTS {name}"))
+        result = await db.execute(text(f"DELETE FROM {DEFAULT_PARTITION} WHERE created_at < :cutoff"), expired)
+        stale = result.rowcount
+        await db.commit()
+    if stale:
+        logger.info("%s %d rows from %s", "Would delete" if dry_run else "Deleted", stale, DEFAULT_PARTITION)
+    return doomed
+
+
+def retention_cutoff(today: date | None = None, months: int | None = None) -> date:
+    """First month kept under the configured retention."""
+    today = today or datetime.now(UTC).date()
+    keep = months if months is not None else settings.audit_retention_months
+    return _month_start(today, -(keep - 1))
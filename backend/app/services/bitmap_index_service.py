@@ -0,0 +1,289 @@
+"""Process-local inverted index from place attributes to bitmaps of place ordinals.
+
+Every place gets a small integer ordinal, and every indexed key (tag id,
+ontology node id, mood value, situation value) maps to a bitmap of the
+ordinals carrying it. Bitmaps are Python ints: ``&``/``|`` run in C over
+machine words, and with ordinals packed densely (freed ones are reused) a
+bitmap costs at most one bit per place. Multi-key AND/OR filtering is then
+integer arithmetic instead of joins through ``place_tags`` and ``relations``,
+and the matching place ids restrict keyword and vector retrieval.
+
+The index is built from the database at startup (:func:`rebuild`) and kept
+current by the process-local "bitmap-index" outbox handler, which reloads the
+keys of every place named in a change event. Ontology keys include every
+ancestor of the related node, so filtering by a parent node matches places
+related to its descendants.
+"""
+
+from __future__ import annotations
+
+import logging
+import uuid
+from collections.abc import Iterable, Sequence
+from dataclasses import dataclass, field
+
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from app.config import settings
+from app.deps import async_session_factory
+from app.models.ontology import OntologyNode, Relation
+from app.models.place import Place
+from app.models.tag import PlaceTag, Tag
+from app.schemas.search import SearchFilters
+from app.services import outbox_service
+from app.services.outbox_service import ChangeEvent
+
+logger = logging.getLogger(__name__)
+
+# 인덱스 키 = (종류, 값). 종류: tag(태그 id) / ontology(노드 id) / mood / situation
+Key = tuple[str, str]
+
+
+@dataclass
+class PlaceBitmapIndex:
+    """Inverted index of place keys; not thread-safe (single event loop)."""
+
+    ordinals: dict[uuid.UUID, int] = field(default_factory=dict)
+    place_ids: list[uuid.UUID | None] = field(default_factory=list)
+    postings: dict[Key, int] = field(default_factory=dict)
+    keys: dict[uuid.UUID, frozenset[Key]] = field(default_factory=dict)
+    live: int = 0
+    _free: list[int] = field(default_factory=list)
+
+    def __len__(self) -> int:
+        return len(self.ordinals)
+
+    def set_place(self, place_id: uuid.UUID, keys: Iterable[Key]) -> None:
+        """Index ``place_id`` under exactly ``keys``, replacing what it had."""
+        keys = frozenset(keys)
+        ordinal = self.ordinals.get(place_id)
+        if ordinal is None:
+            ordinal = self._free.pop() if self._free else len(self.place_ids)
+            if ordinal == len(self.place_ids):
+                self.place_ids.append(place_id)
+            else:
+                self.place_ids[ordinal] = place_id
+            self.ordinals[place_id] = ordinal
+            self.live |= 1 << ordinal
+        previous = self.keys.get(place_id, frozenset())
+        bit = 1 << ordinal
+        for key in previous - keys:
+            self._clear(key, bit)
+        for key in keys - previous:
+            self.postings[key] = self.postings.get(key, 0) | bit
+        self.keys[place_id] = keys
+
+    def remove_place(self, place_id: uuid.UUID) -> None:
+        """Drop ``place_id``; its ordinal is reused by the next new place."""
+        ordinal = self.ordinals.pop(place_id, None)
+        if ordinal is None:
+            return
+        bit = 1 << ordinal
+        for key in self.keys.pop(place_id, frozenset()):
+            self._clear(key, bit)
+        self.live &= ~bit
+        self.place_ids[ordinal] = None
+        self._free.append(ordinal)
+
+    def _clear(self, key: Key, bit: int) -> None:
+        remaining = self.postings.get(key, 0) & ~bit
+        if remaining:
+            self.postings[key] = remaining
+        else:
+            self.postings.pop(key, None)
+
+    def bitmap(self, key: Key) -> int:
+        """Bitmap of the places carrying ``key``."""
+        return self.postings.get(key, 0)
+
+    def all_of(self, keys: Iterable[Key]) -> int:
+        """Places carrying every key (all places for no keys)."""
+        result = self.live
+        for key in keys:
+            result &= self.bitmap(key)
+            if not result:
+                break
+        return result
+
+    def any_of(self, keys: Iterable[Key]) -> int:
+        """Places carrying at least one key."""
+        result = 0
+        for key in keys:
+            result |= self.bitmap(key)
+        return result
+
+    def to_place_ids(self, bitmap: int) -> list[uuid.UUID]:
+        """Place ids of the set bits, in ordinal order."""
+        found = []
+        while bitmap:
+            low = bitmap & -bitmap
+            place_id = self.place_ids[low.bit_length() - 1]
+            if place_id is not None:
+                found.append(place_id)
+            bitmap ^= low
+        return found
+
+
+_index = PlaceBitmapIndex()
+_tag_ids: dict[str, uuid.UUID] = {}
+_ready = False
+# 재구축 중에 바뀐 장소 — 재구축이 끝나면 새 인덱스에 다시 반영한다
+_dirty: set[uuid.UUID] | None = None
+
+
+def is_ready() -> bool:
+    """Whether the startup build has finished (until then callers fall back to SQL)."""
+    return _ready
+
+
+def index() -> PlaceBitmapIndex:
+    """The live index."""
+    return _index
+
+
+async def _load_keys(db: AsyncSession, place_ids: Sequence[uuid.UUID] | None = None) -> dict[uuid.UUID, set[Key]]:
+    """Keys of ``place_ids`` (every place when ``None``); places that no longer exist are absent."""
+    places = select(Place.id, Place.mood, Place.situations)
+    tags = select(PlaceTag.place_id, PlaceTag.tag_id)
+    relations = select(Relation.from_entity_id, Relation.to_entity_id).where(
+        Relation.from_entity_type == "place", Relation.to_entity_type == "ontology_node"
+    )
+    if place_ids is not None:
+        places = places.where(Place.id.in_(place_ids))
+        tags = tags.where(PlaceTag.place_id.in_(place_ids))
+        relations = relations.where(Relation.from_entity_id.in_(place_ids))
+
+    found: dict[uuid.UUID, set[Key]] = {}
+    for place_id, mood, situations in await db.execute(places):
+        keys = found[place_id] = set()
+        keys.update(("mood", value) for value in mood or ())
+        keys.update(("situation", value) for value in situations or ())
+    for place_id, tag_id in await db.execute(tags):
+        if place_id in found:
+            found[place_id].add(("tag", str(tag_id)))
+
+    related = (await db.execute(relations)).all()
+    if related:
+        parents = dict((await db.execute(select(OntologyNode.id, OntologyNode.parent_id))).all())
+        for place_id, node_id in related:
+            if place_id not in found:
+                continue
+            # 상위 노드로 필터링해도 하위 노드에 연결된 장소가 잡히도록 조상까지 넣는다
+            seen: set[uuid.UUID] = set()
+            while node_id is not None and node_id not in seen:
+                seen.add(node_id)
+                found[place_id].add(("ontology", str(node_id)))
+                node_id = parents.get(node_id)
+    return found
+
+
+async def rebuild(session_factory: async_sessionmaker[AsyncSession] = async_session_factory) -> int:
+    """Build a fresh index from the database and swap it in.
+
+    Returns:
+        Number of indexed places.
+    """
+    global _index, _ready, _dirty
+    _dirty = set()
+    try:
+        async with session_factory() as db:
+            keys = await _load_keys(db)
+            tag_ids = dict((await db.execute(select(Tag.name, Tag.id))).all())
+        fresh = PlaceBitmapIndex()
+        for place_id, place_keys in keys.items():
+            fresh.set_place(place_id, place_keys)
+        _index, _ready = fresh, True
+        _tag_ids.clear()
+        _tag_ids.update(tag_ids)
+        dirty = list(_dirty)
+    finally:
+        _dirty = None
+    if dirty:
+        await refresh(dirty, session_factory)
+    return len(fresh)
+
+
+async def warm() -> None:
+    """Startup build; on failure searches keep using the SQL filters."""
+    try:
+        count = await rebuild()
+    except Exception:
+        logger.exception("Bitmap index build failed")
+        return
+    logger.info("Bitmap index built: %d places, %d keys", count, len(_index.postings))
+
+
+async def refresh(
+    place_ids: Sequence[uuid.UUID],
+    session_factory: async_sessionmaker[AsyncSession] = async_session_factory,
+) -> None:
+    """Reload the keys of ``place_ids`` from the database (deleted places are dropped)."""
+    if _dirty is not None:
+        _dirty.update(place_ids)
+    async with session_factory() as db:
+        keys = await _load_keys(db, place_ids)
+    for place_id in place_ids:
+        if place_id in keys:
+            _index.set_place(place_id, keys[place_id])
+        else:
+            _index.remove_place(place_id)
+
+
+def _clean(values: list[str] | None) -> list[str]:
+    return list(dict.fromkeys(value.strip() for value in values or () if value.strip()))
+
+
+def restrict(filters: SearchFilters) -> tuple[list[uuid.UUID] | None, SearchFilters]:
+    """Split ``filters`` into index-served candidates and the rest.
+
+    ``mood``, ``situations`` and ``tags`` (all of them) and ``ontology_nodes``
+    (any of them, descendants included) are answered from the index, with
+    the same meaning as in ``filter_service.compile_filters``.
+
+    Returns:
+        ``(place_ids, residual)``: the candidate places and ``filters``
+        without the fields the candidates already account for. ``place_ids``
+        is ``None`` (and ``residual`` is ``filters``) when the SQL predicate
+        should be used instead: the index is not ready, none of those filters
+        is set, a tag is not indexed yet, or more than
+        ``bitmap_index_max_candidates`` places match.
+    """
+    mood, situations, tags = _clean(filters.mood), _clean(filters.situations), _clean(filters.tags)
+    nodes = list(dict.fromkeys(filters.ontology_nodes or ()))
+    if not _ready or not (mood or situations or tags or nodes):
+        return None, filters
+    keys = [("mood", value) for value in mood] + [("situation", value) for value in situations]
+    for name in tags:
+        tag_id = _tag_ids.get(name)
+        if tag_id is None:
+            # 방금 만든 태그일 수 있다 — 색인이 따라잡기 전에는 SQL 조건으로 찾는다
+            return None, filters
+        keys.append(("tag", str(tag_id)))
+
+    bitmap = _index.all_of(keys)
+    if nodes:
+        bitmap &= _index.any_of(("ontology", str(node_id)) for node_id in nodes)
+    # 후보가 너무 많으면 거대한 id 배열을 바인딩하느니 SQL 조건이 낫다
+    if bitmap.bit_count() > settings.bitmap_index_max_candidates:
+        return None, filters
+    residual = filters.model_copy(update={"mood": None, "situations": None, "tags": None, "ontology_nodes": None})
+    return _index.to_place_ids(bitmap), residual
+
+
+async def _apply_changes(events: Sequence[ChangeEvent]) -> None:
+    if not _ready and _dirty is None:
+        # 구축 전(또는 비활성화) — 시작 시 재구축이 현재 상태를 읽는다
+        return
+    for event in events:
+        if event.entity_type == "tag" and event.entity_id is not None and event.payload:
+            _tag_ids[event.payload["name"]] = event.entity_id
+    # 태그 연결·mood·situations 변경은 place 이벤트로 기록된다
+    place_ids = list(
+        dict.fromkeys(event.place_id for event in events if event.entity_type == "place" and event.place_id)
+    )
+    if place_ids:
+        await refresh(place_ids)
+
+
+outbox_service.register_handler("bitmap-index", _apply_changes)
@@ -0,0 +1,47 @@
+"""Process-local data versions and cache invalidation hooks for places.
+
+Invalidation is driven by the outbox (``outbox_service``'s "cache" handler),
+so every committed change reaches these hooks in every process.
+"""
+
+from __future__ import annotations
+
+import uuid
+from collections.abc import Callable, Iterable
+
+InvalidationListener = Callable[[uuid.UUID], None]
+
+_place_versions: dict[uuid.UUID, int] = {}
+_data_version = 0
+_listeners: list[InvalidationListener] = []
+
+
+def register_invalidation_listener(listener: InvalidationListener) -> None:
+    """Register a callback run whenever a place's derived data becomes stale."""
+    if listener not in _listeners:
+        _listeners.append(listener)
+
+
+def place_version(place_id: uuid.UUID) -> int:
+    """Return the current in-process version of a place."""
+    return _place_versions.get(place_id, 0)
+
+
+def data_version() -> int:
+    """Return a counter bumped on every place invalidation."""
+    return _data_version
+
+
+def invalidate_places(place_ids: Iterable[uuid.UUID]) -> None:
+    """Bump versions for places (or their children) that changed and notify listeners."""
+    global _data_version
+    for place_id in dict.fromkeys(place_ids):
+        _place_versions[place_id] = _place_versions.get(place_id, 0) + 1
+        _data_version += 1
+        for listener in _listeners:
+            listener(place_id)
+
+
+def invalidate_place(place_id: uuid.UUID) -> None:
+    """Shortcut for invalidating a single place."""
+    invalidate_places((place_id,))
@@ -0,0 +1,170 @@
+"""Deterministic comparison tables for the build_comparison_table agent tool."""
+
+from __future__ import annotations
+
+import uuid
+from collections.abc import Callable
+from dataclasses import dataclass
+from datetime import date
+from typing import Any
+
+from sqlalchemy import func, select
+from sqlalchemy.dialects.postgresql import aggregate_order_by
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.sql.elements import ColumnElement
+
+from app.models.place import Place
+from app.models.tag import PlaceTag, Tag
+from app.services import cache_service, visit_stats_service
+from app.utils.cache import TTLCache
+
+
+@dataclass(frozen=True)
+class _Column:
+    """Comparison column: header, SQL expression factory and cell formatter."""
+
+    header: str
+    expression: Callable[[], ColumnElement[Any]]
+    formatter: Callable[[Any], str]
+
+
+def _text(value: Any) -> str:
+    return str(value) if value not in (None, "") else "-"
+
+
+def _bool(value: bool | None) -> str:
+    if value is None:
+        return "-"
+    return "yes" if value else "no"
+
+
+def _list(value: list[str] | None) -> str:
+    return ", ".join(value) if value else "-"
+
+
+def _rating(value: Any) -> str:
+    return f"{float(value):.1f}" if value is not None else "-"
+
+
+def _date(value: date | None) -> str:
+    return value.isoformat() if value is not None else "-"
+
+
+def _tags_expression() -> ColumnElement[Any]:
+    return (
+        select(func.array_agg(aggregate_order_by(Tag.name, Tag.name)))
+        .join(PlaceTag, PlaceTag.tag_id == Tag.id)
+        .where(PlaceTag.place_id == Place.id)
+        .scalar_subquery()
+    )
+
+
+# Visit aggregates are read from the denormalized columns on places.
+COLUMNS: dict[str, _Column] = {
+    "category": _Column(
+        "Category",
+        lambda: func.concat_ws(" / ", Place.category_primary, Place.category_secondary),
+        _text,
+    ),
+    "address": _Column("Address", lambda: func.coalesce(Place.address_road, Place.address_jibun), _text),
+    "region": _Column("Region", lambda: func.concat_ws(" ", Place.region_depth1, Place.region_depth2), _text),
+    "phone": _Column("Phone", lambda: Place.phone, _text),
+    "parking": _Column("Parking", lambda: Place.parking, _bool),
+    "reservation": _Column("Reservation", lambda: Place.reservation, _text),
+    "price_range": _Column("Price", lambda: Place.price_range, _text),
+    "mood": _Column("Mood", lambda: Place.mood, _list),
+    "companions": _Column("Companions", lambda: Place.companions, _list),
+    "situations": _Column("Situations", lambda: Place.situations, _list),
+    "tags": _Column("Tags", _tags_expression, _list),
+    "is_favorite": _Column("Favorite", lambda: Place.is_favorite, _bool),
+    "user_rating": _Column("My rating", lambda: Place.user_rating, _text),
+    "visit_count": _Column("Visits", lambda: Place.visit_count, _text),
+    "last_visit": _Column("Last visit", lambda: Place.last_visited_at, _date),
+    "avg_visit_rating": _Column("Avg visit rating", visit_stats_service.average_rating_expression, _rating),
+}
+
+DEFAULT_COLUMNS = ["category", "region", "price_range", "parking", "mood", "user_rating", "visit_count", "last_visit"]
+
+_table_cache: TTLCache[tuple[Any, ...], str] = TTLCache(maxsize=512, ttl=300)
+
+
+def resolve_columns(columns: list[str] | None) -> list[str]:
+    """Normalize requested column names, falling back to the defaults.
+
+    Raises:
+        ValueError: If a column name is not supported.
+    """
+    if not columns:
+        return list(DEFAULT_COLUMNS)
+    resolved = list(dict.fromkeys(column.strip().lower() for column in columns if column.strip()))
+    unknown = [column for column in resolved if column not in COLUMNS]
+    if unknown:
+        raise ValueError(f"Unsupported columns: {', '.join(unknown)} (supported: {', '.join(COLUMNS)})")
+    return resolved or list(DEFAULT_COLUMNS)
+
+
+def _escape(cell: str) -> str:
+    return cell.replace("|", "\\|").replace("\n", " ")
+
+
+async def _fetch_feature_rows(
+    db: AsyncSession,
+    place_ids: list[uuid.UUID],
+    columns: list[str],
+) -> dict[uuid.UUID, list[Any]]:
+    """Fetch name plus every requested column for all places in one statement."""
+    expressions = [COLUMNS[column].expression().label(column) for column in columns]
+    stmt = select(Place.id, Place.canonical_name, *expressions).where(Place.id.in_(place_ids))
+
+    rows = (await db.execute(stmt)).all()
+    return {row[0]: list(row[1:]) for row in rows}
+
+
+def _render(columns: list[str], place_ids: list[uuid.UUID], rows: dict[uuid.UUID, list[Any]]) -> str:
+    headers = ["Place", *(COLUMNS[column].header for column in columns)]
+    lines = ["| " + " | ".join(headers) + " |", "|" + "---|" * len(headers)]
+    for place_id in place_ids:
+        name, *values = rows[place_id]
+        cells = [_escape(name), *(_escape(COLUMNS[c].formatter(v)) for c, v in zip(columns, values, strict=True))]
+        lines.append("| " + " | ".join(cells) + " |")
+    return "\n".join(lines)
+
+
+async def build_comparison_table(
+    db: AsyncSession,
+    place_ids: list[uuid.UUID],
+    columns: list[str] | None = None,
+) -> tuple[str, list[str]]:
+    """Render a Markdown comparison table without calling the LLM.
+
+    Rendered tables are memoized by (place_ids, columns, place versions), so
+    repeated agent calls for unchanged places skip the database entirely.
+
+    Args:
+        db: Async database session.
+        place_ids: Places to compare, in row order. Duplicates are ignored.
+        columns: Column names from ``COLUMNS``. Defaults to ``DEFAULT_COLUMNS``.
+
+    Returns:
+        Tuple of (markdown, resolved column names).
+
+    Raises:
+        ValueError: If an unsupported column is requested.
+        LookupError: If any place id does not exist.
+    """
+    resolved = resolve_columns(columns)
+    unique_ids = list(dict.fromkeys(place_ids))
+
+    key = (tuple(unique_ids), tuple(resolved), tuple(cache_service.place_version(pid) for pid in unique_ids))
+    cached = _table_cache.get(key)
+    if cached is not None:
+        return cached, resolved
+
+    rows = await _fetch_feature_rows(db, unique_ids, resolved)
+    missing = [str(place_id) for place_id in unique_ids if place_id not in rows]
+    if missing:
+        raise LookupError(f"Places not found: {', '.join(missing)}")
+
+    markdown = _render(resolved, unique_ids, rows)
+    _table_cache.set(key, markdown)
+    return markdown, resolved
@@ -9,7 +9,6 @@ from sqlalchemy import delete, func, literal, or_, select, update
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import selectinload
 
-from app.models.audit import AuditLog
 from app.models.media import Media
 from app.models.note import Note
 from app.models.place import Place, ProviderLink
@@ -17,7 +16,8 @@ from app.models.source import Source
 from app.models.tag import PlaceTag
 from app.models.visit import Visit
 from app.schemas.place import DuplicateCandidate
-from app.utils.text_normalize import normalize_phone, normalize_place_name
+from app.services import audit_service, outbox_service, visit_stats_service
+from app.utils.text_normalize import normalize_phone, normalize_phones, normalize_place_name
 
 
 async def check_duplicates(
@@ -54,9 +54,10 @@ async def check_duplicates(
         stmt = stmt.where(Place.id != exclude_place_id)
 
     rows = (await db.execute(stmt)).all()
+    candidate_phones = normalize_phones([place.phone or "" for place, _, _ in rows]) if normalized_phone else []
 
     candidates: list[DuplicateCandidate] = []
-    for place, sim, is_near in rows:
+    for index, (place, sim, is_near) in enumerate(rows):
         score = 0.0
         has_strong_signal = False
         reasons: list[str] = []
@@ -69,7 +70,7 @@ async def check_duplicates(
                 reasons.append("high_name_similarity_bonus")
                 has_strong_signal = True
 
-        if normalized_phone and place.phone and normalize_phone(place.phone) == normalized_phone:
+        if normalized_phone and candidate_phones[index] == normalized_phone:
             score += 0.4
             reasons.append("phone_match")
             has_strong_signal = True
@@ -97,10 +98,8 @@ async def merge_places(db: AsyncSession, keep_id: uuid.UUID, merge_id: uuid.UUID
     if keep_id == merge_id:
         raise ValueError("keep_id and merge_id must be different")
 
-    keep_place = await db.get(Place, keep_id)
-    merge_place = await db.get(Place, merge_id)
-
-    if keep_place is None or merge_place is None:
+    found = (await db.scalars(select(Place.id).where(Place.id.in_([keep_id, merge_id])))).all()
+    if len(found) < 2:
         return None
 
     keep_tag_ids_subquery = select(PlaceTag.tag_id).where(PlaceTag.place_id == keep_id)
@@ -113,29 +112,23 @@ async def merge_places(db: AsyncSession, keep_id: uuid.UUID, merge_id: uuid.UUID
         await db.execute(update(model).where(model.place_id == merge_id).values(place_id=keep_id))
 
     await db.execute(update(PlaceTag).where(PlaceTag.place_id == merge_id).values(place_id=keep_id))
+    await visit_stats_service.merge_stats(db, keep_id, merge_id)
 
-    await db.delete(merge_place)
-
-    db.add(
-        AuditLog(
-            action="merge",
-            entity_type="place",
-            entity_id=keep_id,
-            detail={"keep_id": str(keep_id), "merge_id": str(merge_id)},
-        )
-    )
+    # 자식은 모두 옮겼으므로 ORM cascade 없이 한 문장으로 지운다
+    await db.execute(delete(Place).where(Place.id == merge_id))
 
-    await db.commit()
+    outbox_service.record_change(db, "place", "merge", keep_id, payload={"merge_id": str(merge_id)})
+    outbox_service.record_change(db, "place", "delete", merge_id, payload={"merged_into": str(keep_id)})
+    await outbox_service.commit(db)
+    audit_service.record("merge", "place", keep_id, {"keep_id": str(keep_id), "merge_id": str(merge_id)})
 
     stmt = (
         select(Place)
         .options(
             selectinload(Place.provider_links),
             selectinload(Place.tags),
-            selectinload(Place.sources),
-            selectinload(Place.notes),
-            selectinload(Place.visits),
         )
         .where(Place.id == keep_id)
+        .execution_options(populate_existing=True)
     )
     return (await db.execute(stmt)).scalar_one_or_none()
@@ -0,0 +1,784 @@
+"""Embeddings — entity text, vector writes, nearest-neighbour search and model migration.
+
+Search always reads ``embeddings``. Moving to another embedding model runs as
+a re-embedding job instead of rewriting that table in place:
+
+1. :func:`start_reembed` creates ``embeddings_shadow`` with the target model's
+   vector dimension and a ``reembed_jobs`` row holding progress.
+2. :func:`run_reembed` fills the shadow table in throttled keyset batches,
+   saving the cursor with every batch so an interrupted job resumes where it
+   stopped. It then re-embeds rows whose live embedding changed meanwhile
+   (the live ``text_hash`` no longer matches the one seen when the shadow row
+   was embedded) and builds the shadow's HNSW indexes.
+3. :func:`cutover` swaps the tables by rename in one transaction, and only once
+   every live row has an up-to-date shadow row.
+
+Until cutover, search keeps using the old model's vectors. Afterwards every
+new statement sees the new ones. The old table stays as ``embeddings_retired``
+until the next cutover, for rollback.
+
+Each entity type has its own partial HNSW index (``idx_embeddings_vector_<type>``),
+so a search restricted to one type walks only that type's graph instead of
+post-filtering a shared top-k. A search over all types queries the per-type
+indexes concurrently and merges the hits by distance.
+
+The indexes can be built over a quantized expression of the full-precision
+column (:data:`INDEX_TYPES`): ``halfvec`` halves index memory at nearly the
+same recall, ``bit`` (binary quantization, Hamming distance) shrinks it ~32x
+and relies on re-ranking a candidate pool. Either way candidates are re-ranked
+by exact distance on the stored vectors. :func:`rebuild_vector_index` switches
+the type online and search detects it from the catalog.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import hashlib
+import heapq
+import itertools
+import re
+import uuid
+from collections.abc import Sequence
+from dataclasses import dataclass
+from typing import Any
+
+from pgvector.sqlalchemy import BIT, HALFVEC, Vector
+from sqlalchemy import (
+    Column,
+    ColumnElement,
+    DateTime,
+    MetaData,
+    Select,
+    String,
+    Table,
+    Text,
+    and_,
+    any_,
+    bindparam,
+    cast,
+    delete,
+    func,
+    literal,
+    or_,
+    select,
+    text,
+    tuple_,
+)
+from sqlalchemy.dialects.postgresql import ARRAY, UUID, insert
+from sqlalchemy.exc import DBAPIError
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, async_sessionmaker
+
+from app.config import settings
+from app.deps import async_session_factory, engine
+from app.llm.embedder import BaseEmbedder, get_embedder
+from app.models.embedding import Embedding, ReembedJob
+from app.models.note import Note
+from app.models.place import Place
+from app.models.source import Source
+from app.schemas.search import SearchFilters
+from app.services import bitmap_index_service, filter_service, outbox_service
+from app.services.outbox_service import ChangeEvent
+
+ENTITY_TYPES = ("place", "note", "source")
+# 검색 요청 종류별 recall/지연 프로필 — settings.hnsw_ef_search_<class>
+REQUEST_CLASSES = ("interactive", "agent", "batch")
+# HNSW 인덱스 표현식 — 원본 vector / halfvec 캐스트 / 이진 양자화 (모두 원본 벡터로 재정렬)
+INDEX_TYPES = ("vector", "halfvec", "bit")
+_INDEX_OPS = {"vector": "vector_cosine_ops", "halfvec": "halfvec_cosine_ops", "bit": "bit_hamming_ops"}
+_INDEXED_TYPMOD = re.compile(r"::(halfvec|bit)\(\d+\)")
+
+_MODEL_NAME = re.compile(r"^[A-Za-z0-9._:-]{1,64}$")
+# pgvector HNSW 인덱스가 지원하는 vector 최대 차원
+_MAX_INDEXED_DIMENSIONS = 2000
+
+# 작업마다 차원이 달라 런타임 DDL로 만드는 테이블 — Alembic 메타데이터와 분리한다
+_shadow = Table(
+    "embeddings_shadow",
+    MetaData(),
+    Column("id", UUID(as_uuid=True), primary_key=True),
+    Column("entity_type", String(16)),
+    Column("entity_id", UUID(as_uuid=True)),
+    Column("vector", Vector()),
+    Column("model", String(64)),
+    Column("text_hash", Text),
+    Column("source_hash", Text),
+    Column("updated_at", DateTime(timezone=True)),
+)
+
+_SHADOW_DDL = """
+CREATE TABLE embeddings_shadow (
+    id uuid NOT NULL DEFAULT uuid_generate_v4(),
+    entity_type varchar(16) NOT NULL,
+    entity_id uuid NOT NULL,
+    vector vector({dimensions}) NOT NULL,
+    model varchar(64) NOT NULL DEFAULT '{model}',
+    text_hash text,
+    source_hash text,
+    created_at timestamptz NOT NULL DEFAULT now(),
+    updated_at timestamptz NOT NULL DEFAULT now(),
+    CONSTRAINT embeddings_shadow_pkey PRIMARY KEY (id),
+    CONSTRAINT uq_embeddings_shadow_entity_type_entity_id UNIQUE (entity_type, entity_id),
+    CONSTRAINT ck_embeddings_shadow_entity_type CHECK (entity_type IN ('place', 'note', 'source'))
+)
+"""
+_CONSTRAINTS = ("{table}_pkey", "uq_{table}_entity_type_entity_id", "ck_{table}_entity_type")
+_INDEX_TABLE = re.compile(r" ON (\S+\.)?embeddings ")
+
+# 프로세스별 활성 모델·인덱스 타입 캐시 — cutover/reindex 이벤트를 받으면 비운다
+_active: tuple[str, int] | None = None
+_index_type: str | None = None
+
+
+@dataclass(frozen=True)
+class SearchHit:
+    """One nearest-neighbour result (cosine distance, lower is closer)."""
+
+    entity_type: str
+    entity_id: uuid.UUID
+    distance: float
+
+
+def text_hash(value: str) -> str:
+    """Stable hash of the text an embedding was computed from."""
+    return hashlib.sha256(value.encode("utf-8")).hexdigest()
+
+
+async def entity_texts(db: AsyncSession, entity_type: str, ids: Sequence[uuid.UUID]) -> dict[uuid.UUID, str]:
+    """Build the text embedded for each entity; deleted entities are absent.
+
+    Args:
+        db: Async database session.
+        entity_type: "place", "note" or "source".
+        ids: Entity ids.
+
+    Returns:
+        Mapping of entity id to embedding text.
+    """
+    if not ids:
+        return {}
+    if entity_type == "place":
+        rows = await db.execute(
+            select(
+                Place.id,
+                Place.canonical_name,
+                Place.category_primary,
+                Place.category_secondary,
+                Place.region_depth1,
+                Place.region_depth2,
+                Place.mood,
+                Place.situations,
+                Place.companions,
+            ).where(Place.id.in_(ids))
+        )
+        return {
+            row.id: " ".join(
+                part
+                for part in (
+                    row.canonical_name,
+                    row.category_primary,
+                    row.category_secondary,
+                    row.region_depth1,
+                    row.region_depth2,
+                    *(row.mood or ()),
+                    *(row.situations or ()),
+                    *(row.companions or ()),
+                )
+                if part
+            )
+            for row in rows
+        }
+    if entity_type == "note":
+        rows = await db.execute(select(Note.id, Note.content).where(Note.id.in_(ids)))
+        return {row.id: row.content for row in rows}
+    if entity_type == "source":
+        rows = await db.execute(select(Source.id, Source.title, Source.snippet).where(Source.id.in_(ids)))
+        return {row.id: " ".join(part for part in (row.title, row.snippet) if part) for row in rows}
+    raise ValueError(f"Unknown entity_type: {entity_type}")
+
+
+async def active_model(db: AsyncSession) -> tuple[str, int]:
+    """(model, dimensions) of the vectors currently in ``embeddings``."""
+    global _active
+    if _active is None:
+        row = (
+            await db.execute(
+                select(ReembedJob.target_model, ReembedJob.dimensions)
+                .where(ReembedJob.status == "completed")
+                .order_by(ReembedJob.completed_at.desc())
+                .limit(1)
+            )
+        ).one_or_none()
+        _active = (
+            (row.target_model, row.dimensions) if row else (settings.embedding_model, settings.embedding_dimensions)
+        )
+    return _active
+
+
+async def index_type(db: AsyncSession) -> str:
+    """Expression the live HNSW indexes are built over (one of ``INDEX_TYPES``)."""
+    global _index_type
+    if _index_type is None:
+        definition = await db.scalar(
+            text(
+                "SELECT indexdef FROM pg_indexes WHERE schemaname = current_schema() "
+                "AND tablename = 'embeddings' AND indexname = 'idx_embeddings_vector_place'"
+            )
+        )
+        _index_type = next(
+            (kind for kind, ops in _INDEX_OPS.items() if definition and ops in definition),
+            "vector",
+        )
+    return _index_type
+
+
+async def upsert_embeddings(
+    db: AsyncSession,
+    entity_type: str,
+    ids: Sequence[uuid.UUID],
+    embedder: BaseEmbedder | None = None,
+) -> int:
+    """Embed entities whose text changed and write them to ``embeddings``.
+
+    Rows of deleted entities are removed. The caller owns the transaction.
+
+    Returns:
+        Number of vectors written.
+    """
+    texts = await entity_texts(db, entity_type, ids)
+    gone = [entity_id for entity_id in ids if entity_id not in texts]
+    if gone:
+        await db.execute(delete(Embedding).where(Embedding.entity_type == entity_type, Embedding.entity_id.in_(gone)))
+
+    embedder = embedder or get_embedder(*await active_model(db))
+    current = dict(
+        (
+            await db.execute(
+                select(Embedding.entity_id, Embedding.text_hash).where(
+                    Embedding.entity_type == entity_type,
+                    Embedding.entity_id.in_(list(texts)),
+                    Embedding.model == embedder.model,
+                )
+            )
+        ).all()
+    )
+    hashes = {entity_id: text_hash(value) for entity_id, value in texts.items()}
+    changed = [entity_id for entity_id, digest in hashes.items() if current.get(entity_id) != digest]
+    if not changed:
+        return 0
+
+    vectors = await embedder.embed([texts[entity_id] for entity_id in changed])
+    stmt = insert(Embedding).values(
+        [
+            {
+                "entity_type": entity_type,
+                "entity_id": entity_id,
+                "vector": vector,
+                "model": embedder.model,
+                "text_hash": hashes[entity_id],
+            }
+            for entity_id, vector in zip(changed, vectors, strict=True)
+        ]
+    )
+    await db.execute(
+        stmt.on_conflict_do_update(
+            constraint="uq_embeddings_entity_type_entity_id",
+            set_={
+                "vector": stmt.excluded.vector,
+                "model": stmt.excluded.model,
+                "text_hash": stmt.excluded.text_hash,
+                "updated_at": func.now(),
+            },
+        )
+    )
+    return len(changed)
+
+
+def ef_search_for(request_class: str) -> int:
+    """HNSW ``ef_search`` for a request class (see ``REQUEST_CLASSES``).
+
+    Raises:
+        ValueError: Unknown request class.
+    """
+    if request_class not in REQUEST_CLASSES:
+        raise ValueError(f"Unknown request class: {request_class}")
+    return getattr(settings, f"hnsw_ef_search_{request_class}")
+
+
+async def search(
+    db: AsyncSession,
+    query: str,
+    entity_type: str | None = None,
+    limit: int = 10,
+    request_class: str = "interactive",
+    rerank: bool | None = None,
+    session_factory: async_sessionmaker[AsyncSession] = async_session_factory,
+    place_ids: Sequence[uuid.UUID] | None = None,
+    filters: SearchFilters | None = None,
+) -> list[SearchHit]:
+    """Nearest neighbours of ``query`` by cosine distance.
+
+    The query is embedded with the active model. If another process cut over
+    to a new model since this one cached it, the cache is refreshed and the
+    search retried once.
+
+    Args:
+        db: Async database session.
+        query: Query text.
+        entity_type: Search only this type's partial index. ``None`` searches
+            every type concurrently, one pooled connection per type, and
+            merges the hits by distance.
+        limit: Number of hits.
+        request_class: Recall/latency profile; picks ``hnsw.ef_search``.
+        rerank: Fetch ``vector_rerank_candidates`` ANN candidates and order
+            them by exact distance. Defaults to ``settings.vector_rerank``.
+        session_factory: Sessions for the fan-out over entity types.
+        place_ids: Only return places in this set, or notes and sources of
+            those places.
+        filters: PRD filter object, applied the same way (attribute filters
+            come from ``bitmap_index_service.restrict`` candidates, the rest
+            from ``filter_service.compile_filters``). When the allowed places
+            are a known list of at most ``vector_prefilter_exact_max``, they
+            are searched exactly without the HNSW index; otherwise the index
+            scan is filtered.
+
+    Raises:
+        ValueError: Unknown entity type or request class, or inconsistent filters.
+    """
+    global _active
+    if entity_type is not None and entity_type not in ENTITY_TYPES:
+        raise ValueError(f"Unknown entity type: {entity_type}")
+    if filters is not None:
+        candidates, filters = bitmap_index_service.restrict(filters)
+        if candidates is not None:
+            place_ids = candidates if place_ids is None else list(set(candidates).intersection(place_ids))
+    if place_ids is not None and not place_ids:
+        return []
+    places, exact = _allowed_places(place_ids, filters)
+    ef_search = ef_search_for(request_class)
+    indexed = await index_type(db)
+    # 이진 양자화 인덱스의 해밍 거리 순서는 거칠어서 항상 후보 풀을 재정렬한다
+    rerank = indexed == "bit" or (settings.vector_rerank if rerank is None else rerank)
+    candidates = max(limit, settings.vector_rerank_candidates) if rerank else limit
+
+    async def nearest(session: AsyncSession, vector: list[float], model: str, kind: str) -> list[SearchHit]:
+        # HNSW 스캔은 ef_search개까지만 후보를 돌려주므로 후보 수 이상으로 맞춘다
+        await session.execute(select(func.set_config("hnsw.ef_search", str(max(ef_search, candidates)), True)))
+        rows = await session.execute(_nearest(vector, model, kind, limit, candidates, indexed, places, exact))
+        return [SearchHit(row.entity_type, row.entity_id, float(row.distance)) for row in rows]
+
+    async def fan_out(vector: list[float], model: str, kind: str) -> list[SearchHit]:
+        async with session_factory() as session:
+            return await nearest(session, vector, model, kind)
+
+    async def attempt(model: tuple[str, int]) -> list[SearchHit]:
+        [vector] = await get_embedder(*model).embed([query])
+        if entity_type is not None:
+            return await nearest(db, vector, model[0], entity_type)
+        per_type = await asyncio.gather(*(fan_out(vector, model[0], kind) for kind in ENTITY_TYPES))
+        return heapq.nsmallest(limit, itertools.chain.from_iterable(per_type), key=lambda hit: hit.distance)
+
+    model = await active_model(db)
+    try:
+        hits = await attempt(model)
+    except DBAPIError:
+        # 차원이 바뀐 cutover 직후라면 벡터 차원 불일치로 실패한다
+        await db.rollback()
+        _active = None
+        if await active_model(db) == model:
+            raise
+        return await attempt(await active_model(db))
+    if hits:
+        return hits
+
+    _active = None
+    fresh = await active_model(db)
+    return hits if fresh == model else await attempt(fresh)
+
+
+def _nearest(
+    vector: Sequence[float],
+    model: str,
+    entity_type: str,
+    limit: int,
+    candidates: int,
+    indexed: str = "vector",
+    places: Select[Any] | None = None,
+    exact: bool = False,
+) -> Select[Any]:
+    distance = _index_distance(vector, indexed)
+    # 부분 인덱스 조건과 맞춰 보려면 플래너가 값을 알아야 하므로 리터럴로 렌더링한다 (generic plan 대비)
+    kind = bindparam("entity_type", entity_type, literal_execute=True)
+    ann = select(Embedding.entity_type, Embedding.entity_id).where(
+        Embedding.model == model, Embedding.entity_type == kind
+    )
+    if places is not None:
+        ann = ann.where(_of_places(entity_type, places))
+        if exact:
+            # 후보가 적으면 HNSW 후필터(재현율 저하) 대신 후보 행만 정확한 거리로 정렬한다
+            rows = ann.add_columns(Embedding.vector).cte("restricted").prefix_with("MATERIALIZED")
+            distance_col = rows.c.vector.cosine_distance(vector).label("distance")
+            return select(rows.c.entity_type, rows.c.entity_id, distance_col).order_by(distance_col).limit(limit)
+    if candidates <= limit and indexed == "vector":
+        ranked = distance.label("distance")
+        return ann.add_columns(ranked).order_by(ranked).limit(limit)
+
+    # 인덱스 스캔으로 후보만 뽑고, 바깥 쿼리에서 정확한 거리로 다시 정렬한다
+    pool = ann.add_columns(Embedding.vector).order_by(distance).limit(candidates).subquery()
+    distance_col = pool.c.vector.cosine_distance(vector).label("distance")
+    return select(pool.c.entity_type, pool.c.entity_id, distance_col).order_by(distance_col).limit(limit)
+
+
+def _allowed_places(
+    place_ids: Sequence[uuid.UUID] | None, filters: SearchFilters | None
+) -> tuple[Select[Any] | None, bool]:
+    """(ids of the places hits may belong to, whether few enough to search exactly); ``None`` if unrestricted."""
+    if place_ids is None and filters is None:
+        return None, False
+    places = select(Place.id).where(filter_service.compile_filters(filters))
+    if place_ids is None:
+        return places, False
+    ids = bindparam("place_ids", list(place_ids), type_=ARRAY(UUID(as_uuid=True)))
+    return places.where(Place.id == any_(ids)), len(place_ids) <= settings.vector_prefilter_exact_max
+
+
+def _of_places(entity_type: str, places: Select[Any]) -> ColumnElement[bool]:
+    if entity_type == "place":
+        return Embedding.entity_id.in_(places)
+    owner = Note if entity_type == "note" else Source
+    return Embedding.entity_id.in_(select(owner.id).where(owner.place_id.in_(places)))
+
+
+def _index_distance(vector: Sequence[float], indexed: str) -> ColumnElement[Any]:
+    # 인덱스 표현식과 정확히 같은 식이어야 플래너가 HNSW 인덱스를 쓴다
+    dimensions = len(vector)
+    if indexed == "halfvec":
+        return cast(Embedding.vector, HALFVEC(dimensions)).cosine_distance(vector)
+    if indexed == "bit":
+        # binary_quantize는 vector/halfvec 오버로드가 있어 인자 타입을 명시한다
+        query_vector = cast(literal(list(vector), Vector(dimensions)), Vector(dimensions))
+        query = cast(func.binary_quantize(query_vector), BIT(dimensions))
+        return cast(func.binary_quantize(Embedding.vector), BIT(dimensions)).hamming_distance(query)
+    return Embedding.vector.cosine_distance(vector)
+
+
+def _index_expression(indexed: str, dimensions: int) -> str:
+    if indexed == "halfvec":
+        return f"((vector::halfvec({dimensions:d})) halfvec_cosine_ops)"
+    if indexed == "bit":
+        return f"((binary_quantize(vector)::bit({dimensions:d})) bit_hamming_ops)"
+    return "(vector vector_cosine_ops)"
+
+
+async def rebuild_vector_index(
+    m: int | None = None,
+    ef_construction: int | None = None,
+    maintenance_work_mem: str | None = None,
+    indexed: str | None = None,
+    bind: AsyncEngine = engine,
+) -> None:
+    """Rebuild the per-type HNSW indexes with new build parameters without blocking search.
+
+    Each new index is built with ``CREATE INDEX CONCURRENTLY`` next to the old
+    one, then all are swapped in by drop and rename in one short transaction.
+    The swap is announced through the outbox, so every process's search
+    switches to the new index expression.
+
+    Args:
+        m: HNSW max connections per layer.
+        ef_construction: HNSW build candidate list size.
+        maintenance_work_mem: Session setting for the build, e.g. ``1GB``.
+        indexed: Index expression, one of ``INDEX_TYPES`` (default
+            ``settings.vector_index_type``).
+        bind: Engine to run the DDL on.
+
+    Raises:
+        ValueError: Parameters outside what pgvector accepts.
+    """
+    global _index_type
+    m = m or settings.hnsw_m
+    ef_construction = ef_construction or settings.hnsw_ef_construction
+    indexed = indexed or settings.vector_index_type
+    if not 2 <= m <= 100:
+        raise ValueError("m must be between 2 and 100")
+    if not 2 * m <= ef_construction <= 1000:
+        raise ValueError("ef_construction must be between 2 * m and 1000")
+    if indexed not in INDEX_TYPES:
+        raise ValueError(f"Unknown index type: {indexed}")
+
+    async with bind.connect() as conn:
+        conn = await conn.execution_options(isolation_level="AUTOCOMMIT")
+        # vector(n)의 typmod가 곧 차원 수
+        dimensions = await conn.scalar(
+            text("SELECT atttypmod FROM pg_attribute WHERE attrelid = 'embeddings'::regclass AND attname = 'vector'")
+        )
+        expression = _index_expression(indexed, dimensions)
+        if maintenance_work_mem:
+            await conn.execute(select(func.set_config("maintenance_work_mem", maintenance_work_mem, False)))
+        for entity_type in ENTITY_TYPES:
+            await conn.execute(text(f"DROP INDEX CONCURRENTLY IF EXISTS idx_embeddings_vector_{entity_type}_rebuild"))
+            await conn.execute(
+                text(
+                    f"CREATE INDEX CONCURRENTLY idx_embeddings_vector_{entity_type}_rebuild ON embeddings "
+                    f"USING hnsw {expression} WITH (m = {m:d}, ef_construction = {ef_construction:d}) "
+                    f"WHERE entity_type = '{entity_type}'"
+                )
+            )
+    async with AsyncSession(bind) as db:
+        for entity_type in ENTITY_TYPES:
+            index = f"idx_embeddings_vector_{entity_type}"
+            await db.execute(text(f"DROP INDEX IF EXISTS {index}"))
+            await db.execute(text(f"ALTER INDEX {index}_rebuild RENAME TO {index}"))
+        outbox_service.record_change(db, "embedding", "reindex", None, payload={"index_type": indexed, "m": m})
+        await outbox_service.commit(db)
+    _index_type = None
+
+
+async def start_reembed(db: AsyncSession, model: str, dimensions: int) -> ReembedJob:
+    """Create the shadow table and a job for re-embedding everything with ``model``.
+
+    Raises:
+        ValueError: Invalid model/dimensions, or a job is already running.
+    """
+    if not _MODEL_NAME.match(model):
+        raise ValueError(f"Invalid embedding model name: {model!r}")
+    if not 1 <= dimensions <= _MAX_INDEXED_DIMENSIONS:
+        raise ValueError(f"dimensions must be between 1 and {_MAX_INDEXED_DIMENSIONS}")
+    running = await db.scalar(select(ReembedJob.id).where(ReembedJob.status == "running").limit(1))
+    if running is not None:
+        raise ValueError(f"Re-embedding job {running} is already running")
+
+    await db.execute(text("DROP TABLE IF EXISTS embeddings_shadow"))
+    await db.execute(text(_SHADOW_DDL.format(dimensions=dimensions, model=model)))
+    job = ReembedJob(target_model=model, dimensions=dimensions)
+    db.add(job)
+    await db.commit()
+    await db.refresh(job)
+    return job
+
+
+async def coverage(db: AsyncSession) -> tuple[int, int]:
+    """(up-to-date shadow rows, live rows) for the running job."""
+    total = await db.scalar(select(func.count()).select_from(Embedding)) or 0
+    stale = await db.scalar(select(func.count()).select_from(_stale_keys().subquery())) or 0
+    return total - stale, total
+
+
+async def run_reembed(
+    job_id: uuid.UUID,
+    embedder: BaseEmbedder | None = None,
+    batch_size: int | None = None,
+    interval: float | None = None,
+    session_factory: async_sessionmaker[AsyncSession] = async_session_factory,
+) -> ReembedJob:
+    """Backfill, catch up and cut over a running job; resumable after interruption.
+
+    Args:
+        job_id: Job created by :func:`start_reembed`.
+        embedder: Embedder for the target model (built from the job by default).
+        batch_size: Rows per embedding call and commit.
+        interval: Seconds to sleep between batches (rate limiting).
+        session_factory: Session factory for the job's transactions.
+
+    Returns:
+        The completed job.
+    """
+    batch_size = batch_size or settings.reembed_batch_size
+    interval = interval if interval is not None else settings.reembed_interval_seconds
+    async with session_factory() as db:
+        job = await db.get(ReembedJob, job_id)
+        if job is None or job.status != "running":
+            raise ValueError(f"Re-embedding job {job_id} is not running")
+        embedder = embedder or get_embedder(job.target_model, job.dimensions)
+        if (embedder.model, embedder.dimensions) != (job.target_model, job.dimensions):
+            raise ValueError("Embedder does not match the job's target model")
+        # source_hash 컬럼이 생기기 전에 시작된 작업도 이어서 진행할 수 있게 한다
+        await db.execute(text("ALTER TABLE embeddings_shadow ADD COLUMN IF NOT EXISTS source_hash text"))
+
+        # 1) keyset 백필 — 배치마다 커서를 같은 트랜잭션에서 저장해 중단 후 이어서 진행
+        while True:
+            stmt = (
+                select(Embedding.entity_type, Embedding.entity_id)
+                .order_by(Embedding.entity_type, Embedding.entity_id)
+                .limit(batch_size)
+            )
+            if job.cursor_entity_type is not None:
+                stmt = stmt.where(
+                    tuple_(Embedding.entity_type, Embedding.entity_id)
+                    > tuple_(job.cursor_entity_type, job.cursor_entity_id)
+                )
+            keys = (await db.execute(stmt)).all()
+            if not keys:
+                break
+            job.embedded += await _embed_into_shadow(db, embedder, keys)
+            job.cursor_entity_type, job.cursor_entity_id = keys[-1]
+            await db.commit()
+            await asyncio.sleep(interval)
+
+        # 2) 백필 중 바뀐 행을 따라잡고, 인덱스를 만든 뒤 전환
+        while True:
+            keys = (await db.execute(_stale_keys().limit(batch_size))).all()
+            if keys:
+                job.embedded += await _embed_into_shadow(db, embedder, keys)
+                await db.commit()
+                await asyncio.sleep(interval)
+                continue
+            await _build_shadow_indexes(db, job.dimensions)
+            if await cutover(db, job):
+                return job
+
+
+async def cutover(db: AsyncSession, job: ReembedJob) -> bool:
+    """Swap ``embeddings_shadow`` in for ``embeddings`` if coverage is 100%.
+
+    Both tables are locked, so the coverage check and the rename happen
+    atomically with respect to writers and readers.
+
+    Returns:
+        False (nothing changed) if some live row is still stale.
+    """
+    await db.execute(text("LOCK TABLE embeddings, embeddings_shadow IN ACCESS EXCLUSIVE MODE"))
+    if (await db.execute(_stale_keys().limit(1))).first() is not None:
+        await db.rollback()
+        await db.refresh(job)
+        return False
+
+    live = select(Embedding.id).where(
+        Embedding.entity_type == _shadow.c.entity_type, Embedding.entity_id == _shadow.c.entity_id
+    )
+    await db.execute(delete(_shadow).where(~live.exists()))
+    # 추적용 컬럼은 라이브 스키마에 없다
+    await db.execute(text("ALTER TABLE embeddings_shadow DROP COLUMN source_hash"))
+    await db.execute(text("DROP TABLE IF EXISTS embeddings_retired"))
+    await _rename_table(db, "embeddings", "embeddings_retired")
+    await _rename_table(db, "embeddings_shadow", "embeddings")
+
+    job.status = "completed"
+    job.completed_at = func.now()
+    outbox_service.record_change(
+        db, "embedding", "cutover", None, payload={"model": job.target_model, "dimensions": job.dimensions}
+    )
+    await outbox_service.commit(db)
+    await db.refresh(job)
+    return True
+
+
+async def cancel_reembed(db: AsyncSession, job: ReembedJob) -> None:
+    """Abandon a running job and drop its shadow table."""
+    await db.execute(text("DROP TABLE IF EXISTS embeddings_shadow"))
+    job.status = "cancelled"
+    await db.commit()
+
+
+def _stale_keys() -> Select[Any]:
+    # 섀도 행이 없거나, 섀도를 만들 때 본 라이브 text_hash와 지금 라이브 text_hash가 다른 경우.
+    # 타임스탬프는 쓰지 않는다 — 라이브 updated_at은 트랜잭션 시작 시각(now())이라 섀도 읽기보다
+    # 먼저 시작해 나중에 커밋한 쓰기를 놓친다.
+    return (
+        select(Embedding.entity_type, Embedding.entity_id)
+        .outerjoin(
+            _shadow,
+            and_(_shadow.c.entity_type == Embedding.entity_type, _shadow.c.entity_id == Embedding.entity_id),
+        )
+        .where(or_(_shadow.c.id.is_(None), _shadow.c.source_hash.is_distinct_from(Embedding.text_hash)))
+    )
+
+
+async def _embed_into_shadow(db: AsyncSession, embedder: BaseEmbedder, keys: Sequence[tuple[str, uuid.UUID]]) -> int:
+    written = 0
+    for entity_type in ENTITY_TYPES:
+        ids = [entity_id for key_type, entity_id in keys if key_type == entity_type]
+        if not ids:
+            continue
+        # 텍스트보다 먼저 읽는다 — 이후 커밋된 라이브 쓰기는 text_hash가 달라져 stale로 잡힌다
+        # (라이브 행 자체가 텍스트보다 뒤처져 있어도 같은 행을 계속 다시 임베딩하지 않는다)
+        live_hashes = dict(
+            (
+                await db.execute(
+                    select(Embedding.entity_id, Embedding.text_hash).where(
+                        Embedding.entity_type == entity_type, Embedding.entity_id.in_(ids)
+                    )
+                )
+            ).all()
+        )
+        texts = await entity_texts(db, entity_type, ids)
+        orphans = [entity_id for entity_id in ids if entity_id not in texts]
+        if orphans:
+            # 원본 엔티티가 삭제된 임베딩은 옮길 대상이 아니다
+            await db.execute(
+                delete(Embedding).where(Embedding.entity_type == entity_type, Embedding.entity_id.in_(orphans))
+            )
+        if not texts:
+            continue
+
+        vectors = await embedder.embed(list(texts.values()))
+        stmt = insert(_shadow).values(
+            [
+                {
+                    "entity_type": entity_type,
+                    "entity_id": entity_id,
+                    "vector": vector,
+                    "model": embedder.model,
+                    "text_hash": text_hash(value),
+                    "source_hash": live_hashes.get(entity_id),
+                }
+                for (entity_id, value), vector in zip(texts.items(), vectors, strict=True)
+            ]
+        )
+        await db.execute(
+            stmt.on_conflict_do_update(
+                index_elements=["entity_type", "entity_id"],
+                set_={
+                    "vector": stmt.excluded.vector,
+                    "model": stmt.excluded.model,
+                    "text_hash": stmt.excluded.text_hash,
+                    "source_hash": stmt.excluded.source_hash,
+                    "updated_at": func.now(),
+                },
+            )
+        )
+        written += len(texts)
+    return written
+
+
+async def _build_shadow_indexes(db: AsyncSession, dimensions: int) -> None:
+    # 라이브 테이블의 벡터 인덱스 정의(HNSW 파라미터, 부분 인덱스, 양자화 표현식 포함)를 복제한다
+    rows = await db.execute(
+        text(
+            "SELECT indexname, indexdef FROM pg_indexes "
+            "WHERE schemaname = current_schema() AND tablename = 'embeddings' AND indexdef LIKE '%USING hnsw%'"
+        )
+    )
+    for name, definition in rows.all():
+        shadow_name = name.replace("idx_embeddings_", "idx_embeddings_shadow_", 1)
+        ddl = definition.replace(f"INDEX {name} ", f"INDEX IF NOT EXISTS {shadow_name} ", 1)
+        # 양자화 캐스트의 차원은 새 모델의 차원으로 바꾼다
+        ddl = _INDEXED_TYPMOD.sub(rf"::\1({dimensions:d})", ddl)
+        await db.execute(text(_INDEX_TABLE.sub(r" ON \1embeddings_shadow ", ddl, count=1)))
+    await db.commit()
+
+
+async def _rename_table(db: AsyncSession, old: str, new: str) -> None:
+    await db.execute(text(f"ALTER TABLE {old} RENAME TO {new}"))
+    for pattern in _CONSTRAINTS:
+        await db.execute(
+            text(f"ALTER TABLE {new} RENAME CONSTRAINT {pattern.format(table=old)} TO {pattern.format(table=new)}")
+        )
+    indexes = await db.scalars(
+        text(
+            "SELECT indexname FROM pg_indexes "
+            "WHERE schemaname = current_schema() AND tablename = :table AND indexname LIKE :prefix"
+        ),
+        {"table": new, "prefix": f"idx\\_{old}\\_%"},
+    )
+    for name in indexes.all():
+        await db.execute(text(f"ALTER INDEX {name} RENAME TO idx_{new}_{name.removeprefix(f'idx_{old}_')}"))
+
+
+async def _reset_active_model(events: Sequence[ChangeEvent]) -> None:
+    global _active, _index_type
+    if any(event.entity_type == "embedding" for event in events):
+        _active = None
+        _index_type = None
+
+
+outbox_service.register_handler("embedding-model", _reset_active_model)
@@ -0,0 +1,94 @@
+"""Runtime enrichment from external providers (FR-4). Results are never stored."""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import uuid
+from datetime import UTC, datetime
+
+from geoalchemy2 import Geometry
+from sqlalchemy import func, select
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import selectinload
+
+from app.models.place import Place
+from app.providers.base import EnrichmentQuery, ProviderResult
+from app.providers.gateway import ProviderGateway, get_provider_gateway
+from app.schemas.enrichment import EnrichmentResponse, ProviderEnrichment
+
+logger = logging.getLogger(__name__)
+
+
+def _to_schema(name: str, outcome: ProviderResult | BaseException | None) -> ProviderEnrichment:
+    if outcome is None:
+        return ProviderEnrichment(provider=name, status="skipped")
+    if isinstance(outcome, BaseException):
+        return ProviderEnrichment(provider=name, status="error", error=str(outcome))
+    return ProviderEnrichment(
+        provider=name,
+        status="ok" if outcome.data is not None else "not_found",
+        cached=outcome.cached,
+        data=outcome.data,
+    )
+
+
+async def enrich_place(
+    db: AsyncSession,
+    place_id: uuid.UUID,
+    gateway: ProviderGateway | None = None,
+) -> EnrichmentResponse | None:
+    """Query every configured provider about a place concurrently.
+
+    A failing provider is reported with status "error" instead of failing the
+    whole request, so the other providers' answers are still returned.
+
+    Args:
+        db: Async database session.
+        place_id: Place id.
+        gateway: Provider gateway. Defaults to the process-wide gateway.
+
+    Returns:
+        Per-provider results, or None if the place does not exist.
+    """
+    geometry = Place.location.cast(Geometry)
+    stmt = (
+        select(Place, func.ST_Y(geometry), func.ST_X(geometry))
+        .options(selectinload(Place.provider_links))
+        .where(Place.id == place_id)
+    )
+    row = (await db.execute(stmt)).first()
+    if row is None:
+        return None
+    place, lat, lng = row
+
+    gateway = gateway or get_provider_gateway()
+    links = {link.provider: link.provider_place_id for link in place.provider_links}
+    queries: dict[str, EnrichmentQuery] = {}
+    for name, provider in gateway.providers.items():
+        query = EnrichmentQuery(
+            name=place.canonical_name,
+            address=place.address_road or place.address_jibun,
+            lat=float(lat) if lat is not None else None,
+            lng=float(lng) if lng is not None else None,
+            provider_place_id=links.get(provider.link_provider),
+        )
+        if provider.supports(query):
+            queries[name] = query
+
+    outcomes = await asyncio.gather(
+        *(gateway.lookup(name, query) for name, query in queries.items()),
+        return_exceptions=True,
+    )
+    by_name: dict[str, ProviderResult | BaseException] = dict(zip(queries, outcomes, strict=True))
+    for name, outcome in by_name.items():
+        if isinstance(outcome, BaseException):
+            if not isinstance(outcome, Exception):
+                raise outcome
+            logger.warning("Enrichment from %s failed for place %s: %r", name, place_id, outcome)
+
+    return EnrichmentResponse(
+        place_id=place_id,
+        results=[_to_schema(name, by_name.get(name)) for name in gateway.providers],
+        fetched_at=datetime.now(UTC),
+    )
@@ -0,0 +1,126 @@
+"""Facet counts for the place list in one ``GROUPING SETS`` query.
+
+Every facet (category, region depth 1 and 2, price range, mood value, tag)
+is one grouping set over the filtered places, with ``unnest`` spreading
+``mood`` and the tag join spreading tags, so all counts come from a single
+scan. Results are cached per (filter hash, ``cache_service.data_version``);
+any committed place change bumps the version, so stale entries are never
+read and simply age out.
+"""
+
+from __future__ import annotations
+
+import hashlib
+from typing import Any
+
+from sqlalchemy import ColumnElement, Select, distinct, func, select, true, tuple_
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.config import settings
+from app.models.place import Place
+from app.models.tag import PlaceTag, Tag
+from app.schemas.search import FacetCount, PlaceFacets, SearchFilters
+from app.services import cache_service, filter_service
+from app.utils.cache import TTLCache
+
+# 패싯 이름 (PlaceFacets 필드) — 집계 쿼리의 컬럼 순서이기도 하다
+FACETS = ("category_primary", "region_depth1", "region_depth2", "price_range", "mood", "tags")
+
+# (필터 해시, 데이터 버전) → 집계 결과
+_facet_cache: TTLCache[tuple[str, int], PlaceFacets] = TTLCache(
+    maxsize=settings.facet_cache_maxsize, ttl=settings.facet_cache_ttl_seconds
+)
+
+
+def filter_hash(filters: SearchFilters | None) -> str:
+    """Stable digest of a filter set, used as the cache key."""
+    payload = filters.model_dump_json(exclude_none=True) if filters is not None else "{}"
+    return hashlib.sha256(payload.encode()).hexdigest()
+
+
+def _facet_statement(filters: SearchFilters | None) -> Select[Any]:
+    places = (
+        select(
+            Place.id,
+            Place.category_primary,
+            Place.region_depth1,
+            Place.region_depth2,
+            Place.price_range,
+            Place.mood,
+        )
+        .where(filter_service.compile_filters(filters))
+        .cte("filtered")
+    )
+    mood = func.unnest(places.c.mood).table_valued("value").render_derived("mood").lateral()
+    columns: list[ColumnElement[Any]] = [
+        places.c.category_primary,
+        places.c.region_depth1,
+        places.c.region_depth2,
+        places.c.price_range,
+        mood.c.value,
+        Tag.name,
+    ]
+    sets = [
+        tuple_(places.c.category_primary),
+        tuple_(places.c.region_depth1),
+        # 같은 구 이름이 여러 시·도에 있으므로 상위 지역과 함께 묶는다
+        tuple_(places.c.region_depth1, places.c.region_depth2),
+        tuple_(places.c.price_range),
+        tuple_(mood.c.value),
+        tuple_(Tag.name),
+        tuple_(),
+    ]
+    return (
+        select(
+            *(column.label(name) for name, column in zip(FACETS, columns, strict=True)),
+            # GROUPING(c) = 1이면 그 행의 집합에 c가 없다
+            *(func.grouping(column).label(f"grouping_{name}") for name, column in zip(FACETS, columns, strict=True)),
+            # mood·태그 조인으로 장소 행이 불어나므로 장소 id로 센다
+            func.count(distinct(places.c.id)).label("count"),
+        )
+        .select_from(places)
+        .outerjoin(mood, true())
+        .outerjoin(PlaceTag, PlaceTag.place_id == places.c.id)
+        .outerjoin(Tag, Tag.id == PlaceTag.tag_id)
+        .group_by(func.grouping_sets(*sets))
+    )
+
+
+def _facet_of(row: Any) -> str | None:
+    grouped = [name for name in FACETS if not row._mapping[f"grouping_{name}"]]
+    if not grouped:
+        return None
+    # (region_depth1, region_depth2) 집합은 하위 지역 패싯이다
+    return grouped[-1]
+
+
+async def place_facets(db: AsyncSession, filters: SearchFilters | None = None) -> PlaceFacets:
+    """Facet counts over the places matching ``filters``.
+
+    Null values are left out of each facet; values are ordered by count, then value.
+
+    Raises:
+        ValueError: If the filters are inconsistent (see ``filter_service.compile_filters``).
+    """
+    key = (filter_hash(filters), cache_service.data_version())
+    if (cached := _facet_cache.get(key)) is not None:
+        return cached
+
+    facets: dict[str, Any] = {"total": 0}
+    for row in await db.execute(_facet_statement(filters)):
+        name = _facet_of(row)
+        if name is None:
+            facets["total"] = row.count
+            continue
+        value = row._mapping[name]
+        if value is None:
+            continue
+        parent = row.region_depth1 if name == "region_depth2" else None
+        facets.setdefault(name, []).append(FacetCount(value=value, count=row.count, parent=parent))
+    for name, counts in facets.items():
+        if name != "total":
+            counts.sort(key=lambda facet: (-facet.count, facet.value))
+
+    result = PlaceFacets(**facets)
+    _facet_cache.set(key, result)
+    return result
@@ -0,0 +1,93 @@
+"""Compiles the PRD place filter object (FR-2.1) into one SQL predicate.
+
+Shared by place listing and keyword search so a filter means the same thing
+everywhere. Every clause is parameterized and written so an index serves it:
+
+* ``mood`` / ``situations``: the place must have all given values (``@>``);
+  ``companions``: any of them (``&&``). All three use GIN indexes.
+* ``tags``: the place carries every given tag (``place_tags`` primary key,
+  ``tags.name`` unique index).
+* ``ontology_nodes``: the place is related to any of the nodes or their
+  descendants (recursive walk down ``ontology_nodes.parent_id``, then the
+  ``relations`` target index).
+* ``max_distance_km`` with ``lat``/``lng``: ``ST_DWithin`` on the GiST
+  location index.
+* Scalar fields are equality tests; ``min_rating`` is ``user_rating >=``.
+"""
+
+from __future__ import annotations
+
+from typing import Any
+
+from geoalchemy2 import Geography
+from sqlalchemy import ColumnElement, and_, func, select, true
+
+from app.models.ontology import OntologyNode, Relation
+from app.models.place import Place
+from app.models.tag import PlaceTag, Tag
+from app.schemas.search import SearchFilters
+
+
+def _values(values: list[str] | None) -> list[str]:
+    return list(dict.fromkeys(value.strip() for value in values or () if value.strip()))
+
+
+def compile_filters(filters: SearchFilters | None) -> ColumnElement[bool]:
+    """Predicate over ``Place`` matching ``filters`` (``TRUE`` when nothing is set).
+
+    Raises:
+        ValueError: If ``max_distance_km`` is given without both ``lat`` and ``lng``.
+    """
+    if filters is None:
+        return true()
+
+    clauses: list[ColumnElement[Any]] = []
+    for column, value in (
+        (Place.category_primary, filters.category_primary),
+        (Place.reservation, filters.reservation),
+        (Place.price_range, filters.price_range),
+    ):
+        if value:
+            clauses.append(column == value)
+    if filters.parking is not None:
+        clauses.append(Place.parking.is_(filters.parking))
+    if filters.is_favorite is not None:
+        clauses.append(Place.is_favorite.is_(filters.is_favorite))
+    if filters.min_rating is not None:
+        clauses.append(Place.user_rating >= filters.min_rating)
+
+    if mood := _values(filters.mood):
+        clauses.append(Place.mood.contains(mood))
+    if situations := _values(filters.situations):
+        clauses.append(Place.situations.contains(situations))
+    if companions := _values(filters.companions):
+        clauses.append(Place.companions.overlap(companions))
+
+    if tags := _values(filters.tags):
+        tagged = (
+            select(PlaceTag.place_id)
+            .join(Tag, Tag.id == PlaceTag.tag_id)
+            .where(Tag.name.in_(tags))
+            .group_by(PlaceTag.place_id)
+            .having(func.count() == len(tags))
+        )
+        clauses.append(Place.id.in_(tagged))
+
+    if nodes := list(dict.fromkeys(filters.ontology_nodes or ())):
+        tree = select(OntologyNode.id).where(OntologyNode.id.in_(nodes)).cte("ontology_tree", recursive=True)
+        # UNION이 이미 본 노드를 걸러 순환이 있어도 끝난다
+        tree = tree.union(select(OntologyNode.id).join(tree, OntologyNode.parent_id == tree.c.id))
+        related = select(Relation.from_entity_id).where(
+            Relation.to_entity_type == "ontology_node",
+            Relation.to_entity_id.in_(select(tree.c.id)),
+            Relation.from_entity_type == "place",
+        )
+        clauses.append(Place.id.in_(related))
+
+    if filters.max_distance_km is not None:
+        if filters.lat is None or filters.lng is None:
+            raise ValueError("max_distance_km requires lat and lng")
+        point = func.ST_SetSRID(func.ST_MakePoint(filters.lng, filters.lat), 4326).cast(Geography)
+        clauses.append(func.ST_DWithin(Place.location, point, filters.max_distance_km * 1000))
+
+    return and_(true(), *clauses)
@@ -0,0 +1,165 @@
+"""Itinerary drafting service for the draft_itinerary agent tool."""
+
+from __future__ import annotations
+
+import uuid
+from dataclasses import dataclass
+
+from geoalchemy2 import Geometry
+from sqlalchemy import func, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models.place import Place
+from app.schemas.place import PlaceBrief
+from app.schemas.tool import DraftItineraryResponse, ItineraryLeg, StartLocation
+from app.services import cache_service
+from app.utils.cache import TTLCache
+from app.utils.itinerary import distance_matrix, estimate_travel, haversine_m, solve_path, travel_minutes_matrix
+
+
+@dataclass(frozen=True)
+class _PlaceMatrix:
+    """Cached coordinates and pairwise distances for a place set."""
+
+    located: tuple[PlaceBrief, ...]
+    points: tuple[tuple[float, float], ...]
+    distances: tuple[tuple[float, ...], ...]
+    unlocated: tuple[PlaceBrief, ...]
+
+
+# Keyed by the sorted place ids so re-ordered requests share one entry.
+_matrix_cache: TTLCache[tuple[uuid.UUID, ...], _PlaceMatrix] = TTLCache(maxsize=256, ttl=600)
+
+
+def invalidate_place(place_id: uuid.UUID) -> None:
+    """Drop cached matrices that include the given place."""
+    _matrix_cache.discard_where(lambda key: place_id in key)
+
+
+cache_service.register_invalidation_listener(invalidate_place)
+
+
+async def _load_matrix(db: AsyncSession, place_ids: list[uuid.UUID]) -> _PlaceMatrix:
+    key = tuple(sorted(place_ids))
+    cached = _matrix_cache.get(key)
+    if cached is not None:
+        return cached
+
+    geometry = Place.location.cast(Geometry)
+    stmt = select(Place, func.ST_Y(geometry).label("lat"), func.ST_X(geometry).label("lng")).where(Place.id.in_(key))
+    rows = (await db.execute(stmt)).all()
+
+    found = {place.id for place, _, _ in rows}
+    missing = [str(place_id) for place_id in key if place_id not in found]
+    if missing:
+        raise LookupError(f"Places not found: {', '.join(missing)}")
+
+    located: list[PlaceBrief] = []
+    points: list[tuple[float, float]] = []
+    unlocated: list[PlaceBrief] = []
+    for place, lat, lng in sorted(rows, key=lambda row: row[0].id):
+        brief = PlaceBrief.model_validate(place)
+        if lat is None or lng is None:
+            unlocated.append(brief)
+        else:
+            located.append(brief)
+            points.append((float(lat), float(lng)))
+
+    matrix = _PlaceMatrix(
+        located=tuple(located),
+        points=tuple(points),
+        distances=tuple(tuple(row) for row in distance_matrix(points)),
+        unlocated=tuple(unlocated),
+    )
+    _matrix_cache.set(key, matrix)
+    return matrix
+
+
+def _render_markdown(
+    places: list[PlaceBrief],
+    legs: list[ItineraryLeg],
+    unlocated: tuple[PlaceBrief, ...],
+    has_start: bool,
+) -> str:
+    lines = ["| # | Place | From | Mode | Distance | Travel |", "|---|---|---|---|---|---|"]
+    names = {place.id: place.canonical_name for place in places}
+    for index, (place, leg) in enumerate(zip(places, legs, strict=True), start=1):
+        origin = names.get(leg.from_place_id, "start") if leg.from_place_id else ("start" if has_start else "-")
+        lines.append(
+            f"| {index} | {place.canonical_name} | {origin} | {leg.mode} | "
+            f"{leg.distance_m / 1000:.1f} km | {round(leg.travel_minutes)} min |"
+        )
+    total_minutes = sum(leg.travel_minutes for leg in legs)
+    lines.append("")
+    lines.append(f"Total estimated travel: {round(total_minutes)} min")
+    if unlocated:
+        lines.append("")
+        lines.append("No coordinates (not ordered): " + ", ".join(place.canonical_name for place in unlocated))
+    return "\n".join(lines)
+
+
+async def draft_itinerary(
+    db: AsyncSession,
+    place_ids: list[uuid.UUID],
+    start_location: StartLocation | None = None,
+) -> DraftItineraryResponse:
+    """Order places into a short route with travel-time estimates.
+
+    Distances are straight-line (haversine) with a road detour factor, so no
+    routing API is called. The pairwise matrix is cached per place set.
+
+    Args:
+        db: Async database session.
+        place_ids: Places to visit. Duplicates are ignored.
+        start_location: Optional starting coordinates.
+
+    Returns:
+        Ordered itinerary with per-leg estimates and a Markdown summary.
+
+    Raises:
+        LookupError: If any place id does not exist.
+    """
+    unique_ids = list(dict.fromkeys(place_ids))
+    matrix = await _load_matrix(db, unique_ids)
+
+    distances = [list(row) for row in matrix.distances]
+    start_index: int | None = None
+    if start_location is not None:
+        from_start = [haversine_m(start_location.lat, start_location.lng, lat, lng) for lat, lng in matrix.points]
+        distances = [[0.0, *from_start], *([d, *row] for d, row in zip(from_start, distances, strict=True))]
+        start_index = 0
+
+    order = solve_path(travel_minutes_matrix(distances), start=start_index)
+    offset = 1 if start_index is not None else 0
+
+    ordered: list[PlaceBrief] = []
+    legs: list[ItineraryLeg] = []
+    previous: int | None = None
+    for node in order:
+        if node == start_index:
+            previous = node
+            continue
+        place = matrix.located[node - offset]
+        distance_m = distances[previous][node] if previous is not None else 0.0
+        mode, minutes = estimate_travel(distance_m) if previous is not None else ("none", 0.0)
+        from_place_id = matrix.located[previous - offset].id if previous not in (None, start_index) else None
+        legs.append(
+            ItineraryLeg(
+                from_place_id=from_place_id,
+                to_place_id=place.id,
+                distance_m=round(distance_m, 1),
+                travel_minutes=round(minutes, 1),
+                mode=mode,
+            )
+        )
+        ordered.append(place)
+        previous = node
+
+    return DraftItineraryResponse(
+        markdown=_render_markdown(ordered, legs, matrix.unlocated, has_start=start_index is not None),
+        places_ordered=[*ordered, *matrix.unlocated],
+        legs=legs,
+        total_distance_m=round(sum(leg.distance_m for leg in legs), 1),
+        total_travel_minutes=round(sum(leg.travel_minutes for leg in legs), 1),
+        unlocated_place_ids=[place.id for place in matrix.unlocated],
+    )
@@ -0,0 +1,430 @@
+"""Transactional outbox — change events for place data and their in-process delivery.
+
+Writers call :func:`record_change` before committing, so an event exists if and
+only if its mutation committed. :func:`dispatch_pending` then delivers events
+in batches to registered handlers, at least once and in commit order:
+
+* Events are read in ``(tx_id, id)`` order and only from transactions older
+  than the snapshot's ``xmin``. Every such transaction has finished, so no
+  earlier event can still appear behind a consumer's offset.
+* A handler's offset advances only after it returns. A handler that raises
+  sees the same batch again on the next dispatch, so handlers must be
+  idempotent.
+* Durable handlers keep their offset in ``outbox_offsets`` and resume after a
+  restart. Each batch runs with the offset row locked (``FOR UPDATE SKIP
+  LOCKED``), so only one process delivers a durable consumer at a time, and
+  the stored offset only ever moves forward. Process-local handlers
+  (in-memory caches) keep it in memory and start at the events committed
+  around process start, since their state starts empty anyway.
+
+Writers commit through :func:`commit`, which hands the transaction's own
+events to the process-local handlers right away (read-your-writes in this
+process, regardless of other open transactions) but leaves everything else to
+the background dispatcher started with the app, so write latency does not
+depend on durable consumers or on the backlog. :func:`commit` also sends a
+``NOTIFY`` on :data:`NOTIFY_CHANNEL` inside the transaction, so dispatchers
+(which ``LISTEN`` on it) wake up as soon as the change commits instead of at
+their next poll. The notification only carries the wake-up; the events
+themselves are always read from the outbox. Scripts that run without a
+dispatcher call :func:`dispatch_pending` themselves when they finish.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import uuid
+from collections.abc import Awaitable, Callable, Sequence
+from dataclasses import dataclass, field
+from datetime import UTC, datetime, timedelta
+from typing import Any
+
+from sqlalchemy import delete, func, literal_column, select, tuple_
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, async_sessionmaker
+
+from app.config import settings
+from app.deps import async_session_factory, engine
+from app.models.outbox import OutboxEvent, OutboxOffset
+from app.services import cache_service
+
+logger = logging.getLogger(__name__)
+
+# 실행 중인 트랜잭션 중 가장 오래된 xid. 이보다 작은 tx_id의 이벤트만 읽는다.
+_SNAPSHOT_XMIN = literal_column("(pg_snapshot_xmin(pg_current_snapshot())::text)::bigint")
+
+# 현재 트랜잭션의 xid (아직 쓰기가 없으면 NULL)
+_CURRENT_TX_ID = literal_column("(pg_current_xact_id_if_assigned()::text)::bigint")
+
+# 커밋된 변경을 다른 워커에 알리는 LISTEN/NOTIFY 채널
+NOTIFY_CHANNEL = "outbox_events"
+
+# 프로세스 로컬 핸들러의 시작 지점 — 시계 오차를 감안해 여유를 두고 조금 더 앞에서 시작한다
+_PROCESS_STARTED_AT = datetime.now(UTC) - timedelta(minutes=1)
+
+
+@dataclass(frozen=True)
+class ChangeEvent:
+    """One committed change to place data."""
+
+    id: int
+    tx_id: int
+    entity_type: str
+    entity_id: uuid.UUID | None
+    place_id: uuid.UUID | None
+    op: str
+    payload: dict[str, Any] | None
+    created_at: datetime
+
+
+ChangeHandler = Callable[[Sequence[ChangeEvent]], Awaitable[None]]
+
+
+@dataclass
+class _Registration:
+    handler: ChangeHandler
+    durable: bool
+    position: tuple[int, int] | None = None
+    lock: asyncio.Lock = field(default_factory=asyncio.Lock)
+
+
+_handlers: dict[str, _Registration] = {}
+
+
+def record_change(
+    db: AsyncSession,
+    entity_type: str,
+    op: str,
+    place_id: uuid.UUID | None,
+    entity_id: uuid.UUID | None = None,
+    payload: dict[str, Any] | None = None,
+) -> None:
+    """Stage a change event in the caller's transaction (flushed with it on commit).
+
+    Args:
+        db: Session holding the mutation.
+        entity_type: "place", "note", "source", "visit" or "tag".
+        op: "insert", "update", "delete" or "merge".
+        place_id: Affected place, if any.
+        entity_id: Changed row id (defaults to place_id for place events).
+        payload: Small JSON detail for consumers.
+    """
+    db.add(
+        OutboxEvent(
+            entity_type=entity_type,
+            entity_id=entity_id if entity_id is not None else place_id,
+            place_id=place_id,
+            op=op,
+            payload=payload,
+        )
+    )
+
+
+async def record_changes(
+    db: AsyncSession,
+    entity_type: str,
+    op: str,
+    place_ids: Sequence[uuid.UUID],
+    payload: dict[str, Any] | None = None,
+) -> None:
+    """Stage one event per place with a single multi-row INSERT (for bulk jobs)."""
+    if not place_ids:
+        return
+    await db.execute(
+        insert(OutboxEvent),
+        [
+            {"entity_type": entity_type, "entity_id": place_id, "place_id": place_id, "op": op, "payload": payload}
+            for place_id in place_ids
+        ],
+    )
+
+
+def register_handler(name: str, handler: ChangeHandler, *, durable: bool = False) -> None:
+    """Register a batch handler under a stable consumer name.
+
+    Args:
+        name: Consumer name; durable offsets are stored under it.
+        handler: Coroutine receiving a batch of events in commit order.
+        durable: Persist the offset so delivery resumes after restart.
+    """
+    if name not in _handlers:
+        _handlers[name] = _Registration(handler=handler, durable=durable)
+
+
+def unregister_handler(name: str) -> None:
+    """Remove a handler; a durable handler's stored offset is kept."""
+    _handlers.pop(name, None)
+
+
+async def commit(db: AsyncSession) -> None:
+    """Commit the caller's transaction, then hand its events to process-local handlers.
+
+    The transaction's own events go straight to the process-local handlers
+    after the commit, so this process reads its own writes even while another
+    transaction is still open and holds back the ``xmin`` gate of
+    :func:`dispatch_pending`. Durable handlers and other processes get them
+    from the dispatchers, which are woken on :data:`NOTIFY_CHANNEL`;
+    PostgreSQL delivers the notification only if (and when) the transaction
+    commits.
+    """
+    await db.flush()
+    own = await db.execute(
+        select(*OutboxEvent.__table__.c).where(OutboxEvent.tx_id == _CURRENT_TX_ID).order_by(OutboxEvent.id)
+    )
+    events = [_to_event(row) for row in own]
+    await db.execute(select(func.pg_notify(NOTIFY_CHANNEL, "")))
+    await db.commit()
+    if events:
+        await _deliver_local(events)
+
+
+async def _deliver_local(events: Sequence[ChangeEvent]) -> None:
+    # 프로세스 로컬 오프셋은 건드리지 않는다 — 이후 drain에서 다시 전달되어도 핸들러는 멱등이다
+    for name, registration in list(_handlers.items()):
+        if registration.durable:
+            continue
+        async with registration.lock:
+            try:
+                await registration.handler(events)
+            except Exception:
+                logger.exception("Outbox handler %s failed", name)
+
+
+async def dispatch_pending(
+    session_factory: async_sessionmaker[AsyncSession] = async_session_factory,
+    batch_size: int | None = None,
+) -> int:
+    """Deliver every visible, undelivered event to every handler.
+
+    Returns:
+        Number of (handler, event) deliveries made.
+    """
+    limit = batch_size or settings.outbox_batch_size
+    delivered = 0
+    for name, registration in list(_handlers.items()):
+        async with registration.lock:
+            try:
+                delivered += await _drain(session_factory, name, registration, limit)
+            except Exception:
+                # 다음 dispatch에서 같은 배치를 다시 전달한다 (at-least-once)
+                logger.exception("Outbox handler %s failed", name)
+    return delivered
+
+
+async def _drain(
+    session_factory: async_sessionmaker[AsyncSession],
+    name: str,
+    registration: _Registration,
+    limit: int,
+) -> int:
+    delivered = 0
+    async with session_factory() as db:
+        while True:
+            position = await _load_position(db, name, registration)
+            if position is None:
+                # 다른 워커가 같은 durable consumer를 전달하는 중이다
+                return delivered
+            rows = (
+                (
+                    await db.execute(
+                        select(OutboxEvent)
+                        .where(
+                            tuple_(OutboxEvent.tx_id, OutboxEvent.id) > tuple_(*position),
+                            OutboxEvent.tx_id < _SNAPSHOT_XMIN,
+                        )
+                        .order_by(OutboxEvent.tx_id, OutboxEvent.id)
+                        .limit(limit)
+                    )
+                )
+                .scalars()
+                .all()
+            )
+            if not rows:
+                await db.commit()
+                return delivered
+
+            batch = [_to_event(row) for row in rows]
+            await registration.handler(batch)
+            position = (batch[-1].tx_id, batch[-1].id)
+            await _save_position(db, name, registration, position)
+            delivered += len(batch)
+            if len(batch) < limit:
+                return delivered
+
+
+async def _load_position(db: AsyncSession, name: str, registration: _Registration) -> tuple[int, int] | None:
+    """Current position; for durable consumers also lock their offset row until the next commit.
+
+    Returns ``None`` when another process holds the durable consumer's lock.
+    """
+    if registration.durable:
+        # 다른 프로세스가 전진시켰을 수 있으므로 매번 DB에서 읽고, 배치를 전달하는 동안 행을 잠가 둔다
+        columns = (OutboxOffset.tx_id, OutboxOffset.event_id)
+        row = (
+            await db.execute(select(*columns).where(OutboxOffset.consumer == name).with_for_update(skip_locked=True))
+        ).one_or_none()
+        if row is None:
+            # 첫 전달이면 행을 만든다 (삽입한 행은 커밋까지 잠겨 있다). 이미 있으면 다른 워커가 잠근 것이다.
+            row = (
+                await db.execute(
+                    insert(OutboxOffset).values(consumer=name).on_conflict_do_nothing().returning(*columns)
+                )
+            ).one_or_none()
+        return (row.tx_id, row.event_id) if row is not None else None
+
+    if registration.position is None:
+        head = (
+            await db.execute(
+                select(OutboxEvent.tx_id, OutboxEvent.id)
+                .where(OutboxEvent.created_at < _PROCESS_STARTED_AT)
+                .order_by(OutboxEvent.tx_id.desc(), OutboxEvent.id.desc())
+                .limit(1)
+            )
+        ).one_or_none()
+        registration.position = (head.tx_id, head.id) if head is not None else (0, 0)
+    return registration.position
+
+
+async def _save_position(
+    db: AsyncSession,
+    name: str,
+    registration: _Registration,
+    position: tuple[int, int],
+) -> None:
+    if registration.durable:
+        stmt = insert(OutboxOffset).values(consumer=name, tx_id=position[0], event_id=position[1])
+        await db.execute(
+            stmt.on_conflict_do_update(
+                index_elements=[OutboxOffset.consumer],
+                set_={"tx_id": stmt.excluded.tx_id, "event_id": stmt.excluded.event_id, "updated_at": func.now()},
+                # 오프셋은 앞으로만 움직인다
+                where=tuple_(OutboxOffset.tx_id, OutboxOffset.event_id)
+                < tuple_(stmt.excluded.tx_id, stmt.excluded.event_id),
+            )
+        )
+        # 커밋하면 행 잠금도 풀린다 — 다음 배치는 다시 잠그고 시작한다
+        await db.commit()
+    registration.position = position
+
+
+def _to_event(row: Any) -> ChangeEvent:
+    return ChangeEvent(
+        id=row.id,
+        tx_id=row.tx_id,
+        entity_type=row.entity_type,
+        entity_id=row.entity_id,
+        place_id=row.place_id,
+        op=row.op,
+        payload=row.payload,
+        created_at=row.created_at,
+    )
+
+
+async def prune(db: AsyncSession, retention: timedelta) -> int:
+    """Delete events older than ``retention`` that every durable consumer has passed.
+
+    Returns:
+        Number of events deleted.
+    """
+    stmt = delete(OutboxEvent).where(OutboxEvent.created_at < func.now() - retention)
+    durable = [name for name, registration in _handlers.items() if registration.durable]
+    if durable:
+        offsets = select(OutboxOffset.tx_id, OutboxOffset.event_id).where(OutboxOffset.consumer.in_(durable))
+        rows = (await db.execute(offsets)).all()
+        if len(rows) < len(durable):
+            return 0
+        slowest = min((row.tx_id, row.event_id) for row in rows)
+        stmt = stmt.where(tuple_(OutboxEvent.tx_id, OutboxEvent.id) <= tuple_(*slowest))
+    result = await db.execute(stmt)
+    await db.commit()
+    return result.rowcount or 0
+
+
+class OutboxDispatcher:
+    """Background task delivering events committed by any process.
+
+    Wakes on a ``NOTIFY`` from a committing writer (see :func:`commit`) and
+    otherwise every ``poll_interval`` seconds, which also covers notifications
+    missed while the listening connection was down.
+    """
+
+    def __init__(
+        self,
+        session_factory: async_sessionmaker[AsyncSession] = async_session_factory,
+        poll_interval: float | None = None,
+        retention: timedelta | None = None,
+        bind: AsyncEngine = engine,
+        listen: bool | None = None,
+    ) -> None:
+        self._session_factory = session_factory
+        self._poll_interval = poll_interval if poll_interval is not None else settings.outbox_poll_interval_seconds
+        self._retention = retention or timedelta(days=settings.outbox_retention_days)
+        self._bind = bind
+        self._listen_enabled = listen if listen is not None else settings.outbox_listen
+        self._wakeup = asyncio.Event()
+        self._tasks: list[asyncio.Task[None]] = []
+
+    def start(self) -> None:
+        if self._tasks:
+            return
+        self._tasks.append(asyncio.create_task(self._run(), name="outbox-dispatcher"))
+        if self._listen_enabled:
+            self._tasks.append(asyncio.create_task(self._listen(), name="outbox-listener"))
+
+    async def stop(self) -> None:
+        for task in self._tasks:
+            task.cancel()
+        for task in self._tasks:
+            try:
+                await task
+            except asyncio.CancelledError:
+                pass
+        self._tasks = []
+
+    async def _run(self) -> None:
+        loop = asyncio.get_running_loop()
+        next_prune = loop.time()
+        while True:
+            self._wakeup.clear()
+            try:
+                await dispatch_pending(self._session_factory)
+                if loop.time() >= next_prune:
+                    async with self._session_factory() as db:
+                        await prune(db, self._retention)
+                    next_prune = loop.time() + 3600
+            except Exception:
+                logger.exception("Outbox dispatch failed")
+            try:
+                await asyncio.wait_for(self._wakeup.wait(), self._poll_interval)
+            except TimeoutError:
+                pass
+
+    async def _listen(self) -> None:
+        """Hold a LISTEN connection open, reconnecting after failures."""
+        while True:
+            try:
+                async with self._bind.connect() as conn:
+                    raw = (await conn.get_raw_connection()).driver_connection
+                    lost = asyncio.Event()
+                    raw.add_termination_listener(lambda _: lost.set())
+                    await raw.add_listener(NOTIFY_CHANNEL, self._notified)
+                    try:
+                        # 연결하기 전에 커밋된 변경을 놓치지 않도록 한 번 깨운다
+                        self._wakeup.set()
+                        await lost.wait()
+                    finally:
+                        if not raw.is_closed():
+                            await raw.remove_listener(NOTIFY_CHANNEL, self._notified)
+            except Exception:
+                logger.exception("Outbox listener disconnected")
+            await asyncio.sleep(self._poll_interval)
+
+    def _notified(self, *_: Any) -> None:
+        self._wakeup.set()
+
+
+async def _invalidate_caches(events: Sequence[ChangeEvent]) -> None:
+    cache_service.invalidate_places(event.place_id for event in events if event.place_id is not None)
+
+
+register_handler("cache", _invalidate_caches)
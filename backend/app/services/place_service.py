@@ -2,35 +2,76 @@
 
 from __future__ import annotations
 
-import base64
 import uuid
-from datetime import UTC, datetime
+from collections.abc import Sequence
 from typing import Any
 
 from geoalchemy2.elements import WKTElement
-from sqlalchemy import and_, func, or_, select
+from pydantic import BaseModel
+from sqlalchemy import (
+    ColumnElement,
+    FromClause,
+    Select,
+    Text,
+    bindparam,
+    cast,
+    column,
+    delete,
+    func,
+    literal_column,
+    select,
+    update,
+    values,
+)
+from sqlalchemy.dialects.postgresql import UUID, aggregate_order_by
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import selectinload
 
+from app.config import settings
 from app.models.note import Note
-from app.models.place import Place
-from app.models.tag import Tag
-from app.schemas.place import PlaceCreate, PlaceUpdate
-from app.utils.text_normalize import normalize_place_name
-
-
-def _encode_cursor(created_at: datetime, place_id: uuid.UUID) -> str:
-    raw = f"{created_at.isoformat()}|{place_id}"
-    return base64.urlsafe_b64encode(raw.encode("utf-8")).decode("utf-8")
-
-
-def _decode_cursor(cursor: str) -> tuple[datetime, uuid.UUID]:
-    decoded = base64.urlsafe_b64decode(cursor.encode("utf-8")).decode("utf-8")
-    created_at_str, place_id_str = decoded.split("|", 1)
-    created_at = datetime.fromisoformat(created_at_str)
-    if created_at.tzinfo is None:
-        created_at = created_at.replace(tzinfo=UTC)
-    return created_at, uuid.UUID(place_id_str)
+from app.models.place import Place, ProviderLink
+from app.models.source import Source
+from app.models.tag import PlaceTag, Tag
+from app.models.visit import Visit
+from app.schemas.note import NoteResponse
+from app.schemas.place import PlaceCreate, PlaceDetail, PlaceResponse, PlaceUpdate, ProviderLinkResponse
+from app.schemas.search import SearchFilters
+from app.schemas.source import SourceResponse
+from app.schemas.tag import TagResponse
+from app.schemas.visit import VisitResponse
+from app.services import cache_service, filter_service, outbox_service, source_service
+from app.utils.cache import TTLCache
+from app.utils.pagination import Keyset, SortKey, paginate
+from app.utils.text_normalize import normalize_place_name, normalize_place_names
+
+# 정렬 키 → keyset. 모두 (컬럼, id) 인덱스로 keyset 스캔된다.
+SORT_KEYS: dict[str, Keyset] = {
+    "created": Keyset("places:created", (SortKey(Place.created_at), SortKey(Place.id))),
+    "most_visited": Keyset("places:most_visited", (SortKey(Place.visit_count), SortKey(Place.id))),
+    "recently_visited": Keyset("places:recently_visited", (SortKey(Place.last_visited_at), SortKey(Place.id))),
+}
+
+# 하위 엔티티 → keyset. (place_id, 정렬 컬럼, id) 복합 인덱스와 일치한다.
+CHILD_SORT_KEYS: dict[type[Any], Keyset] = {
+    Note: Keyset("notes", (SortKey(Note.created_at), SortKey(Note.id))),
+    Source: Keyset("sources", (SortKey(Source.created_at), SortKey(Source.id))),
+    Visit: Keyset("visits", (SortKey(Visit.visited_at), SortKey(Visit.id))),
+}
+
+# 상세 조회 시 하위 컬렉션별 첫 페이지 크기
+DETAIL_CHILD_LIMIT = 20
+
+# place id → (프로세스 로컬 버전, DB fingerprint, 직렬화된 PlaceDetail JSON)
+_detail_cache: TTLCache[uuid.UUID, tuple[int, tuple[Any, ...] | None, bytes]] = TTLCache(
+    maxsize=settings.place_detail_cache_maxsize, ttl=settings.place_detail_cache_ttl_seconds
+)
+
+
+def _evict_detail(place_id: uuid.UUID) -> None:
+    _detail_cache.pop(place_id)
+
+
+cache_service.register_invalidation_listener(_evict_detail)
 
 
 async def _upsert_tags(db: AsyncSession, tag_names: list[str]) -> list[Tag]:
@@ -45,6 +86,8 @@ async def _upsert_tags(db: AsyncSession, tag_names: list[str]) -> list[Tag]:
     db.add_all(to_create)
     if to_create:
         await db.flush()
+        for tag in to_create:
+            outbox_service.record_change(db, "tag", "insert", None, tag.id, {"name": tag.name})
 
     return [*existing.values(), *to_create]
 
@@ -55,9 +98,6 @@ async def _load_place(db: AsyncSession, place_id: uuid.UUID) -> Place | None:
         .options(
             selectinload(Place.provider_links),
             selectinload(Place.tags),
-            selectinload(Place.sources),
-            selectinload(Place.notes),
-            selectinload(Place.visits),
         )
         .where(Place.id == place_id)
     )
@@ -97,60 +137,308 @@ async def create_place(db: AsyncSession, data: PlaceCreate) -> Place:
     db.add(place)
     await db.flush()
 
-    for note_text in data.notes:
-        note = note_text.strip()
-        if note:
-            db.add(Note(place_id=place.id, content=note))
+    notes = [Note(place_id=place.id, content=text) for text in (n.strip() for n in data.notes) if text]
+    db.add_all(notes)
+    await db.flush()
 
-    await db.commit()
+    outbox_service.record_change(db, "place", "insert", place.id)
+    for note in notes:
+        outbox_service.record_change(db, "note", "insert", place.id, note.id)
+    await outbox_service.commit(db)
     loaded = await _load_place(db, place.id)
     if loaded is None:
         raise RuntimeError("Place was created but could not be loaded")
     return loaded
 
 
+async def list_children[M: (Note, Source, Visit)](
+    db: AsyncSession,
+    model: type[M],
+    place_id: uuid.UUID,
+    cursor: str | None = None,
+    limit: int = DETAIL_CHILD_LIMIT,
+) -> tuple[list[M], str | None]:
+    """Page through a place's notes, sources or visits, newest first.
+
+    Args:
+        db: Async database session.
+        model: Child model (Note, Source or Visit).
+        place_id: Parent place id.
+        cursor: Opaque cursor from the previous page.
+        limit: Page size.
+
+    Returns:
+        Tuple of (rows, next cursor).
+    """
+    stmt = select(model).where(model.place_id == place_id)
+    page = await paginate(db, stmt, CHILD_SORT_KEYS[model], cursor, limit)
+    return page.items, page.next_cursor
+
+
 async def get_place(db: AsyncSession, place_id: uuid.UUID) -> Place | None:
-    """Fetch place with child entities."""
+    """Fetch place with provider links and tags."""
     return await _load_place(db, place_id)
 
 
-async def list_places(
+async def get_place_detail(db: AsyncSession, place_id: uuid.UUID) -> PlaceDetail | None:
+    """Fetch place detail with the first page of each child collection in one query.
+
+    PostgreSQL assembles the whole document with ``json_build_object`` /
+    ``json_agg`` subqueries and pydantic parses the JSON text directly, so no
+    ORM objects are built. Further pages come from the notes/visits/sources
+    list endpoints using the returned ``*_next_cursor`` values.
+    """
+    document = await db.scalar(_DETAIL_DOCUMENT, {"place_id": place_id})
+    if document is None:
+        return None
+
+    detail = PlaceDetail.model_validate_json(document)
+    for model, field in ((Source, "sources"), (Note, "notes"), (Visit, "visits")):
+        rows = getattr(detail, field)
+        # 한 행 더 읽어 다음 페이지 존재 여부를 판단한다 (paginate와 동일)
+        if len(rows) > DETAIL_CHILD_LIMIT:
+            del rows[DETAIL_CHILD_LIMIT:]
+            keyset = CHILD_SORT_KEYS[model]
+            setattr(detail, f"{field}_next_cursor", keyset.encode(keyset.values_of(rows[-1])))
+    return detail
+
+
+async def get_place_detail_json(
     db: AsyncSession,
-    cursor: str | None,
-    limit: int,
-    category_primary: str | None = None,
-    is_favorite: bool | None = None,
-) -> tuple[list[Place], str | None, int]:
-    """List places with cursor-based pagination."""
-    stmt = select(Place).options(selectinload(Place.tags))
+    place_id: uuid.UUID,
+    fingerprint: tuple[Any, ...] | None = None,
+) -> bytes | None:
+    """Serialized :class:`PlaceDetail`, served from the in-process cache when current.
+
+    An entry is valid for the place's version in ``cache_service``, which every
+    committed write to the place or its children bumps via the outbox (other
+    workers are woken by NOTIFY). Passing the :func:`detail_version`
+    fingerprint additionally rejects entries written before a change whose
+    event has not reached this process yet.
+    """
+    version = cache_service.place_version(place_id)
+    cached = _detail_cache.get(place_id)
+    if cached is not None and cached[0] == version and (fingerprint is None or cached[1] == fingerprint):
+        return cached[2]
+
+    detail = await get_place_detail(db, place_id)
+    if detail is None:
+        return None
+    payload = detail.model_dump_json().encode()
+    # 조회 중 무효화되었다면 이전 버전으로 저장되어 다음 조회에서 버려진다
+    _detail_cache.set(place_id, (version, fingerprint, payload))
+    return payload
 
-    if category_primary:
-        stmt = stmt.where(Place.category_primary == category_primary)
-    if is_favorite is not None:
-        stmt = stmt.where(Place.is_favorite.is_(is_favorite))
 
-    total_stmt = select(func.count()).select_from(stmt.subquery())
-    total = int((await db.execute(total_stmt)).scalar_one())
+async def get_place_detail_orm(db: AsyncSession, place_id: uuid.UUID) -> PlaceDetail | None:
+    """Reference detail loader hydrating ORM objects (six round trips).
 
-    if cursor:
-        cursor_created_at, cursor_id = _decode_cursor(cursor)
-        stmt = stmt.where(
-            or_(
-                Place.created_at < cursor_created_at,
-                and_(Place.created_at == cursor_created_at, Place.id < cursor_id),
-            )
-        )
+    Kept for the detail loader benchmark and equivalence tests.
+    """
+    place = await _load_place(db, place_id)
+    if place is None:
+        return None
+
+    sources, sources_next = await list_children(db, Source, place_id)
+    notes, notes_next = await list_children(db, Note, place_id)
+    visits, visits_next = await list_children(db, Visit, place_id)
+    return PlaceDetail(
+        **PlaceResponse.model_validate(place).model_dump(),
+        sources=[SourceResponse.model_validate(row) for row in sources],
+        sources_next_cursor=sources_next,
+        notes=[NoteResponse.model_validate(row) for row in notes],
+        notes_next_cursor=notes_next,
+        visits=[VisitResponse.model_validate(row) for row in visits],
+        visits_next_cursor=visits_next,
+    )
+
+
+def _json_object(source: FromClause, schema: type[BaseModel], **nested: ColumnElement[Any]) -> ColumnElement[Any]:
+    """``json_build_object`` of the schema fields that are columns of ``source`` (plus ``nested``)."""
+    args: list[ColumnElement[Any]] = []
+    for name in schema.model_fields:
+        value = nested.get(name, source.c.get(name))
+        if value is not None:
+            args += [literal_column(f"'{name}'"), value]
+    return func.json_build_object(*args)
+
+
+def _json_array(rows: Select[Any], schema: type[BaseModel], *order: str) -> ColumnElement[Any]:
+    """JSON array of ``rows`` rendered as ``schema`` objects, ``[]`` when empty."""
+    source = rows.subquery()
+    ordering = [source.c[name.lstrip("-")].desc() if name.startswith("-") else source.c[name] for name in order]
+    element = _json_object(source, schema)
+    aggregated = func.json_agg(aggregate_order_by(element, *ordering)) if ordering else func.json_agg(element)
+    return func.coalesce(select(aggregated).select_from(source).scalar_subquery(), literal_column("'[]'::json"))
+
+
+def _child_page_json(
+    model: type[Note | Source | Visit],
+    schema: type[BaseModel],
+    place_id: ColumnElement[Any],
+) -> ColumnElement[Any]:
+    keyset = CHILD_SORT_KEYS[model]
+    rows = (
+        select(*model.__table__.c)
+        .where(model.place_id == place_id)
+        .order_by(*keyset.order_by())
+        .limit(DETAIL_CHILD_LIMIT + 1)
+    )
+    return _json_array(rows, schema, *(f"{'-' if key.descending else ''}{key.column.key}" for key in keyset.keys))
+
+
+def _detail_document() -> Select[Any]:
+    place_id = bindparam("place_id", type_=UUID(as_uuid=True))
+    links = select(*ProviderLink.__table__.c).where(ProviderLink.place_id == place_id)
+    tags = select(*Tag.__table__.c).join(PlaceTag, PlaceTag.tag_id == Tag.id).where(PlaceTag.place_id == place_id)
+    places = Place.__table__
+    document = _json_object(
+        places,
+        PlaceDetail,
+        provider_links=_json_array(links, ProviderLinkResponse, "created_at", "id"),
+        tags=_json_array(tags, TagResponse, "name"),
+        sources=_child_page_json(Source, SourceResponse, place_id),
+        notes=_child_page_json(Note, NoteResponse, place_id),
+        visits=_child_page_json(Visit, VisitResponse, place_id),
+    )
+    return select(cast(document, Text)).where(places.c.id == place_id)
+
+
+# 상세 문서 쿼리 — 모든 하위 컬렉션을 한 문장에서 집계한다
+_DETAIL_DOCUMENT = _detail_document()
+
+
+async def detail_version(db: AsyncSession, place_id: uuid.UUID) -> tuple[Any, ...] | None:
+    """Cheap fingerprint of everything ``get_place_detail`` renders, or None if missing.
+
+    One round trip over indexed child columns: the place's own ``updated_at``
+    and visit aggregates plus (count, max(updated_at)) of each child table.
+    Counts catch deletions that leave the max unchanged.
+    """
+    stats = []
+    for model in (Note, Source, Visit, ProviderLink, PlaceTag):
+        scope = model.place_id == place_id
+        stats.append(select(func.count()).select_from(model).where(scope).scalar_subquery())
+        stats.append(select(func.max(model.updated_at)).where(scope).scalar_subquery())
+    tag_updated = (
+        select(func.max(Tag.updated_at))
+        .join(PlaceTag, PlaceTag.tag_id == Tag.id)
+        .where(PlaceTag.place_id == place_id)
+        .scalar_subquery()
+    )
+    stmt = select(Place.updated_at, Place.visit_count, Place.last_visited_at, tag_updated, *stats).where(
+        Place.id == place_id
+    )
+    row = (await db.execute(stmt)).one_or_none()
+    return tuple(row) if row is not None else None
 
-    stmt = stmt.order_by(Place.created_at.desc(), Place.id.desc()).limit(limit + 1)
-    rows = (await db.execute(stmt)).scalars().all()
 
-    next_cursor: str | None = None
-    if len(rows) > limit:
-        last = rows[limit - 1]
-        next_cursor = _encode_cursor(last.created_at, last.id)
-        rows = rows[:limit]
+def _filter_places[S: Select[Any]](stmt: S, filters: SearchFilters | None, sort: str) -> S:
+    stmt = stmt.where(filter_service.compile_filters(filters))
+    if sort == "recently_visited":
+        stmt = stmt.where(Place.last_visited_at.is_not(None))
+    return stmt
 
-    return rows, next_cursor, total
+
+async def count_places(db: AsyncSession, filters: SearchFilters | None = None, sort: str = "created") -> int:
+    """Count places matching the ``list_places`` filters."""
+    stmt = _filter_places(select(func.count()).select_from(Place), filters, sort)
+    return int((await db.execute(stmt)).scalar_one())
+
+
+async def list_version(
+    db: AsyncSession,
+    cursor: str | None,
+    limit: int,
+    filters: SearchFilters | None = None,
+    sort: str = "created",
+) -> tuple[Any, ...]:
+    """Fingerprint of one ``list_places`` page without hydrating places.
+
+    Runs the same keyset scan over just the columns that change a
+    ``PlaceBrief`` (edits bump ``updated_at``; visits change the aggregates).
+    """
+    keyset = SORT_KEYS[sort]
+    stmt = _filter_places(
+        select(Place.id, Place.updated_at, Place.visit_count, Place.last_visited_at),
+        filters,
+        sort,
+    )
+    if cursor:
+        stmt = stmt.where(keyset.after(keyset.decode(cursor)))
+    stmt = stmt.order_by(*keyset.order_by()).limit(limit + 1)
+    return tuple(tuple(row) for row in (await db.execute(stmt)).all())
+
+
+async def list_places(
+    db: AsyncSession,
+    cursor: str | None,
+    limit: int,
+    filters: SearchFilters | None = None,
+    sort: str = "created",
+    total: int | None = None,
+) -> tuple[list[Place], str | None, int]:
+    """List places with cursor-based pagination.
+
+    Args:
+        db: Async database session.
+        cursor: Opaque cursor from the previous page.
+        limit: Page size.
+        filters: PRD filter object, compiled by ``filter_service.compile_filters``.
+        sort: One of ``SORT_KEYS``, always descending. "recently_visited" only
+            lists places with at least one visit.
+        total: Matching count if the caller already has it (skips the count query).
+
+    Returns:
+        Tuple of (places, next cursor, total matching count).
+    """
+    if total is None:
+        total = await count_places(db, filters, sort)
+    stmt = _filter_places(select(Place).options(selectinload(Place.tags)), filters, sort)
+    page = await paginate(db, stmt, SORT_KEYS[sort], cursor, limit)
+    return page.items, page.next_cursor, total
+
+
+async def renormalize_chunk(
+    db: AsyncSession,
+    after_id: uuid.UUID | None,
+    limit: int,
+) -> tuple[uuid.UUID | None, int, int]:
+    """Recompute ``normalized_name`` for the next ``limit`` places in id order.
+
+    Reads one keyset chunk, normalizes it in a single batch call and writes
+    only the rows whose value changed with one ``UPDATE ... FROM (VALUES ...)``.
+    The caller owns the transaction.
+
+    Args:
+        db: Async database session.
+        after_id: Last id of the previous chunk, or None to start.
+        limit: Chunk size.
+
+    Returns:
+        Tuple of (last id scanned or None when done, rows scanned, rows updated).
+    """
+    stmt = select(Place.id, Place.canonical_name, Place.normalized_name).order_by(Place.id).limit(limit)
+    if after_id is not None:
+        stmt = stmt.where(Place.id > after_id)
+    rows = (await db.execute(stmt)).all()
+    if not rows:
+        return None, 0, 0
+
+    normalized = normalize_place_names([row.canonical_name for row in rows])
+    changed = [(row.id, name) for row, name in zip(rows, normalized, strict=True) if name != row.normalized_name]
+    if changed:
+        fresh = values(column("id", UUID(as_uuid=True)), column("normalized_name", Text), name="fresh").data(changed)
+        await db.execute(
+            update(Place)
+            .where(Place.id == fresh.c.id)
+            .values(normalized_name=fresh.c.normalized_name)
+            .execution_options(synchronize_session=False)
+        )
+        await outbox_service.record_changes(
+            db, "place", "update", [place_id for place_id, _ in changed], {"fields": ["normalized_name"]}
+        )
+    return rows[-1].id, len(rows), len(changed)
 
 
 async def update_place(db: AsyncSession, place_id: uuid.UUID, data: PlaceUpdate) -> Place | None:
@@ -177,15 +465,39 @@ async def update_place(db: AsyncSession, place_id: uuid.UUID, data: PlaceUpdate)
     if tags is not None:
         place.tags = await _upsert_tags(db, tags)
 
-    await db.commit()
+    outbox_service.record_change(db, "place", "update", place_id, payload={"fields": sorted(data.model_fields_set)})
+    await outbox_service.commit(db)
     return await _load_place(db, place_id)
 
 
 async def delete_place(db: AsyncSession, place_id: uuid.UUID) -> bool:
     """Delete place by id."""
-    place = await db.get(Place, place_id)
-    if place is None:
-        return False
-    await db.delete(place)
-    await db.commit()
-    return True
+    return bool(await delete_places(db, [place_id]))
+
+
+async def delete_places(db: AsyncSession, place_ids: Sequence[uuid.UUID]) -> list[uuid.UUID]:
+    """Delete places with one DELETE; their children go with them via ON DELETE CASCADE.
+
+    Nothing is loaded into the session, so the cost does not grow with the
+    number of notes, sources, visits or media attached.
+
+    Returns:
+        Ids that existed and were deleted.
+    """
+    blob_hashes = (
+        await db.scalars(
+            select(Source.raw_text_hash)
+            .where(Source.place_id.in_(place_ids), Source.raw_text_hash.is_not(None))
+            .distinct()
+        )
+    ).all()
+    deleted = list((await db.scalars(delete(Place).where(Place.id.in_(place_ids)).returning(Place.id))).all())
+    if not deleted:
+        await db.rollback()
+        return []
+
+    await outbox_service.record_changes(db, "place", "delete", deleted)
+    if blob_hashes:
+        await source_service.prune_blobs(db, blob_hashes)
+    await outbox_service.commit(db)
+    return deleted
@@ -0,0 +1,303 @@
+"""Rule-based search query parsing with LLM fallback (FR-3.2)."""
+
+from __future__ import annotations
+
+import logging
+import re
+from collections import Counter
+from collections.abc import Callable
+from dataclasses import dataclass
+from typing import Any
+
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.config import settings
+from app.llm.base import BaseLLM, LLMError
+from app.models.ontology import OntologyNode
+from app.schemas.search import ParsedQuery, QueryParserStats, SearchFilters, SearchIntent
+from app.utils.aho_corasick import AhoCorasick
+from app.utils.cache import TTLCache
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True)
+class _Term:
+    """Lexicon entry: the SearchFilters field a surface form sets and its value.
+
+    field "keyword" keeps the term in search_text (e.g. cuisines), "stopword"
+    only counts towards coverage.
+    """
+
+    field: str
+    value: Any
+    label: str | None = None
+
+
+_LIST_FIELDS = {"mood", "situations", "companions", "tags"}
+
+# 온톨로지 namespace → SearchFilters 필드
+_NAMESPACE_FIELDS = {
+    "mood": "mood",
+    "situation": "situations",
+    "companion": "companions",
+    "feature": "tags",
+    "cuisine": "keyword",
+}
+
+# 자주 쓰이는 표현 → PRD 필터 값. 온톨로지 노드보다 우선한다.
+_BUILTIN_TERMS: dict[str, tuple[str, Any]] = {
+    "주차": ("parking", True),
+    "주차장": ("parking", True),
+    "예약가능": ("reservation", "available"),
+    "예약 가능": ("reservation", "available"),
+    "예약필수": ("reservation", "required"),
+    "예약 필수": ("reservation", "required"),
+    "조용": ("mood", "quiet"),
+    "한적": ("mood", "quiet"),
+    "로맨틱": ("mood", "romantic"),
+    "분위기 좋은": ("mood", "romantic"),
+    "캐주얼": ("mood", "casual"),
+    "편안": ("mood", "casual"),
+    "힙한": ("mood", "hip"),
+    "뷰맛집": ("mood", "view"),
+    "뷰 맛집": ("mood", "view"),
+    "데이트": ("companions", "date"),
+    "연인": ("companions", "date"),
+    "가족": ("companions", "family"),
+    "부모님": ("companions", "family"),
+    "혼밥": ("companions", "solo"),
+    "혼자": ("companions", "solo"),
+    "친구": ("companions", "friends"),
+    "회식": ("companions", "coworkers"),
+    "비 오는 날": ("situations", "rainy"),
+    "비오는날": ("situations", "rainy"),
+    "비 올 때": ("situations", "rainy"),
+    "야간": ("situations", "night"),
+    "밤": ("situations", "night"),
+    "심야": ("situations", "night"),
+    "주말": ("situations", "weekend"),
+    "기념일": ("situations", "anniversary"),
+    "아이 동반": ("situations", "kids"),
+    "아이랑": ("situations", "kids"),
+    "저렴": ("price_range", "cheap"),
+    "가성비": ("price_range", "cheap"),
+    "싼": ("price_range", "cheap"),
+    "적당한 가격": ("price_range", "moderate"),
+    "비싼": ("price_range", "expensive"),
+    "고급": ("price_range", "expensive"),
+    "카페": ("category_primary", "카페"),
+    "음식점": ("category_primary", "음식점"),
+    "식당": ("category_primary", "음식점"),
+    "즐겨찾기": ("is_favorite", True),
+    "맛집": ("stopword", None),
+    "추천": ("stopword", None),
+    "좋은": ("stopword", None),
+    "괜찮은": ("stopword", None),
+    "가기": ("stopword", None),
+    "갈만한": ("stopword", None),
+    "있는": ("stopword", None),
+    "가능": ("stopword", None),
+    "근처": ("stopword", None),
+    "어디": ("stopword", None),
+    "찾아줘": ("stopword", None),
+    "알려줘": ("stopword", None),
+    "곳": ("stopword", None),
+    "집": ("stopword", None),
+}
+
+# 용어 바로 뒤에 붙는 조사/어미 — 커버리지로 인정한다
+_SUFFIXES = {
+    "한", "은", "는", "이", "가", "을", "를", "에", "로", "랑", "과", "와", "도",
+    "에서", "으로", "이랑", "하고", "하게", "하기",
+}  # fmt: skip
+
+_DISTANCE_PATTERN = re.compile(r"(\d+(?:\.\d+)?)\s*(?:km|킬로(?:미터)?)(?:\s*(?:이내|안))?")
+_RATING_PATTERN = re.compile(r"([1-5])\s*점\s*이상")
+_SPACE_PATTERN = re.compile(r"\s+")
+
+_parser_cache: TTLCache[str, QueryParser] = TTLCache(maxsize=1, ttl=600)
+_stats: Counter[str] = Counter()
+
+
+class QueryParser:
+    """Deterministic query parser over an Aho-Corasick lexicon automaton.
+
+    Confidence is the share of non-space query characters explained by known
+    terms, attached particles, distance/rating patterns and stopwords.
+    """
+
+    def __init__(self, terms: dict[str, _Term]) -> None:
+        self._automaton: AhoCorasick[_Term] = AhoCorasick()
+        for surface, term in terms.items():
+            self._automaton.add(surface, term)
+
+    def __len__(self) -> int:
+        return len(self._automaton)
+
+    @classmethod
+    def from_ontology(cls, nodes: list[tuple[str, str]]) -> QueryParser:
+        """Build a parser from (name, namespace) ontology pairs plus the builtin lexicon."""
+        terms: dict[str, _Term] = {}
+        for name, namespace in nodes:
+            field = _NAMESPACE_FIELDS.get(namespace)
+            surface = _normalize(name)
+            if field and surface:
+                terms[surface] = _Term(field, name, f"{namespace}:{name}")
+        for surface, (field, value) in _BUILTIN_TERMS.items():
+            terms[surface] = _Term(field, value, _label(field, value))
+        return cls(terms)
+
+    def parse(self, query: str) -> tuple[SearchIntent, float, list[str]]:
+        """Parse a query without any I/O.
+
+        Returns:
+            Tuple of (intent, confidence in [0, 1], matched "namespace:value" labels).
+        """
+        text = _normalize(query)
+        covered = [False] * len(text)
+        filters: dict[str, Any] = {}
+        matched: list[str] = []
+
+        def cover(start: int, end: int) -> None:
+            for index in range(start, end):
+                covered[index] = True
+
+        for pattern, field, cast in (
+            (_DISTANCE_PATTERN, "max_distance_km", float),
+            (_RATING_PATTERN, "min_rating", int),
+        ):
+            found = pattern.search(text)
+            if found:
+                filters[field] = cast(found.group(1))
+                matched.append(f"{field}:{found.group(1)}")
+                cover(*found.span())
+
+        keywords: list[str] = []
+        for match in self._automaton.find_longest(text):
+            if any(covered[match.start : match.end]):
+                continue
+            cover(match.start, match.end)
+            _cover_suffix(text, match.end, cover)
+            term = match.value
+            if term.field == "stopword":
+                continue
+            if term.field == "keyword":
+                keywords.append(term.value)
+            elif term.field in _LIST_FIELDS:
+                values = filters.setdefault(term.field, [])
+                if term.value not in values:
+                    values.append(term.value)
+            else:
+                filters[term.field] = term.value
+            if term.label and term.label not in matched:
+                matched.append(term.label)
+
+        residual = "".join(char if not covered[index] else " " for index, char in enumerate(text)).split()
+        search_text = " ".join([*residual, *keywords]) or query.strip()
+
+        significant = [index for index, char in enumerate(text) if not char.isspace()]
+        confidence = sum(covered[index] for index in significant) / len(significant) if significant else 0.0
+        if not matched and not keywords:
+            confidence = 0.0
+        intent = SearchIntent(search_text=search_text, filters=SearchFilters(**filters))
+        return intent, round(confidence, 3), matched
+
+
+def _label(field: str, value: Any) -> str | None:
+    if field == "stopword":
+        return None
+    return field if value is True else f"{field}:{value}"
+
+
+def _normalize(text: str) -> str:
+    return _SPACE_PATTERN.sub(" ", text.lower()).strip()
+
+
+def _cover_suffix(text: str, end: int, cover: Callable[[int, int], None]) -> None:
+    tail = text[end:].split(" ", 1)[0]
+    if tail in _SUFFIXES:
+        cover(end, end + len(tail))
+
+
+async def get_query_parser(db: AsyncSession) -> QueryParser:
+    """Return the cached parser, rebuilding it from ontology_nodes when expired."""
+    parser = _parser_cache.get("default")
+    if parser is None:
+        rows = (await db.execute(select(OntologyNode.name, OntologyNode.namespace))).all()
+        parser = QueryParser.from_ontology([(name, namespace) for name, namespace in rows])
+        _parser_cache.set("default", parser)
+    return parser
+
+
+def invalidate_parser() -> None:
+    """Drop the cached parser so the next call reloads the ontology."""
+    _parser_cache.clear()
+
+
+async def resolve_query(
+    parser: QueryParser,
+    query: str,
+    llm: BaseLLM | None = None,
+    min_confidence: float | None = None,
+) -> ParsedQuery:
+    """Parse with the rule-based fast path, escalating to the LLM when unsure.
+
+    Filters the rules found are kept where the LLM left them empty. If the LLM
+    call fails, the rule-based result is returned as is.
+
+    Args:
+        parser: Lexicon parser.
+        query: Natural-language query.
+        llm: LLM used for escalation. Defaults to the shared router.
+        min_confidence: Fast-path threshold. Defaults to settings.
+
+    Returns:
+        Parsed query with its source and confidence.
+    """
+    threshold = settings.query_parser_min_confidence if min_confidence is None else min_confidence
+    intent, confidence, matched = parser.parse(query)
+    _stats["total"] += 1
+    if confidence >= threshold:
+        _stats["fast_path"] += 1
+        return ParsedQuery(intent=intent, source="rules", confidence=confidence, matched=matched)
+
+    if llm is None:
+        from app.llm.router import get_llm_router
+
+        llm = get_llm_router()
+    try:
+        llm_intent = await llm.parse_search_intent(query)
+    except LLMError:
+        _stats["llm_failed"] += 1
+        logger.warning("LLM query parsing failed; using rule-based result", exc_info=True)
+        return ParsedQuery(intent=intent, source="rules", confidence=confidence, matched=matched)
+
+    _stats["llm"] += 1
+    rule_filters = intent.filters.model_dump(exclude_none=True)
+    merged = {**rule_filters, **llm_intent.filters.model_dump(exclude_none=True)}
+    return ParsedQuery(
+        intent=SearchIntent(search_text=llm_intent.search_text, filters=SearchFilters(**merged)),
+        source="llm",
+        confidence=confidence,
+        matched=matched,
+    )
+
+
+async def parse_query(db: AsyncSession, query: str, llm: BaseLLM | None = None) -> ParsedQuery:
+    """Parse a search query into a SearchIntent (fast path first, LLM fallback)."""
+    parser = await get_query_parser(db)
+    return await resolve_query(parser, query, llm=llm)
+
+
+def parser_stats() -> QueryParserStats:
+    """Fast-path hit-rate counters since process start."""
+    total = _stats["total"]
+    return QueryParserStats(
+        total=total,
+        fast_path=_stats["fast_path"],
+        llm=_stats["llm"],
+        llm_failed=_stats["llm_failed"],
+        fast_path_hit_rate=round(_stats["fast_path"] / total, 3) if total else 0.0,
+    )
@@ -0,0 +1,203 @@
+"""Per-place keyword search documents — incremental maintenance and keyword retrieval.
+
+Each place has one ``place_search_documents`` row holding its name, tags,
+mood/situations, source titles/snippets and note text, both as a weighted
+``tsvector`` (GIN) and as plain text (trigram GIN). A durable outbox handler
+rebuilds the rows of places whose data changed, so keyword search is one
+indexed query over that table instead of scanning notes and sources and
+joining back to places.
+"""
+
+from __future__ import annotations
+
+import uuid
+from collections.abc import Sequence
+from dataclasses import dataclass
+from typing import Any
+
+from sqlalchemy import ColumnElement, Select, Text, any_, bindparam, cast, func, literal_column, or_, select
+from sqlalchemy.dialects.postgresql import ARRAY, UUID, insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.deps import async_session_factory
+from app.models.note import Note
+from app.models.place import Place
+from app.models.search import PlaceSearchDocument
+from app.models.source import Source
+from app.models.tag import PlaceTag, Tag
+from app.schemas.search import SearchFilters
+from app.services import bitmap_index_service, filter_service, outbox_service
+from app.services.outbox_service import ChangeEvent
+
+# 한국어 형태소 사전이 없으므로 공백 토큰화만 하는 simple 설정을 쓰고, 어절 변형은 트라이그램이 맡는다
+_TS_CONFIG = literal_column("'simple'::regconfig")
+
+# 문서 내용에 영향을 주는 이벤트 (태그 연결 변경은 place update로 기록된다)
+_DOCUMENT_ENTITY_TYPES = frozenset({"place", "note", "source"})
+
+# 트라이그램은 3글자부터 생긴다 — 더 짧은 검색어의 ILIKE는 인덱스 전체를 훑는다
+_MIN_SUBSTRING_LENGTH = 3
+
+
+@dataclass(frozen=True)
+class KeywordHit:
+    """One keyword search result."""
+
+    place_id: uuid.UUID
+    rank: float
+
+
+def _joined(rows: Select[Any]) -> ColumnElement[str]:
+    return func.coalesce(rows.scalar_subquery(), "")
+
+
+def _weighted(value: ColumnElement[str], weight: str) -> ColumnElement[Any]:
+    return func.setweight(func.to_tsvector(_TS_CONFIG, value), literal_column(f"'{weight}'"))
+
+
+def _document_rows(place_ids: Sequence[uuid.UUID]) -> Select[Any]:
+    """(place_id, document, body) of ``place_ids`` computed from the live tables."""
+    tags = _joined(
+        select(func.string_agg(Tag.name, " "))
+        .join(PlaceTag, PlaceTag.tag_id == Tag.id)
+        .where(PlaceTag.place_id == Place.id)
+    )
+    empty = cast(literal_column("'{}'"), ARRAY(Text))
+    attributes = func.array_to_string(
+        func.array_cat(func.coalesce(Place.mood, empty), func.coalesce(Place.situations, empty)), " "
+    )
+    sources = _joined(
+        select(func.string_agg(func.concat_ws(" ", Source.title, Source.snippet), " ")).where(
+            Source.place_id == Place.id
+        )
+    )
+    notes = _joined(select(func.string_agg(Note.content, " ")).where(Note.place_id == Place.id))
+    # 하위 집계를 한 번만 계산하도록 부분별로 먼저 모은 뒤 문서를 만든다
+    parts = (
+        select(
+            Place.id.label("place_id"),
+            Place.canonical_name.label("name"),
+            func.concat_ws(" ", tags, attributes).label("labels"),
+            sources.label("sources"),
+            notes.label("notes"),
+        )
+        .where(Place.id.in_(place_ids))
+        .subquery()
+    )
+
+    document = (
+        _weighted(parts.c.name, "A")
+        .op("||")(_weighted(parts.c.labels, "B"))
+        .op("||")(_weighted(parts.c.sources, "C"))
+        .op("||")(_weighted(parts.c.notes, "D"))
+    )
+    body = func.concat_ws(" ", parts.c.name, parts.c.labels, parts.c.sources, parts.c.notes)
+    return select(parts.c.place_id, document, body)
+
+
+async def refresh_documents(db: AsyncSession, place_ids: Sequence[uuid.UUID]) -> int:
+    """Rebuild the search documents of ``place_ids``; the caller owns the transaction.
+
+    Deleted places need nothing: their documents go with them by cascade.
+
+    Returns:
+        Number of documents written.
+    """
+    if not place_ids:
+        return 0
+    stmt = insert(PlaceSearchDocument).from_select(["place_id", "document", "body"], _document_rows(place_ids))
+    result = await db.execute(
+        stmt.on_conflict_do_update(
+            index_elements=[PlaceSearchDocument.place_id],
+            set_={"document": stmt.excluded.document, "body": stmt.excluded.body, "updated_at": func.now()},
+        )
+    )
+    return result.rowcount or 0
+
+
+def _prefix_tsquery(value: str) -> ColumnElement[Any]:
+    quoted = value.replace("'", "''")
+    return func.to_tsquery(_TS_CONFIG, f"'{quoted}':*")
+
+
+def _like_pattern(value: str) -> str:
+    escaped = value.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+    return f"%{escaped}%"
+
+
+async def keyword_search(
+    db: AsyncSession,
+    query: str,
+    limit: int = 20,
+    filters: SearchFilters | None = None,
+) -> list[KeywordHit]:
+    """Places whose search document matches ``query``, best first.
+
+    A place matches if its ``tsvector`` matches the query (web-search syntax:
+    quoted phrases, ``or``, ``-word``) or its text contains the query as a
+    substring, served by the trigram index. Queries shorter than three
+    characters have no trigrams, so instead of the substring test they also
+    match words starting with the query (``카페`` finds ``카페에서``). Ranked by
+    ``ts_rank`` (name > tags/mood > sources > notes), then by trigram word
+    similarity.
+
+    Args:
+        db: Async database session.
+        query: Keyword query.
+        limit: Maximum hits.
+        filters: PRD filter object. ``mood``/``situations``/``tags`` are answered
+            by the bitmap index when it is ready, the rest is compiled by
+            ``filter_service.compile_filters``.
+
+    Raises:
+        ValueError: If the query is blank or the filters are inconsistent.
+    """
+    query = query.strip()
+    if not query:
+        raise ValueError("Query must not be blank")
+
+    tsquery: ColumnElement[Any] = func.websearch_to_tsquery(_TS_CONFIG, query)
+    if len(query) < _MIN_SUBSTRING_LENGTH:
+        tsquery = tsquery.op("||")(_prefix_tsquery(query))
+        match = PlaceSearchDocument.document.op("@@")(tsquery)
+    else:
+        match = or_(
+            PlaceSearchDocument.document.op("@@")(tsquery),
+            PlaceSearchDocument.body.ilike(_like_pattern(query), escape="\\"),
+        )
+    rank = func.ts_rank(PlaceSearchDocument.document, tsquery).label("rank")
+    stmt = (
+        select(PlaceSearchDocument.place_id, rank)
+        .where(match)
+        .order_by(rank.desc(), func.word_similarity(query, PlaceSearchDocument.body).desc())
+        .limit(limit)
+    )
+    if filters is not None:
+        place_ids, filters = bitmap_index_service.restrict(filters)
+        if place_ids is not None:
+            if not place_ids:
+                return []
+            ids = bindparam("place_ids", place_ids, type_=ARRAY(UUID(as_uuid=True)))
+            stmt = stmt.where(PlaceSearchDocument.place_id == any_(ids))
+        stmt = stmt.join(Place, Place.id == PlaceSearchDocument.place_id).where(filter_service.compile_filters(filters))
+    rows = await db.execute(stmt)
+    return [KeywordHit(row.place_id, float(row.rank)) for row in rows]
+
+
+async def _refresh_changed(events: Sequence[ChangeEvent]) -> None:
+    place_ids = list(
+        dict.fromkeys(
+            event.place_id
+            for event in events
+            if event.place_id is not None and event.entity_type in _DOCUMENT_ENTITY_TYPES
+        )
+    )
+    if not place_ids:
+        return
+    async with async_session_factory() as db:
+        await refresh_documents(db, place_ids)
+        await db.commit()
+
+
+# 재시작 후에도 놓친 변경을 이어서 반영하도록 오프셋을 DB에 저장한다
+outbox_service.register_handler("search-documents", _refresh_changed, durable=True)
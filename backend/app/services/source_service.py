@@ -0,0 +1,94 @@
+"""Sources and their raw text blobs.
+
+Raw page text is large and rarely read, so it never rides along with a source
+row: it is zlib-compressed (HTTP ``deflate``) into ``source_blobs`` keyed by
+its SHA-256, so identical scrapes are stored once, and served on its own by
+``GET /sources/{id}/raw``.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import uuid
+import zlib
+from collections.abc import Sequence
+
+from sqlalchemy import delete, select
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models.source import Source, SourceBlob
+from app.schemas.source import SourceCreate
+from app.services import outbox_service
+
+_COMPRESS_LEVEL = 6
+
+
+async def store_blob(db: AsyncSession, raw_text: str) -> tuple[str, int]:
+    """Store ``raw_text`` once and return (content hash, size in UTF-8 bytes)."""
+    data = raw_text.encode("utf-8")
+    content_hash = hashlib.sha256(data).hexdigest()
+    await db.execute(
+        insert(SourceBlob)
+        .values(content_hash=content_hash, data=zlib.compress(data, _COMPRESS_LEVEL), size=len(data))
+        .on_conflict_do_nothing(index_elements=[SourceBlob.content_hash])
+    )
+    return content_hash, len(data)
+
+
+async def create_source(db: AsyncSession, data: SourceCreate) -> Source:
+    """Create a source, moving its raw text into a blob."""
+    values = data.model_dump(exclude={"raw_text"})
+    if data.raw_text is not None:
+        values["raw_text_hash"], values["raw_text_size"] = await store_blob(db, data.raw_text)
+    source = Source(**values)
+    db.add(source)
+    await db.flush()
+    outbox_service.record_change(db, "source", "insert", source.place_id, source.id)
+    await outbox_service.commit(db)
+    await db.refresh(source)
+    return source
+
+
+async def get_raw_blob(db: AsyncSession, source_id: uuid.UUID) -> SourceBlob | None:
+    """Blob holding a source's raw text, or None if the source or its text is missing."""
+    return await db.scalar(
+        select(SourceBlob).join(Source, Source.raw_text_hash == SourceBlob.content_hash).where(Source.id == source_id)
+    )
+
+
+def decompress(blob: SourceBlob) -> bytes:
+    """UTF-8 bytes of a blob's text."""
+    return zlib.decompress(blob.data)
+
+
+async def delete_source(db: AsyncSession, source_id: uuid.UUID) -> bool:
+    """Delete a source and its blob if no other source shares it."""
+    source = await db.get(Source, source_id)
+    if source is None:
+        return False
+    await db.delete(source)
+    outbox_service.record_change(db, "source", "delete", source.place_id, source.id)
+    if source.raw_text_hash is not None:
+        await db.flush()
+        await prune_blobs(db, [source.raw_text_hash])
+    await outbox_service.commit(db)
+    return True
+
+
+async def prune_blobs(db: AsyncSession, content_hashes: Sequence[str] | None = None) -> int:
+    """Delete blobs no source references any more; the caller owns the transaction.
+
+    Args:
+        db: Async database session.
+        content_hashes: Only consider these blobs (default: all).
+
+    Returns:
+        Number of blobs deleted.
+    """
+    referenced = select(Source.id).where(Source.raw_text_hash == SourceBlob.content_hash)
+    stmt = delete(SourceBlob).where(~referenced.exists())
+    if content_hashes is not None:
+        stmt = stmt.where(SourceBlob.content_hash.in_(content_hashes))
+    result = await db.execute(stmt)
+    return result.rowcount or 0
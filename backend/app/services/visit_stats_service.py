@@ -0,0 +1,131 @@
+"""Denormalized visit aggregates on places (visit_count, last_visited_at, rating sums).
+
+Every function here only issues statements; the caller owns the transaction so
+the aggregate change commits atomically with the visit change.
+"""
+
+from __future__ import annotations
+
+import uuid
+from collections.abc import Sequence
+from typing import Any
+
+from sqlalchemy import Numeric, case, func, select, tuple_, update
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import aliased
+from sqlalchemy.sql.elements import ColumnElement
+
+from app.models.place import Place
+from app.models.visit import Visit
+
+
+async def record_visit(db: AsyncSession, visit: Visit) -> None:
+    """Fold a new visit into its place's aggregates."""
+    await db.execute(
+        update(Place)
+        .where(Place.id == visit.place_id)
+        .values(
+            visit_count=Place.visit_count + 1,
+            last_visited_at=func.greatest(Place.last_visited_at, visit.visited_at),
+            visit_rating_sum=Place.visit_rating_sum + (visit.rating or 0),
+            visit_rating_count=Place.visit_rating_count + (1 if visit.rating is not None else 0),
+            updated_at=Place.updated_at,
+        )
+        .execution_options(synchronize_session=False)
+    )
+
+
+async def forget_visit(db: AsyncSession, visit: Visit) -> None:
+    """Remove a deleted visit from its place's aggregates.
+
+    Must run after the visit row is deleted: last_visited_at is re-read from the
+    remaining visits only when the deleted visit was the latest one.
+    """
+    remaining_latest = select(func.max(Visit.visited_at)).where(Visit.place_id == visit.place_id).scalar_subquery()
+    await db.execute(
+        update(Place)
+        .where(Place.id == visit.place_id)
+        .values(
+            visit_count=func.greatest(Place.visit_count - 1, 0),
+            last_visited_at=case(
+                (Place.last_visited_at > visit.visited_at, Place.last_visited_at),
+                else_=remaining_latest,
+            ),
+            visit_rating_sum=Place.visit_rating_sum - (visit.rating or 0),
+            visit_rating_count=Place.visit_rating_count - (1 if visit.rating is not None else 0),
+            updated_at=Place.updated_at,
+        )
+        .execution_options(synchronize_session=False)
+    )
+
+
+async def merge_stats(db: AsyncSession, keep_id: uuid.UUID, merge_id: uuid.UUID) -> None:
+    """Add merge_id's aggregates into keep_id (visits are moved by the caller)."""
+    merged = aliased(Place)
+    await db.execute(
+        update(Place)
+        .where(Place.id == keep_id, merged.id == merge_id)
+        .values(
+            visit_count=Place.visit_count + merged.visit_count,
+            last_visited_at=func.greatest(Place.last_visited_at, merged.last_visited_at),
+            visit_rating_sum=Place.visit_rating_sum + merged.visit_rating_sum,
+            visit_rating_count=Place.visit_rating_count + merged.visit_rating_count,
+            updated_at=Place.updated_at,
+        )
+        .execution_options(synchronize_session=False)
+    )
+
+
+async def recompute(db: AsyncSession, place_ids: Sequence[uuid.UUID] | None = None) -> int:
+    """Rebuild aggregates from the visits table.
+
+    Only rows whose stored aggregates drifted are written.
+
+    Args:
+        db: Async database session.
+        place_ids: Places to repair. None repairs every place.
+
+    Returns:
+        Number of places whose aggregates were corrected.
+    """
+    actual = (
+        select(
+            Place.id.label("place_id"),
+            func.count(Visit.id).label("visit_count"),
+            func.max(Visit.visited_at).label("last_visited_at"),
+            func.coalesce(func.sum(Visit.rating), 0).label("visit_rating_sum"),
+            func.count(Visit.rating).label("visit_rating_count"),
+        )
+        .select_from(Place)
+        .outerjoin(Visit, Visit.place_id == Place.id)
+        .group_by(Place.id)
+    )
+    if place_ids is not None:
+        actual = actual.where(Place.id.in_(place_ids))
+    actual_sq = actual.subquery("actual")
+
+    stored = tuple_(Place.visit_count, Place.last_visited_at, Place.visit_rating_sum, Place.visit_rating_count)
+    expected = tuple_(
+        actual_sq.c.visit_count,
+        actual_sq.c.last_visited_at,
+        actual_sq.c.visit_rating_sum,
+        actual_sq.c.visit_rating_count,
+    )
+    result = await db.execute(
+        update(Place)
+        .where(Place.id == actual_sq.c.place_id, stored.is_distinct_from(expected))
+        .values(
+            visit_count=actual_sq.c.visit_count,
+            last_visited_at=actual_sq.c.last_visited_at,
+            visit_rating_sum=actual_sq.c.visit_rating_sum,
+            visit_rating_count=actual_sq.c.visit_rating_count,
+            updated_at=Place.updated_at,
+        )
+        .execution_options(synchronize_session=False)
+    )
+    return result.rowcount or 0
+
+
+def average_rating_expression() -> ColumnElement[Any]:
+    """SQL expression for the mean visit rating (NULL when no visit was rated)."""
+    return Place.visit_rating_sum.cast(Numeric) / func.nullif(Place.visit_rating_count, 0)
@@ -0,0 +1,101 @@
+"""Aho-Corasick multi-pattern matcher."""
+
+from __future__ import annotations
+
+from collections import deque
+from dataclasses import dataclass
+
+
+@dataclass(frozen=True)
+class Match[V]:
+    """Pattern occurrence in the scanned text, ``text[start:end] == pattern``."""
+
+    start: int
+    end: int
+    pattern: str
+    value: V
+
+
+class AhoCorasick[V]:
+    """Character-level Aho-Corasick automaton.
+
+    Patterns are added with ``add`` and the automaton is finalized lazily on the
+    first search. Scanning is linear in the text length plus the number of matches,
+    independent of how many patterns are registered.
+    """
+
+    def __init__(self) -> None:
+        self._goto: list[dict[str, int]] = [{}]
+        self._fail: list[int] = [0]
+        self._own: list[tuple[str, V] | None] = [None]
+        # 노드별 출력 — 실패 링크로 이어지는 접미사 패턴까지 포함 (build 시 계산)
+        self._output: list[tuple[tuple[str, V], ...]] = [()]
+        self._size = 0
+        self._built = False
+
+    def __len__(self) -> int:
+        return self._size
+
+    def add(self, pattern: str, value: V) -> None:
+        """Register a pattern. Re-adding a pattern replaces its value."""
+        if not pattern:
+            raise ValueError("Pattern must not be empty")
+        node = 0
+        for char in pattern:
+            next_node = self._goto[node].get(char)
+            if next_node is None:
+                next_node = len(self._goto)
+                self._goto[node][char] = next_node
+                self._goto.append({})
+                self._fail.append(0)
+                self._own.append(None)
+            node = next_node
+        if self._own[node] is None:
+            self._size += 1
+        self._own[node] = (pattern, value)
+        self._built = False
+
+    def _build(self) -> None:
+        self._output = [()] * len(self._goto)
+        queue: deque[int] = deque()
+        for child in self._goto[0].values():
+            self._fail[child] = 0
+            queue.append(child)
+        while queue:
+            node = queue.popleft()
+            own = self._own[node]
+            inherited = self._output[self._fail[node]]
+            self._output[node] = (own, *inherited) if own is not None else inherited
+            for char, child in self._goto[node].items():
+                fallback = self._fail[node]
+                while fallback and char not in self._goto[fallback]:
+                    fallback = self._fail[fallback]
+                self._fail[child] = self._goto[fallback].get(char, 0)
+                queue.append(child)
+        self._built = True
+
+    def iter_matches(self, text: str) -> list[Match[V]]:
+        """Return every (possibly overlapping) match, ordered by end position."""
+        if not self._built:
+            self._build()
+        matches: list[Match[V]] = []
+        node = 0
+        for index, char in enumerate(text):
+            while node and char not in self._goto[node]:
+                node = self._fail[node]
+            node = self._goto[node].get(char, 0)
+            for pattern, value in self._output[node]:
+                end = index + 1
+                matches.append(Match(end - len(pattern), end, pattern, value))
+        return matches
+
+    def find_longest(self, text: str) -> list[Match[V]]:
+        """Return non-overlapping matches, preferring the leftmost then the longest."""
+        candidates = sorted(self.iter_matches(text), key=lambda match: (match.start, -(match.end - match.start)))
+        selected: list[Match[V]] = []
+        cursor = 0
+        for match in candidates:
+            if match.start >= cursor:
+                selected.append(match)
+                cursor = match.end
+        return selected
@@ -0,0 +1,97 @@
+"""Small in-process cache primitives."""
+
+from __future__ import annotations
+
+import asyncio
+import time
+from collections import OrderedDict
+from collections.abc import Awaitable, Callable, Hashable
+
+
+class TTLCache[K: Hashable, V]:
+    """Bounded LRU cache with optional per-entry time-to-live.
+
+    Not thread-safe; intended for use from a single asyncio event loop.
+
+    Args:
+        maxsize: Maximum number of entries kept. Least recently used entries are evicted first.
+        ttl: Seconds an entry stays valid. ``None`` disables expiry.
+        clock: Monotonic clock, injectable for tests.
+    """
+
+    def __init__(self, maxsize: int, ttl: float | None = None, clock: Callable[[], float] = time.monotonic) -> None:
+        if maxsize <= 0:
+            raise ValueError("maxsize must be positive")
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._clock = clock
+        self._data: OrderedDict[K, tuple[float | None, V]] = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def get(self, key: K) -> V | None:
+        """Return the cached value, or None if missing or expired."""
+        entry = self._data.get(key)
+        if entry is None:
+            return None
+        expires_at, value = entry
+        if expires_at is not None and expires_at <= self._clock():
+            del self._data[key]
+            return None
+        self._data.move_to_end(key)
+        return value
+
+    def set(self, key: K, value: V) -> None:
+        """Store a value, evicting the least recently used entry when full."""
+        expires_at = self._clock() + self.ttl if self.ttl is not None else None
+        self._data[key] = (expires_at, value)
+        self._data.move_to_end(key)
+        while len(self._data) > self.maxsize:
+            self._data.popitem(last=False)
+
+    def pop(self, key: K) -> V | None:
+        """Remove and return a value if present."""
+        entry = self._data.pop(key, None)
+        return entry[1] if entry is not None else None
+
+    def discard_where(self, predicate: Callable[[K], bool]) -> int:
+        """Remove every entry whose key matches the predicate.
+
+        Returns:
+            Number of removed entries.
+        """
+        doomed = [key for key in self._data if predicate(key)]
+        for key in doomed:
+            del self._data[key]
+        return len(doomed)
+
+    def clear(self) -> None:
+        self._data.clear()
+
+
+class SingleFlight[K: Hashable, V]:
+    """Coalesces concurrent calls for the same key into one in-flight call.
+
+    The first caller starts the work as a task; callers arriving while it runs
+    await the same task. A caller being cancelled does not cancel the shared work.
+    """
+
+    def __init__(self) -> None:
+        self._inflight: dict[K, asyncio.Task[V]] = {}
+
+    def __len__(self) -> int:
+        return len(self._inflight)
+
+    async def do(self, key: K, fn: Callable[[], Awaitable[V]]) -> V:
+        """Run ``fn`` for the key unless a call for it is already in flight."""
+        task = self._inflight.get(key)
+        if task is None:
+            task = asyncio.ensure_future(fn())
+            self._inflight[key] = task
+            task.add_done_callback(lambda done: self._forget(key, done))
+        return await asyncio.shield(task)
+
+    def _forget(self, key: K, task: asyncio.Task[V]) -> None:
+        if self._inflight.get(key) is task:
+            del self._inflight[key]
@@ -0,0 +1,50 @@
+"""Shared keep-alive HTTP client pool for external APIs."""
+
+from __future__ import annotations
+
+import httpx
+
+_clients: dict[str, httpx.AsyncClient] = {}
+
+
+def get_http_client(
+    name: str,
+    base_url: str = "",
+    timeout: float = 30.0,
+    max_connections: int = 20,
+    headers: dict[str, str] | None = None,
+) -> httpx.AsyncClient:
+    """Return the process-wide client for an upstream, creating it on first use.
+
+    Clients are keyed by name so every caller of the same upstream reuses one
+    connection pool (TLS sessions and keep-alive sockets) instead of opening a
+    new client per request.
+
+    Args:
+        name: Pool name, typically the provider identifier.
+        base_url: Base URL applied to relative request paths.
+        timeout: Default per-request timeout in seconds.
+        max_connections: Upper bound on concurrent connections in the pool.
+        headers: Default headers sent with every request.
+
+    Returns:
+        Shared ``httpx.AsyncClient``.
+    """
+    client = _clients.get(name)
+    if client is None or client.is_closed:
+        client = httpx.AsyncClient(
+            base_url=base_url,
+            timeout=timeout,
+            headers=headers,
+            limits=httpx.Limits(max_connections=max_connections, max_keepalive_connections=max_connections),
+        )
+        _clients[name] = client
+    return client
+
+
+async def close_http_clients() -> None:
+    """Close every pooled client. Called on application shutdown."""
+    clients = list(_clients.values())
+    _clients.clear()
+    for client in clients:
+        await client.aclose()
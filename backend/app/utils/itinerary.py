@@ -0,0 +1,159 @@
+"""Distance, travel-time and visiting-order helpers for itinerary drafting."""
+
+from __future__ import annotations
+
+import math
+from collections.abc import Sequence
+
+EARTH_RADIUS_M = 6_371_008.8
+
+# 직선거리 → 실제 이동거리 보정 계수 (도심 도로망 평균)
+ROAD_DETOUR_FACTOR = 1.3
+WALK_SPEED_M_PER_MIN = 75.0  # 4.5 km/h
+WALK_MAX_ROAD_M = 1_200.0
+TRANSIT_SPEED_M_PER_MIN = 333.0  # 20 km/h (도심 대중교통/차량 평균)
+TRANSIT_OVERHEAD_MIN = 8.0  # 대기/승하차/주차
+
+# Held-Karp is O(2^n * n^2); beyond this many nodes fall back to 2-opt.
+EXACT_MAX_NODES = 10
+
+
+def haversine_m(lat1: float, lng1: float, lat2: float, lng2: float) -> float:
+    """Great-circle distance in meters between two WGS84 points."""
+    phi1 = math.radians(lat1)
+    phi2 = math.radians(lat2)
+    d_phi = phi2 - phi1
+    d_lambda = math.radians(lng2 - lng1)
+    a = math.sin(d_phi / 2) ** 2 + math.cos(phi1) * math.cos(phi2) * math.sin(d_lambda / 2) ** 2
+    return 2 * EARTH_RADIUS_M * math.asin(min(1.0, math.sqrt(a)))
+
+
+def distance_matrix(points: Sequence[tuple[float, float]]) -> list[list[float]]:
+    """Symmetric haversine distance matrix for (lat, lng) points."""
+    n = len(points)
+    matrix = [[0.0] * n for _ in range(n)]
+    for i in range(n):
+        lat1, lng1 = points[i]
+        for j in range(i + 1, n):
+            lat2, lng2 = points[j]
+            d = haversine_m(lat1, lng1, lat2, lng2)
+            matrix[i][j] = d
+            matrix[j][i] = d
+    return matrix
+
+
+def estimate_travel(distance_m: float) -> tuple[str, float]:
+    """Estimate travel mode and minutes for a straight-line distance.
+
+    Args:
+        distance_m: Straight-line distance in meters.
+
+    Returns:
+        Tuple of (mode, minutes) where mode is "walk" or "transit".
+    """
+    road_m = distance_m * ROAD_DETOUR_FACTOR
+    if road_m <= WALK_MAX_ROAD_M:
+        return "walk", road_m / WALK_SPEED_M_PER_MIN
+    return "transit", TRANSIT_OVERHEAD_MIN + road_m / TRANSIT_SPEED_M_PER_MIN
+
+
+def travel_minutes_matrix(distances: Sequence[Sequence[float]]) -> list[list[float]]:
+    """Convert a distance matrix into estimated travel minutes."""
+    return [[estimate_travel(d)[1] if i != j else 0.0 for j, d in enumerate(row)] for i, row in enumerate(distances)]
+
+
+def path_cost(cost: Sequence[Sequence[float]], order: Sequence[int]) -> float:
+    """Total cost of visiting nodes in order (open path, no return)."""
+    return sum(cost[a][b] for a, b in zip(order, order[1:], strict=False))
+
+
+def solve_path(cost: Sequence[Sequence[float]], start: int | None = None) -> list[int]:
+    """Find a low-cost open path visiting every node once.
+
+    Uses exact Held-Karp dynamic programming for small inputs and
+    nearest-neighbour construction refined by 2-opt otherwise.
+
+    Args:
+        cost: Square cost matrix.
+        start: Node the path must begin at. ``None`` lets the solver pick.
+
+    Returns:
+        Node indices in visiting order.
+    """
+    n = len(cost)
+    if n == 0:
+        return []
+    if n <= EXACT_MAX_NODES:
+        return _held_karp(cost, start)
+    return _two_opt(cost, _nearest_neighbour(cost, start), fixed_start=start is not None)
+
+
+def _held_karp(cost: Sequence[Sequence[float]], start: int | None) -> list[int]:
+    nodes = [i for i in range(len(cost)) if i != start]
+    m = len(nodes)
+    if m == 0:
+        return [start] if start is not None else []
+
+    full = (1 << m) - 1
+    dp = [[math.inf] * m for _ in range(full + 1)]
+    parent = [[-1] * m for _ in range(full + 1)]
+    for k, node in enumerate(nodes):
+        dp[1 << k][k] = cost[start][node] if start is not None else 0.0
+
+    for mask in range(1, full + 1):
+        row = dp[mask]
+        for k in range(m):
+            current = row[k]
+            if current == math.inf or not (mask >> k) & 1:
+                continue
+            from_costs = cost[nodes[k]]
+            for nxt in range(m):
+                if (mask >> nxt) & 1:
+                    continue
+                next_mask = mask | (1 << nxt)
+                candidate = current + from_costs[nodes[nxt]]
+                if candidate < dp[next_mask][nxt]:
+                    dp[next_mask][nxt] = candidate
+                    parent[next_mask][nxt] = k
+
+    last = min(range(m), key=lambda k: dp[full][k])
+    order: list[int] = []
+    mask = full
+    while last != -1:
+        order.append(nodes[last])
+        prev = parent[mask][last]
+        mask &= ~(1 << last)
+        last = prev
+    order.reverse()
+    return [start, *order] if start is not None else order
+
+
+def _nearest_neighbour(cost: Sequence[Sequence[float]], start: int | None) -> list[int]:
+    n = len(cost)
+    current = start if start is not None else 0
+    order = [current]
+    remaining = set(range(n)) - {current}
+    while remaining:
+        current = min(remaining, key=lambda j, c=current: (cost[c][j], j))
+        order.append(current)
+        remaining.remove(current)
+    return order
+
+
+def _two_opt(cost: Sequence[Sequence[float]], order: list[int], fixed_start: bool) -> list[int]:
+    """Improve an open path by reversing segments until no move helps."""
+    n = len(order)
+    first = 1 if fixed_start else 0
+    improved = True
+    while improved:
+        improved = False
+        for i in range(first, n - 1):
+            for j in range(i + 1, n):
+                a, b = order[i - 1] if i > 0 else None, order[i]
+                c, d = order[j], order[j + 1] if j + 1 < n else None
+                before = (cost[a][b] if a is not None else 0.0) + (cost[c][d] if d is not None else 0.0)
+                after = (cost[a][c] if a is not None else 0.0) + (cost[b][d] if d is not None else 0.0)
+                if after < before - 1e-9:
+                    order[i : j + 1] = reversed(order[i : j + 1])
+                    improved = True
+    return order
@@ -0,0 +1,234 @@
+"""Keyset pagination with compact, signed cursors.
+
+A cursor is the sort-key values of the last row on a page, packed into a small
+binary record, tagged with a truncated HMAC and base64url-encoded::
+
+    version(1) | value... | hmac(8)
+
+Each value is a one-byte type tag followed by a fixed-size payload (epoch
+microseconds for datetimes, 16 raw bytes for UUIDs, ...), so a
+``(created_at, id)`` cursor is 36 bytes / 48 characters. The HMAC also covers
+the keyset name, so a cursor issued for one listing is rejected by another.
+"""
+
+from __future__ import annotations
+
+import base64
+import binascii
+import hashlib
+import hmac
+import struct
+import uuid
+from collections.abc import Sequence
+from dataclasses import dataclass
+from datetime import UTC, date, datetime, timedelta
+from typing import Any
+
+from sqlalchemy import Select, and_, or_, tuple_
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import InstrumentedAttribute
+from sqlalchemy.sql.elements import ColumnElement
+
+from app.config import settings
+
+_VERSION = 1
+_TAG_SIZE = 8
+_EPOCH = datetime(1970, 1, 1, tzinfo=UTC)
+_EPOCH_DATE = date(1970, 1, 1)
+
+
+class InvalidCursorError(ValueError):
+    """Raised when a cursor is malformed, tampered with or issued for another listing."""
+
+
+@dataclass(frozen=True)
+class SortKey:
+    """One ORDER BY column of a keyset."""
+
+    column: InstrumentedAttribute[Any]
+    descending: bool = True
+
+
+@dataclass(frozen=True)
+class Keyset:
+    """Named, totally ordered sort for keyset pagination.
+
+    The last key must be unique (normally the primary key) so ties never skip rows.
+    Key columns must be NOT NULL (or filtered to non-null rows by the query).
+    """
+
+    name: str
+    keys: tuple[SortKey, ...]
+
+    def order_by(self) -> list[ColumnElement[Any]]:
+        """ORDER BY clauses for the keyset."""
+        return [key.column.desc() if key.descending else key.column.asc() for key in self.keys]
+
+    def after(self, values: Sequence[Any]) -> ColumnElement[bool]:
+        """Predicate selecting rows strictly after ``values`` in keyset order.
+
+        Uniform directions use a row-value comparison, which PostgreSQL matches
+        against a composite index; mixed directions expand to the OR/AND form.
+        """
+        columns = [key.column for key in self.keys]
+        if all(key.descending for key in self.keys):
+            return tuple_(*columns) < tuple_(*values)
+        if not any(key.descending for key in self.keys):
+            return tuple_(*columns) > tuple_(*values)
+
+        clauses = []
+        for index, key in enumerate(self.keys):
+            equal = [columns[i] == values[i] for i in range(index)]
+            beyond = key.column < values[index] if key.descending else key.column > values[index]
+            clauses.append(and_(*equal, beyond))
+        return or_(*clauses)
+
+    def values_of(self, row: Any) -> tuple[Any, ...]:
+        """Sort-key values of an ORM row."""
+        return tuple(getattr(row, key.column.key) for key in self.keys)
+
+    def encode(self, values: Sequence[Any]) -> str:
+        """Pack and sign sort-key values into a cursor string."""
+        body = bytes([_VERSION]) + b"".join(_pack(value) for value in values)
+        return _b64encode(body + _sign(self.name, body))
+
+    def decode(self, cursor: str) -> tuple[Any, ...]:
+        """Verify and unpack a cursor.
+
+        Raises:
+            InvalidCursorError: If the cursor is malformed, fails verification or
+                does not match this keyset's arity.
+        """
+        try:
+            raw = _b64decode(cursor)
+        except (binascii.Error, ValueError) as exc:
+            raise InvalidCursorError("Malformed cursor") from exc
+        if len(raw) <= _TAG_SIZE + 1:
+            raise InvalidCursorError("Malformed cursor")
+        body, tag = raw[:-_TAG_SIZE], raw[-_TAG_SIZE:]
+        if not hmac.compare_digest(tag, _sign(self.name, body)):
+            raise InvalidCursorError("Cursor signature mismatch")
+        if body[0] != _VERSION:
+            raise InvalidCursorError("Unsupported cursor version")
+
+        values: list[Any] = []
+        offset = 1
+        try:
+            while offset < len(body):
+                value, offset = _unpack(body, offset)
+                values.append(value)
+        except (struct.error, IndexError, KeyError, UnicodeDecodeError) as exc:
+            raise InvalidCursorError("Malformed cursor") from exc
+        if len(values) != len(self.keys):
+            raise InvalidCursorError("Cursor does not match this listing")
+        return tuple(values)
+
+
+@dataclass(frozen=True)
+class Page[T]:
+    """One page of rows plus the cursor for the next page (None on the last page)."""
+
+    items: list[T]
+    next_cursor: str | None
+
+
+async def paginate(
+    db: AsyncSession,
+    stmt: Select[Any],
+    keyset: Keyset,
+    cursor: str | None,
+    limit: int,
+) -> Page[Any]:
+    """Run a filtered ORM select as one keyset page.
+
+    Args:
+        db: Async database session.
+        stmt: ``select(Model)`` with filters applied but no ORDER BY/LIMIT.
+        keyset: Sort to paginate by.
+        cursor: Cursor from the previous page, or None for the first page.
+        limit: Page size.
+
+    Returns:
+        Page of ORM rows.
+
+    Raises:
+        InvalidCursorError: If the cursor is invalid.
+    """
+    if cursor:
+        stmt = stmt.where(keyset.after(keyset.decode(cursor)))
+    stmt = stmt.order_by(*keyset.order_by()).limit(limit + 1)
+    rows = list((await db.execute(stmt)).scalars().all())
+
+    next_cursor: str | None = None
+    if len(rows) > limit:
+        rows = rows[:limit]
+        next_cursor = keyset.encode(keyset.values_of(rows[-1]))
+    return Page(items=rows, next_cursor=next_cursor)
+
+
+def _secret() -> bytes:
+    return (settings.cursor_secret or settings.api_key).encode("utf-8")
+
+
+def _sign(name: str, body: bytes) -> bytes:
+    return hmac.new(_secret(), name.encode("utf-8") + b"\x00" + body, hashlib.sha256).digest()[:_TAG_SIZE]
+
+
+def _b64encode(raw: bytes) -> str:
+    return base64.urlsafe_b64encode(raw).rstrip(b"=").decode("ascii")
+
+
+def _b64decode(cursor: str) -> bytes:
+    return base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4))
+
+
+def _pack(value: Any) -> bytes:
+    # bool은 int의 하위 타입이므로 먼저 검사한다
+    if isinstance(value, bool):
+        return b"B" + struct.pack(">?", value)
+    if isinstance(value, datetime):
+        if value.tzinfo is None:
+            value = value.replace(tzinfo=UTC)
+        return b"T" + struct.pack(">q", (value - _EPOCH) // timedelta(microseconds=1))
+    if isinstance(value, date):
+        return b"D" + struct.pack(">i", (value - _EPOCH_DATE).days)
+    if isinstance(value, uuid.UUID):
+        return b"U" + value.bytes
+    if isinstance(value, int):
+        return b"I" + struct.pack(">q", value)
+    if isinstance(value, float):
+        return b"F" + struct.pack(">d", value)
+    if isinstance(value, str):
+        encoded = value.encode("utf-8")
+        return b"S" + struct.pack(">H", len(encoded)) + encoded
+    raise TypeError(f"Unsupported cursor value type: {type(value).__name__}")
+
+
+def _unpack(body: bytes, offset: int) -> tuple[Any, int]:
+    tag, offset = body[offset : offset + 1], offset + 1
+    if tag == b"T":
+        (micros,) = struct.unpack_from(">q", body, offset)
+        return _EPOCH + timedelta(microseconds=micros), offset + 8
+    if tag == b"D":
+        (days,) = struct.unpack_from(">i", body, offset)
+        return _EPOCH_DATE + timedelta(days=days), offset + 4
+    if tag == b"U":
+        if offset + 16 > len(body):
+            raise IndexError("Truncated UUID")
+        return uuid.UUID(bytes=body[offset : offset + 16]), offset + 16
+    if tag == b"I":
+        (number,) = struct.unpack_from(">q", body, offset)
+        return number, offset + 8
+    if tag == b"F":
+        (real,) = struct.unpack_from(">d", body, offset)
+        return real, offset + 8
+    if tag == b"B":
+        (flag,) = struct.unpack_from(">?", body, offset)
+        return flag, offset + 1
+    if tag == b"S":
+        (length,) = struct.unpack_from(">H", body, offset)
+        start = offset + 2
+        if start + length > len(body):
+            raise IndexError("Truncated string")
+        return body[start : start + length].decode("utf-8"), start + length
+    raise KeyError(f"Unknown cursor value tag: {tag!r}")
@@ -0,0 +1,147 @@
+"""Filtered vector search benchmark: one shared HNSW index vs per-entity-type partial indexes.
+
+Loads a skewed mix of entity types (few places, many notes and sources) into
+a scratch table and measures recall@k against exact search, plus latency:
+
+* place-only search through a shared index, where ``entity_type`` is
+  filtered after the index scan, vs through the place-only partial index;
+* all-types search through the shared index vs a concurrent fan-out over the
+  per-type partial indexes merged by distance (what ``embedding_service.search``
+  does without ``entity_type``)::
+
+    python -m benchmarks.bench_filtered_vectors [--rows 30000] [--dims 128] [--k 10] [--ef-search 40]
+
+Requires the database from DATABASE_URL (pgvector); the scratch table is dropped afterwards.
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import heapq
+import itertools
+import random
+import time
+from collections.abc import Awaitable, Callable, Sequence
+
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncConnection
+
+from app.deps import engine
+from benchmarks.synthetic import clustered_vectors, percentile, vector_literal
+
+# 실제 데이터처럼 메모·출처가 장소보다 훨씬 많은 분포
+MIX = {"place": 0.1, "note": 0.45, "source": 0.45}
+
+Search = Callable[[str], Awaitable[list[int]]]
+
+
+async def _top(conn: AsyncConnection, query: str, k: int, entity_type: str | None = None) -> list[tuple[float, int]]:
+    where = f"WHERE entity_type = '{entity_type}' " if entity_type else ""
+    rows = await conn.execute(
+        text(
+            "SELECT id, v <=> CAST(:q AS vector) AS distance FROM bench_filtered_vectors "
+            f"{where}ORDER BY v <=> CAST(:q AS vector) LIMIT :k"
+        ),
+        {"q": query, "k": k},
+    )
+    return [(row.distance, row.id) for row in rows]
+
+
+async def _set(conn: AsyncConnection, name: str, value: object) -> None:
+    await conn.execute(text("SELECT set_config(:name, :value, false)"), {"name": name, "value": str(value)})
+
+
+async def _measure(search: Search, probes: Sequence[str], truth: Sequence[list[int]], k: int) -> str:
+    latencies, recall = [], 0.0
+    for probe, expected in zip(probes, truth, strict=True):
+        started = time.perf_counter()
+        found = await search(probe)
+        latencies.append((time.perf_counter() - started) * 1000)
+        recall += len(set(found) & set(expected)) / k
+    return f"{recall / len(probes):>10.3f} {percentile(latencies, 0.5):>8.2f} {percentile(latencies, 0.95):>8.2f}"
+
+
+async def main(rows: int, dims: int, queries: int, k: int, ef_search: int) -> None:
+    rng = random.Random(3)
+    kinds = rng.choices(list(MIX), weights=list(MIX.values()), k=rows)
+    corpus = clustered_vectors(rows, dims)
+    probes = [vector_literal(v) for v in clustered_vectors(queries, dims, seed=11)]
+
+    async with engine.connect() as setup:
+        setup = await setup.execution_options(isolation_level="AUTOCOMMIT")
+        await setup.execute(text("DROP TABLE IF EXISTS bench_filtered_vectors"))
+        await setup.execute(
+            text(
+                "CREATE UNLOGGED TABLE bench_filtered_vectors "
+                f"(id int PRIMARY KEY, entity_type text, v vector({dims:d}))"
+            )
+        )
+        for start in range(0, rows, 1000):
+            await setup.execute(
+                text("INSERT INTO bench_filtered_vectors VALUES (:id, :kind, CAST(:v AS vector))"),
+                [
+                    {"id": i, "kind": kinds[i], "v": vector_literal(corpus[i])}
+                    for i in range(start, min(rows, start + 1000))
+                ],
+            )
+        await setup.execute(text("ANALYZE bench_filtered_vectors"))
+
+        conns = [await engine.connect() for _ in MIX]
+        try:
+            for conn in conns:
+                await _set(conn, "hnsw.ef_search", ef_search)
+            main_conn = conns[0]
+
+            await _set(main_conn, "enable_indexscan", "off")
+            exact_places = [[i for _, i in await _top(main_conn, probe, k, "place")] for probe in probes]
+            exact_all = [[i for _, i in await _top(main_conn, probe, k)] for probe in probes]
+            await _set(main_conn, "enable_indexscan", "on")
+
+            async def place_only(probe: str) -> list[int]:
+                return [i for _, i in await _top(main_conn, probe, k, "place")]
+
+            async def all_types(probe: str) -> list[int]:
+                return [i for _, i in await _top(main_conn, probe, k)]
+
+            async def fan_out(probe: str) -> list[int]:
+                per_type = await asyncio.gather(
+                    *(_top(conn, probe, k, kind) for conn, kind in zip(conns, MIX, strict=True))
+                )
+                return [i for _, i in heapq.nsmallest(k, itertools.chain.from_iterable(per_type))]
+
+            print(f"{rows} x {dims}d, mix {MIX}, ef_search={ef_search}, k={k}")
+            print(f"{'query':<34} {f'recall@{k}':>10} {'p50 ms':>8} {'p95 ms':>8}")
+
+            await setup.execute(
+                text("CREATE INDEX bench_fv_all ON bench_filtered_vectors USING hnsw (v vector_cosine_ops)")
+            )
+            print(f"{'place-only, shared + post-filter':<34} {await _measure(place_only, probes, exact_places, k)}")
+            print(f"{'all types, shared index':<34} {await _measure(all_types, probes, exact_all, k)}")
+
+            await setup.execute(text("DROP INDEX bench_fv_all"))
+            for kind in MIX:
+                await setup.execute(
+                    text(
+                        f"CREATE INDEX bench_fv_{kind} ON bench_filtered_vectors "
+                        f"USING hnsw (v vector_cosine_ops) WHERE entity_type = '{kind}'"
+                    )
+                )
+            print(f"{'place-only, partial index':<34} {await _measure(place_only, probes, exact_places, k)}")
+            print(f"{'all types, per-type fan-out':<34} {await _measure(fan_out, probes, exact_all, k)}")
+        finally:
+            for conn in conns:
+                await conn.close()
+            await setup.execute(text("DROP TABLE IF EXISTS bench_filtered_vectors"))
+    await engine.dispose()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rows", type=int, default=30000)
+    parser.add_argument("--dims", type=int, default=128)
+    parser.add_argument("--queries", type=int, default=50)
+    parser.add_argument("--k", type=int, default=10)
+    parser.add_argument("--ef-search", type=int, default=40)
+    args = parser.parse_args()
+    asyncio.run(main(args.rows, args.dims, args.queries, args.k, args.ef_search))
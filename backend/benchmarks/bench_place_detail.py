@@ -0,0 +1,112 @@
+"""Place detail loader benchmark: one JSON-aggregating query vs ORM hydration.
+
+Seeds one place with provider links, tags and ``--children`` sources, notes
+and visits, then times ``get_place_detail`` (single statement) against
+``get_place_detail_orm`` (one statement per collection) and counts the
+statements each issues::
+
+    python -m benchmarks.bench_place_detail [--children 50] [--iterations 200]
+
+Requires the database from DATABASE_URL; the seeded place is deleted afterwards.
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import time
+import uuid
+from collections.abc import Awaitable, Callable
+from datetime import date, timedelta
+from typing import Any
+
+from sqlalchemy import delete, event, insert
+
+from app.deps import async_session_factory, engine
+from app.models.note import Note
+from app.models.place import Place, ProviderLink
+from app.models.source import Source
+from app.models.tag import PlaceTag, Tag
+from app.models.visit import Visit
+from app.services import place_service
+from benchmarks.synthetic import percentile
+
+
+async def _seed(children: int) -> tuple[uuid.UUID, list[uuid.UUID]]:
+    place_id = uuid.uuid4()
+    tag_ids = [uuid.uuid4() for _ in range(5)]
+    async with async_session_factory() as db:
+        await db.execute(insert(Place).values(id=place_id, canonical_name="벤치 상세", normalized_name="벤치상세"))
+        await db.execute(
+            insert(ProviderLink),
+            [
+                {"place_id": place_id, "provider": provider, "provider_place_id": f"bench-{provider}"}
+                for provider in ("NAVER", "KAKAO")
+            ],
+        )
+        await db.execute(insert(Tag), [{"id": tag_id, "name": f"bench-{tag_id.hex[:8]}"} for tag_id in tag_ids])
+        await db.execute(insert(PlaceTag), [{"place_id": place_id, "tag_id": tag_id} for tag_id in tag_ids])
+        await db.execute(
+            insert(Source),
+            [
+                {"place_id": place_id, "type": "web", "title": f"source {i}", "snippet": "x" * 200}
+                for i in range(children)
+            ],
+        )
+        await db.execute(insert(Note), [{"place_id": place_id, "content": f"note {i} " * 20} for i in range(children)])
+        await db.execute(
+            insert(Visit),
+            [
+                {"place_id": place_id, "visited_at": date.today() - timedelta(days=i), "rating": 1 + i % 5}
+                for i in range(children)
+            ],
+        )
+        await db.commit()
+    return place_id, tag_ids
+
+
+async def _measure(
+    loader: Callable[[Any, uuid.UUID], Awaitable[Any]], place_id: uuid.UUID, iterations: int
+) -> tuple[list[float], float]:
+    statements = 0
+
+    def count(*_: Any) -> None:
+        nonlocal statements
+        statements += 1
+
+    latencies = []
+    event.listen(engine.sync_engine, "before_cursor_execute", count)
+    try:
+        for _ in range(iterations):
+            async with async_session_factory() as db:
+                started = time.perf_counter()
+                await loader(db, place_id)
+                latencies.append((time.perf_counter() - started) * 1000)
+    finally:
+        event.remove(engine.sync_engine, "before_cursor_execute", count)
+    return latencies, statements / iterations
+
+
+async def main(children: int, iterations: int) -> None:
+    place_id, tag_ids = await _seed(children)
+    try:
+        print(f"{children} sources/notes/visits, {iterations} iterations")
+        print(f"{'loader':<8} {'queries':>8} {'p50 ms':>8} {'p95 ms':>8}")
+        for name, loader in (("orm", place_service.get_place_detail_orm), ("json", place_service.get_place_detail)):
+            await _measure(loader, place_id, 10)
+            latencies, queries = await _measure(loader, place_id, iterations)
+            print(f"{name:<8} {queries:>8.1f} {percentile(latencies, 0.5):>8.2f} {percentile(latencies, 0.95):>8.2f}")
+    finally:
+        async with async_session_factory() as db:
+            await db.execute(delete(Place).where(Place.id == place_id))
+            await db.execute(delete(Tag).where(Tag.id.in_(tag_ids)))
+            await db.commit()
+        await engine.dispose()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--children", type=int, default=50)
+    parser.add_argument("--iterations", type=int, default=200)
+    args = parser.parse_args()
+    asyncio.run(main(args.children, args.iterations))
@@ -0,0 +1,173 @@
+"""Response serialization benchmark: FastAPI response_model path vs ModelResponse.
+
+Serves the same pre-built payloads (a 100-place list page and a full place
+detail) through two in-process routes and reports CPU time per request::
+
+    python -m benchmarks.bench_serialization [--requests 300]
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import time
+import uuid
+from datetime import UTC, date, datetime, timedelta
+from types import SimpleNamespace
+
+from fastapi import FastAPI
+
+from app.api.responses import ModelResponse
+from app.schemas.common import PaginatedResponse
+from app.schemas.note import NoteResponse
+from app.schemas.place import PlaceBrief, PlaceDetail, PlaceResponse
+from app.schemas.source import SourceResponse
+from app.schemas.visit import VisitResponse
+
+NOW = datetime(2026, 1, 1, tzinfo=UTC)
+
+
+def _tag(i: int) -> SimpleNamespace:
+    return SimpleNamespace(id=uuid.uuid4(), name=f"tag-{i}", type="freeform", created_at=NOW, updated_at=NOW)
+
+
+def _place(i: int) -> SimpleNamespace:
+    """ORM-shaped place row (attribute access, as SQLAlchemy returns)."""
+    return SimpleNamespace(
+        id=uuid.uuid4(),
+        canonical_name=f"벤치마크 장소 {i}",
+        normalized_name=f"벤치마크장소{i}",
+        address_road="서울 중구 을지로 1",
+        address_jibun=None,
+        region_depth1="서울",
+        region_depth2="중구",
+        region_depth3="을지로동",
+        phone="02-000-0000",
+        category_primary="restaurant",
+        category_secondary="korean",
+        parking=True,
+        reservation="possible",
+        price_range="medium",
+        mood=["quiet", "cozy"],
+        companions=["friend"],
+        situations=["dinner"],
+        is_favorite=i % 3 == 0,
+        user_rating=4,
+        visit_count=i,
+        last_visited_at=date(2026, 1, 1) - timedelta(days=i),
+        created_at=NOW,
+        updated_at=NOW,
+        provider_links=[],
+        tags=[_tag(n) for n in range(5)],
+    )
+
+
+def _child(place_id: uuid.UUID, i: int) -> SimpleNamespace:
+    return SimpleNamespace(
+        id=uuid.uuid4(),
+        place_id=place_id,
+        content=f"note {i} " * 20,
+        type="URL",
+        url=f"https://example.com/{i}",
+        title=f"title {i}",
+        snippet="요약 " * 10,
+        raw_text="본문 " * 50,
+        captured_at=NOW,
+        visited_at=date(2026, 1, 1),
+        rating=4,
+        with_whom="friend",
+        situation="dinner",
+        memo=None,
+        revisit=True,
+        created_at=NOW,
+        updated_at=NOW,
+    )
+
+
+def _build_app(rows: list[SimpleNamespace], detail: PlaceDetail) -> FastAPI:
+    app = FastAPI()
+
+    @app.get("/baseline/list", response_model=PaginatedResponse[PlaceBrief])
+    async def baseline_list() -> PaginatedResponse[PlaceBrief]:
+        return PaginatedResponse[PlaceBrief](items=[PlaceBrief.model_validate(row) for row in rows], total=len(rows))
+
+    @app.get("/fast/list", response_model=PaginatedResponse[PlaceBrief])
+    async def fast_list() -> ModelResponse:
+        return ModelResponse.validate(PaginatedResponse[PlaceBrief], {"items": rows, "total": len(rows)})
+
+    @app.get("/baseline/detail", response_model=PlaceDetail)
+    async def baseline_detail() -> PlaceDetail:
+        return detail
+
+    @app.get("/fast/detail", response_model=PlaceDetail)
+    async def fast_detail() -> ModelResponse:
+        return ModelResponse(detail)
+
+    return app
+
+
+async def _call(app: FastAPI, path: str) -> bytes:
+    """Drive one GET through the ASGI app directly, without client overhead."""
+    scope = {
+        "type": "http",
+        "asgi": {"version": "3.0"},
+        "http_version": "1.1",
+        "method": "GET",
+        "scheme": "http",
+        "path": path,
+        "raw_path": path.encode(),
+        "query_string": b"",
+        "headers": [],
+        "server": ("bench", 80),
+        "client": ("bench", 1),
+    }
+    body: list[bytes] = []
+
+    async def receive() -> dict[str, object]:
+        return {"type": "http.request", "body": b"", "more_body": False}
+
+    async def send(message: dict[str, object]) -> None:
+        if message["type"] == "http.response.body":
+            body.append(message.get("body", b""))  # type: ignore[arg-type]
+
+    await app(scope, receive, send)
+    return b"".join(body)
+
+
+async def _measure(app: FastAPI, path: str, requests: int, rounds: int = 5) -> tuple[float, bytes]:
+    """Best-of-``rounds`` CPU milliseconds per request, plus the response body."""
+    body = await _call(app, path)  # warm-up: adapter/validator construction
+    best = float("inf")
+    for _ in range(rounds):
+        start = time.process_time()
+        for _ in range(requests):
+            await _call(app, path)
+        best = min(best, (time.process_time() - start) / requests * 1000)
+    return best, body
+
+
+async def main(requests: int) -> None:
+    rows = [_place(i) for i in range(100)]
+    place = rows[0]
+    children = [_child(place.id, i) for i in range(20)]
+    detail = PlaceDetail(
+        **PlaceResponse.model_validate(place).model_dump(),
+        sources=[SourceResponse.model_validate(row) for row in children],
+        notes=[NoteResponse.model_validate(row) for row in children],
+        visits=[VisitResponse.model_validate(row) for row in children],
+    )
+
+    app = _build_app(rows, detail)
+    print(f"{'payload':<10} {'baseline ms':>12} {'fast ms':>10} {'speedup':>8} {'bytes':>8}")
+    for payload in ("list", "detail"):
+        baseline, body = await _measure(app, f"/baseline/{payload}", requests)
+        fast, fast_body = await _measure(app, f"/fast/{payload}", requests)
+        assert json.loads(body) == json.loads(fast_body), "both paths must produce the same document"
+        print(f"{payload:<10} {baseline:>12.3f} {fast:>10.3f} {baseline / fast:>7.2f}x {len(body):>8}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--requests", type=int, default=300)
+    asyncio.run(main(parser.parse_args().requests))
@@ -0,0 +1,116 @@
+"""HNSW index precision benchmark: vector vs halfvec vs binary-quantized (bit) indexes.
+
+Loads clustered random vectors into a temporary table and, for each index
+expression ``embedding_service.rebuild_vector_index`` supports, builds the
+HNSW index and reports its size, build time, recall@10 against exact search
+and query latency. Every variant re-ranks its ``--candidates`` pool by exact
+distance on the full-precision column, as ``embedding_service.search`` does::
+
+    python -m benchmarks.bench_vector_quantization [--rows 20000] [--dims 1536] [--candidates 100]
+
+Requires the database from DATABASE_URL (pgvector >= 0.7); nothing is persisted.
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import time
+
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncConnection
+
+from app.deps import engine
+from benchmarks.synthetic import clustered_vectors, percentile, vector_literal
+
+K = 10
+
+
+def _variants(dims: int) -> dict[str, tuple[str, str]]:
+    # 이름 → (인덱스 표현식, 후보 정렬 식) — embedding_service의 표현식과 같다
+    return {
+        "vector": ("(v vector_cosine_ops)", "v <=> CAST(:q AS vector)"),
+        "halfvec": (
+            f"((v::halfvec({dims})) halfvec_cosine_ops)",
+            f"v::halfvec({dims}) <=> CAST(:q AS halfvec({dims}))",
+        ),
+        "bit": (
+            f"((binary_quantize(v)::bit({dims})) bit_hamming_ops)",
+            f"binary_quantize(v)::bit({dims}) <~> binary_quantize(CAST(:q AS vector))",
+        ),
+    }
+
+
+async def _top(conn: AsyncConnection, query: str, order: str, candidates: int) -> list[int]:
+    rows = await conn.execute(
+        text(
+            f"SELECT id FROM (SELECT id, v FROM bench_quantized ORDER BY {order} LIMIT :pool) pool "
+            "ORDER BY v <=> CAST(:q AS vector) LIMIT :k"
+        ),
+        {"q": query, "pool": candidates, "k": K},
+    )
+    return [row.id for row in rows]
+
+
+async def _set(conn: AsyncConnection, name: str, value: object) -> None:
+    await conn.execute(text("SELECT set_config(:name, :value, true)"), {"name": name, "value": str(value)})
+
+
+async def main(rows: int, dims: int, queries: int, candidates: int, m: int, ef_construction: int) -> None:
+    corpus = clustered_vectors(rows, dims)
+    probes = [vector_literal(v) for v in clustered_vectors(queries, dims, seed=11)]
+
+    async with engine.connect() as conn, conn.begin():
+        await conn.execute(
+            text(f"CREATE TEMP TABLE bench_quantized (id int PRIMARY KEY, v vector({dims:d})) ON COMMIT DROP")
+        )
+        for start in range(0, rows, 500):
+            await conn.execute(
+                text("INSERT INTO bench_quantized VALUES (:id, CAST(:v AS vector))"),
+                [{"id": i, "v": vector_literal(corpus[i])} for i in range(start, min(rows, start + 500))],
+            )
+        table_size = await conn.scalar(text("SELECT pg_table_size('bench_quantized')"))
+
+        await _set(conn, "enable_indexscan", "off")
+        exact = [await _top(conn, probe, "v <=> CAST(:q AS vector)", K) for probe in probes]
+        await _set(conn, "enable_indexscan", "on")
+        await _set(conn, "maintenance_work_mem", "512MB")
+        await _set(conn, "hnsw.ef_search", max(40, candidates))
+
+        print(f"{rows} x {dims}d (table {table_size / 2**20:.1f} MiB), m={m} ef_construction={ef_construction}")
+        print(f"re-ranking {candidates} candidates by exact distance")
+        print(f"{'index':>8} {'size MiB':>9} {'build s':>8} {'recall@10':>10} {'p50 ms':>8} {'p95 ms':>8}")
+        for name, (expression, order) in _variants(dims).items():
+            started = time.perf_counter()
+            await conn.execute(
+                text(
+                    f"CREATE INDEX bench_quantized_{name} ON bench_quantized USING hnsw {expression} "
+                    f"WITH (m = {m:d}, ef_construction = {ef_construction:d})"
+                )
+            )
+            build = time.perf_counter() - started
+            size = await conn.scalar(text(f"SELECT pg_relation_size('bench_quantized_{name}')"))
+
+            latencies, recall = [], 0.0
+            for probe, truth in zip(probes, exact, strict=True):
+                started = time.perf_counter()
+                found = await _top(conn, probe, order, candidates)
+                latencies.append((time.perf_counter() - started) * 1000)
+                recall += len(set(found) & set(truth)) / K
+            print(
+                f"{name:>8} {size / 2**20:>9.1f} {build:>8.1f} {recall / queries:>10.3f} "
+                f"{percentile(latencies, 0.5):>8.2f} {percentile(latencies, 0.95):>8.2f}"
+            )
+            await conn.execute(text(f"DROP INDEX bench_quantized_{name}"))
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rows", type=int, default=20000)
+    parser.add_argument("--dims", type=int, default=1536)
+    parser.add_argument("--queries", type=int, default=50)
+    parser.add_argument("--candidates", type=int, default=100)
+    parser.add_argument("--m", type=int, default=16)
+    parser.add_argument("--ef-construction", type=int, default=64)
+    args = parser.parse_args()
+    asyncio.run(main(args.rows, args.dims, args.queries, args.candidates, args.m, args.ef_construction))
@@ -0,0 +1,95 @@
+"""HNSW recall/latency benchmark against exact brute force on a synthetic corpus.
+
+Loads clustered random vectors into a temporary table, builds an HNSW index
+with the given build parameters, then for each ``ef_search`` compares the
+index's top-k with the exact top-k (sequential scan) and reports recall and
+latency. With full-precision vectors the index already returns candidates in
+exact distance order, so ``search(rerank=True)`` behaves like the row whose
+ef_search equals the candidate pool::
+
+    python -m benchmarks.bench_vector_recall [--rows 20000] [--dims 128] [--k 200] [--m 16] [--ef-construction 64]
+
+Requires the database from DATABASE_URL (pgvector); nothing is persisted.
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import time
+
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncConnection
+
+from app.deps import engine
+from benchmarks.synthetic import clustered_vectors, percentile, vector_literal
+
+EF_SEARCH = (40, 100, 200, 400)
+
+
+async def _top(conn: AsyncConnection, query: str, limit: int) -> list[int]:
+    rows = await conn.execute(
+        text("SELECT id FROM bench_vectors ORDER BY v <=> CAST(:q AS vector) LIMIT :k"), {"q": query, "k": limit}
+    )
+    return [row.id for row in rows]
+
+
+async def _set(conn: AsyncConnection, name: str, value: object) -> None:
+    await conn.execute(text("SELECT set_config(:name, :value, true)"), {"name": name, "value": str(value)})
+
+
+async def main(rows: int, dims: int, queries: int, k: int, m: int, ef_construction: int) -> None:
+    corpus = clustered_vectors(rows, dims)
+    probes = [vector_literal(v) for v in clustered_vectors(queries, dims, seed=11)]
+
+    async with engine.connect() as conn, conn.begin():
+        await conn.execute(
+            text(f"CREATE TEMP TABLE bench_vectors (id int PRIMARY KEY, v vector({dims:d})) ON COMMIT DROP")
+        )
+        for start in range(0, rows, 1000):
+            await conn.execute(
+                text("INSERT INTO bench_vectors VALUES (:id, CAST(:v AS vector))"),
+                [{"id": i, "v": vector_literal(corpus[i])} for i in range(start, min(rows, start + 1000))],
+            )
+
+        await _set(conn, "enable_indexscan", "off")
+        exact = [await _top(conn, probe, k) for probe in probes]
+        await _set(conn, "enable_indexscan", "on")
+
+        await _set(conn, "maintenance_work_mem", "512MB")
+        started = time.perf_counter()
+        await conn.execute(
+            text(
+                "CREATE INDEX ON bench_vectors USING hnsw (v vector_cosine_ops) "
+                f"WITH (m = {m:d}, ef_construction = {ef_construction:d})"
+            )
+        )
+        elapsed = time.perf_counter() - started
+        print(f"{rows} x {dims}d, HNSW m={m} ef_construction={ef_construction} built in {elapsed:.1f}s")
+        print(f"{'ef_search':>9} {f'recall@{k}':>11} {'recall@10':>10} {'p50 ms':>8} {'p95 ms':>8}")
+
+        for ef in EF_SEARCH:
+            await _set(conn, "hnsw.ef_search", ef)
+            latencies, recall_k, recall_10 = [], 0.0, 0.0
+            for probe, truth in zip(probes, exact, strict=True):
+                started = time.perf_counter()
+                found = await _top(conn, probe, k)
+                latencies.append((time.perf_counter() - started) * 1000)
+                recall_k += len(set(found) & set(truth)) / k
+                recall_10 += len(set(found[:10]) & set(truth[:10])) / 10
+            print(
+                f"{ef:>9} {recall_k / queries:>11.3f} {recall_10 / queries:>10.3f} "
+                f"{percentile(latencies, 0.5):>8.2f} {percentile(latencies, 0.95):>8.2f}"
+            )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rows", type=int, default=20000)
+    parser.add_argument("--dims", type=int, default=128)
+    parser.add_argument("--queries", type=int, default=50)
+    parser.add_argument("--k", type=int, default=200)
+    parser.add_argument("--m", type=int, default=16)
+    parser.add_argument("--ef-construction", type=int, default=64)
+    args = parser.parse_args()
+    asyncio.run(main(args.rows, args.dims, args.queries, args.k, args.m, args.ef_construction))
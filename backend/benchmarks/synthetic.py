@@ -0,0 +1,35 @@
+"""Synthetic vector corpora shared by the vector search benchmarks."""
+
+from __future__ import annotations
+
+import math
+import random
+from collections.abc import Sequence
+
+
+def clustered_vectors(
+    count: int, dims: int, clusters: int = 50, spread: float = 0.35, seed: int = 7
+) -> list[list[float]]:
+    """Unit vectors scattered around random centres, like topic-clustered embeddings."""
+    rng = random.Random(seed)
+    centres = [[rng.gauss(0.0, 1.0) for _ in range(dims)] for _ in range(clusters)]
+    vectors = []
+    for _ in range(count):
+        centre = centres[rng.randrange(clusters)]
+        vectors.append(_unit([x + rng.gauss(0.0, spread) for x in centre]))
+    return vectors
+
+
+def vector_literal(vector: Sequence[float]) -> str:
+    """pgvector text form, for binding as ``CAST(:v AS vector)``."""
+    return "[" + ",".join(f"{x:.6f}" for x in vector) + "]"
+
+
+def percentile(samples: Sequence[float], fraction: float) -> float:
+    ordered = sorted(samples)
+    return ordered[min(len(ordered) - 1, int(fraction * len(ordered)))]
+
+
+def _unit(vector: list[float]) -> list[float]:
+    norm = math.sqrt(sum(x * x for x in vector)) or 1.0
+    return [x / norm for x in vector]
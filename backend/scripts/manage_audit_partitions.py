@@ -0,0 +1,37 @@
+"""Create upcoming monthly audit_logs partitions and drop those past retention.
+
+Run daily (e.g. from cron). Creation is idempotent; dropping a month removes
+its rows instantly without a bulk DELETE.
+
+Usage:
+    python -m scripts.manage_audit_partitions [--dry-run]
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import logging
+
+from app.deps import async_session_factory
+from app.services import audit_service
+
+logger = logging.getLogger(__name__)
+
+
+async def main(dry_run: bool = False) -> tuple[list[str], list[str]]:
+    """Return (created, dropped) partition names."""
+    async with async_session_factory() as db:
+        created = [] if dry_run else await audit_service.ensure_partitions(db)
+        dropped = await audit_service.drop_partitions_before(db, audit_service.retention_cutoff(), dry_run=dry_run)
+    logger.info("Created partitions: %s", ", ".join(created) or "none")
+    logger.info("%s partitions: %s", "Would drop" if dry_run else "Dropped", ", ".join(dropped) or "none")
+    return created, dropped
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--dry-run", action="store_true", help="report partitions past retention without dropping")
+    args = parser.parse_args()
+    logging.basicConfig(level=logging.INFO, format="%(message)s")
+    asyncio.run(main(dry_run=args.dry_run))
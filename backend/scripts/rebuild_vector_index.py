@@ -0,0 +1,62 @@
+"""Rebuild the per-entity-type HNSW indexes on embeddings with new build parameters, online.
+
+Higher m / ef_construction raise recall at a given ef_search at the cost of
+build time and index size; compare settings with benchmarks.bench_vector_recall
+first.
+
+``--index-type`` also moves the indexes between full-precision ``vector``,
+``halfvec`` (about half the index memory) and binary-quantized ``bit``
+(compare with benchmarks.bench_vector_quantization). The stored vectors stay
+full precision, so switching back needs no re-embedding. Running processes
+pick up the new index type when the swap commits; set VECTOR_INDEX_TYPE to
+keep it as the default for later rebuilds.
+
+Usage:
+    python -m scripts.rebuild_vector_index [--m 16] [--ef-construction 64] [--maintenance-work-mem 1GB]
+        [--index-type halfvec]
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import logging
+import time
+
+from app.config import settings
+from app.services import embedding_service
+
+logger = logging.getLogger(__name__)
+
+
+async def main(
+    m: int, ef_construction: int, maintenance_work_mem: str | None = None, indexed: str | None = None
+) -> None:
+    """Rebuild the indexes and log how long it took."""
+    started = time.perf_counter()
+    await embedding_service.rebuild_vector_index(m, ef_construction, maintenance_work_mem, indexed)
+    logger.info(
+        "Rebuilt idx_embeddings_vector_* (%s, m=%d, ef_construction=%d) in %.1fs",
+        indexed or settings.vector_index_type,
+        m,
+        ef_construction,
+        time.perf_counter() - started,
+    )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--m", type=int, default=settings.hnsw_m, help="max connections per layer")
+    parser.add_argument(
+        "--ef-construction", type=int, default=settings.hnsw_ef_construction, help="build candidate list size"
+    )
+    parser.add_argument("--maintenance-work-mem", help="e.g. 1GB; a build that fits in memory is much faster")
+    parser.add_argument(
+        "--index-type",
+        choices=embedding_service.INDEX_TYPES,
+        default=settings.vector_index_type,
+        help="index expression",
+    )
+    args = parser.parse_args()
+    logging.basicConfig(level=logging.INFO, format="%(message)s")
+    asyncio.run(main(args.m, args.ef_construction, args.maintenance_work_mem, args.index_type))
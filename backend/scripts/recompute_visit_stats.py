@@ -0,0 +1,36 @@
+"""Recompute denormalized visit aggregates on places from the visits table.
+
+Usage:
+    python -m scripts.recompute_visit_stats [--dry-run]
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import logging
+
+from app.deps import async_session_factory
+from app.services import visit_stats_service
+
+logger = logging.getLogger(__name__)
+
+
+async def main(dry_run: bool = False) -> int:
+    """Repair drifted aggregates and return the number of corrected places."""
+    async with async_session_factory() as db:
+        fixed = await visit_stats_service.recompute(db)
+        if dry_run:
+            await db.rollback()
+        else:
+            await db.commit()
+    logger.info("%s %d place(s) with drifted visit aggregates", "Found" if dry_run else "Repaired", fixed)
+    return fixed
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--dry-run", action="store_true", help="report drift without writing")
+    args = parser.parse_args()
+    logging.basicConfig(level=logging.INFO, format="%(message)s")
+    asyncio.run(main(dry_run=args.dry_run))
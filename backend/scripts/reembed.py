@@ -0,0 +1,83 @@
+"""Re-embed every embedding with another model, then switch search over to it.
+
+Search keeps reading the current vectors while the job runs. Re-running the
+command resumes an interrupted job from its saved cursor.
+
+Usage:
+    python -m scripts.reembed --model MODEL --dimensions N [--batch-size N] [--interval SECONDS]
+    python -m scripts.reembed --status
+    python -m scripts.reembed --cancel
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import logging
+
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.deps import async_session_factory
+from app.models.embedding import ReembedJob
+from app.services import embedding_service
+
+logger = logging.getLogger(__name__)
+
+
+async def _running_job(db: AsyncSession) -> ReembedJob | None:
+    return await db.scalar(select(ReembedJob).where(ReembedJob.status == "running").limit(1))
+
+
+async def main(
+    model: str | None = None,
+    dimensions: int | None = None,
+    batch_size: int | None = None,
+    interval: float | None = None,
+    status: bool = False,
+    cancel: bool = False,
+) -> None:
+    """Start, resume, inspect or cancel the re-embedding job."""
+    async with async_session_factory() as db:
+        job = await _running_job(db)
+        if status or cancel:
+            if job is None:
+                logger.info(
+                    "No re-embedding job is running; active model is %s/%d", *await embedding_service.active_model(db)
+                )
+                return
+            if cancel:
+                await embedding_service.cancel_reembed(db, job)
+                logger.info("Cancelled job %s", job.id)
+                return
+            covered, total = await embedding_service.coverage(db)
+            logger.info(
+                "Job %s → %s/%d: %d/%d rows up to date", job.id, job.target_model, job.dimensions, covered, total
+            )
+            return
+
+        if job is None:
+            job = await embedding_service.start_reembed(db, model, dimensions)
+            logger.info("Started job %s → %s/%d", job.id, model, dimensions)
+        elif (job.target_model, job.dimensions) != (model, dimensions):
+            raise SystemExit(f"Job {job.id} for {job.target_model}/{job.dimensions} is running; cancel it first")
+        else:
+            logger.info("Resuming job %s after %d rows", job.id, job.embedded)
+
+    job = await embedding_service.run_reembed(job.id, batch_size=batch_size, interval=interval)
+    logger.info("Cut over to %s/%d after %d rows", job.target_model, job.dimensions, job.embedded)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--model", help="target embedding model")
+    parser.add_argument("--dimensions", type=int, help="target vector dimensions")
+    parser.add_argument("--batch-size", type=int, help="rows per embedding call")
+    parser.add_argument("--interval", type=float, help="seconds between batches")
+    parser.add_argument("--status", action="store_true", help="report progress of the running job")
+    parser.add_argument("--cancel", action="store_true", help="abandon the running job")
+    args = parser.parse_args()
+    if not (args.status or args.cancel) and not (args.model and args.dimensions):
+        parser.error("--model and --dimensions are required to start or resume a job")
+    logging.basicConfig(level=logging.INFO, format="%(message)s")
+    asyncio.run(main(args.model, args.dimensions, args.batch_size, args.interval, args.status, args.cancel))
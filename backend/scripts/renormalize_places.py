@@ -0,0 +1,52 @@
+"""Recompute places.normalized_name in keyset chunks after normalization rules change.
+
+Each chunk is read, normalized in one batch and written with a single UPDATE,
+then committed so locks stay short and progress survives interruption. The
+recorded change events are delivered to the outbox consumers at the end.
+
+Usage:
+    python -m scripts.renormalize_places [--dry-run] [--chunk-size N]
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import logging
+
+from app.deps import async_session_factory
+from app.services import outbox_service, place_service
+
+logger = logging.getLogger(__name__)
+
+
+async def main(dry_run: bool = False, chunk_size: int = 1000) -> int:
+    """Renormalize every place and return the number of rows that changed."""
+    scanned = changed = 0
+    after_id = None
+    async with async_session_factory() as db:
+        while True:
+            after_id, chunk_scanned, chunk_changed = await place_service.renormalize_chunk(db, after_id, chunk_size)
+            if after_id is None:
+                break
+            if dry_run:
+                await db.rollback()
+            else:
+                await outbox_service.commit(db)
+            scanned += chunk_scanned
+            changed += chunk_changed
+            logger.info("Scanned %d place(s), %d changed", scanned, changed)
+    if not dry_run:
+        # 디스패처가 없는 프로세스다 — 검색 문서 등 소비자에게 직접 전달한다
+        await outbox_service.dispatch_pending()
+    logger.info("%s %d of %d place name(s)", "Would update" if dry_run else "Updated", changed, scanned)
+    return changed
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--dry-run", action="store_true", help="report changes without writing")
+    parser.add_argument("--chunk-size", type=int, default=1000, help="places per UPDATE (default: 1000)")
+    args = parser.parse_args()
+    logging.basicConfig(level=logging.INFO, format="%(message)s")
+    asyncio.run(main(dry_run=args.dry_run, chunk_size=args.chunk_size))
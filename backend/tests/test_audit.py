@@ -0,0 +1,135 @@
+"""Audit sink and partition management tests."""
+
+from __future__ import annotations
+
+import uuid
+from datetime import UTC, date, datetime
+
+from sqlalchemy import delete, func, select, text
+
+from app.deps import async_session_factory
+from app.models.audit import AuditLog
+from app.services import audit_service
+from app.services.audit_service import AuditSink
+
+
+class _FakeSession:
+    def __init__(self, log: list, fail: bool) -> None:
+        self._log = log
+        self._fail = fail
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc):
+        return False
+
+    async def execute(self, stmt, rows):
+        if self._fail:
+            raise ConnectionError("db down")
+        self._log.append(list(rows))
+
+    async def commit(self):
+        pass
+
+
+def _factory(log: list, fail: list[bool]):
+    return lambda: _FakeSession(log, fail[0])
+
+
+async def test_sink_batches_and_retries_after_failure():
+    batches: list[list[dict]] = []
+    fail = [True]
+    sink = AuditSink(session_factory=_factory(batches, fail), batch_size=2, flush_interval=60, max_buffer=100)
+    for i in range(5):
+        sink.record("test", "place", uuid.uuid4(), {"i": i})
+
+    try:
+        await sink.flush()
+    except ConnectionError:
+        pass
+    assert sink.pending() == 5
+
+    fail[0] = False
+    assert await sink.flush() == 5
+    assert [len(batch) for batch in batches] == [2, 2, 1]
+    assert [row["detail"]["i"] for batch in batches for row in batch] == [0, 1, 2, 3, 4]
+
+
+def test_sink_drops_oldest_rows_beyond_max_buffer():
+    sink = AuditSink(session_factory=_factory([], [False]), batch_size=10, flush_interval=60, max_buffer=3)
+    for i in range(5):
+        sink.record("test", detail={"i": i})
+
+    assert sink.pending() == 3
+    assert sink.dropped == 2
+
+
+def test_partition_naming_and_retention_cutoff():
+    assert audit_service.partition_name(date(2026, 3, 17)) == "audit_logs_y2026m03"
+    assert audit_service.retention_cutoff(date(2026, 3, 17), months=12) == date(2025, 4, 1)
+    assert audit_service.retention_cutoff(date(2026, 1, 31), months=1) == date(2026, 1, 1)
+
+
+async def test_flushed_rows_land_in_monthly_partition():
+    entity_id = uuid.uuid4()
+    async with async_session_factory() as db:
+        await audit_service.ensure_partitions(db)
+        assert audit_service.partition_name(date.today()) in await audit_service.list_partitions(db)
+
+    sink = AuditSink(batch_size=10, flush_interval=60)
+    sink.record("merge", "place", entity_id, {"source": "test"})
+    assert await sink.flush() == 1
+
+    async with async_session_factory() as db:
+        rows = (await db.execute(select(AuditLog).where(AuditLog.entity_id == entity_id))).scalars().all()
+        assert [row.action for row in rows] == ["merge"]
+        for row in rows:
+            await db.delete(row)
+        await db.commit()
+
+
+async def test_creating_a_month_moves_its_rows_out_of_the_default_partition():
+    month = date(2090, 5, 1)
+    name = audit_service.partition_name(month)
+    entity_id = uuid.uuid4()
+    async with async_session_factory() as db:
+        db.add(AuditLog(action="late", entity_id=entity_id, created_at=datetime(2090, 5, 9, tzinfo=UTC)))
+        await db.commit()
+        try:
+            assert await audit_service.ensure_partitions(db, months_ahead=0, today=month) == [name]
+            in_partition = await db.scalar(
+                text(f"SELECT count(*) FROM {name} WHERE entity_id = :id"), {"id": entity_id}
+            )
+            in_default = await db.scalar(
+                text(f"SELECT count(*) FROM {audit_service.DEFAULT_PARTITION} WHERE entity_id = :id"), {"id": entity_id}
+            )
+            assert (in_partition, in_default) == (1, 0)
+            assert name in await audit_service.list_partitions(db)
+        finally:
+            await db.execute(text(f"DROP TABLE IF EXISTS {name}"))
+            await db.execute(delete(AuditLog).where(AuditLog.entity_id == entity_id))
+            await db.commit()
+
+
+async def test_retention_prunes_the_default_partition():
+    expired, kept = uuid.uuid4(), uuid.uuid4()
+    async with async_session_factory() as db:
+        db.add_all(
+            [
+                AuditLog(action="old", entity_id=expired, created_at=datetime(1990, 3, 1, tzinfo=UTC)),
+                AuditLog(action="old", entity_id=kept, created_at=datetime(1990, 4, 1, tzinfo=UTC)),
+            ]
+        )
+        await db.commit()
+        try:
+            await audit_service.drop_partitions_before(db, date(1990, 4, 20), dry_run=True)
+            assert await db.scalar(select(func.count()).where(AuditLog.entity_id == expired)) == 1
+
+            assert await audit_service.drop_partitions_before(db, date(1990, 4, 20)) == []
+            remaining = (await db.execute(select(AuditLog.entity_id).where(AuditLog.action == "old"))).scalars().all()
+            assert expired not in remaining
+            assert kept in remaining
+        finally:
+            await db.execute(delete(AuditLog).where(AuditLog.entity_id.in_([expired, kept])))
+            await db.commit()
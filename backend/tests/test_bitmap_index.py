@@ -0,0 +1,102 @@
+"""Place bitmap index tests."""
+
+from __future__ import annotations
+
+import uuid
+
+import pytest
+
+from app.config import settings
+from app.deps import async_session_factory
+from app.schemas.search import SearchFilters
+from app.services import bitmap_index_service, outbox_service, search_document_service
+from app.services.bitmap_index_service import PlaceBitmapIndex
+
+
+def test_bitmap_index_set_remove_and_combine():
+    index = PlaceBitmapIndex()
+    a, b, c = uuid.uuid4(), uuid.uuid4(), uuid.uuid4()
+    index.set_place(a, {("mood", "조용한"), ("tag", "t1")})
+    index.set_place(b, {("mood", "조용한")})
+    index.set_place(c, {("situation", "데이트")})
+
+    assert index.to_place_ids(index.all_of([("mood", "조용한"), ("tag", "t1")])) == [a]
+    assert index.to_place_ids(index.any_of([("tag", "t1"), ("situation", "데이트")])) == [a, c]
+    assert index.all_of([("mood", "없음")]) == 0
+
+    index.set_place(a, {("tag", "t1")})
+    assert index.to_place_ids(index.bitmap(("mood", "조용한"))) == [b]
+
+    index.remove_place(b)
+    assert ("mood", "조용한") not in index.postings
+    d = uuid.uuid4()
+    index.set_place(d, {("mood", "시끄러운")})
+    assert index.ordinals[d] == 1  # 지운 장소의 순번을 다시 쓴다
+    assert index.to_place_ids(index.live) == [a, d, c]
+
+
+@pytest.fixture
+def ready_index(monkeypatch):
+    index = PlaceBitmapIndex()
+    monkeypatch.setattr(bitmap_index_service, "_index", index)
+    monkeypatch.setattr(bitmap_index_service, "_tag_ids", {"단골": uuid.uuid4()})
+    monkeypatch.setattr(bitmap_index_service, "_ready", True)
+    return index
+
+
+def test_restrict_answers_attribute_filters_from_index(ready_index):
+    place_id = uuid.uuid4()
+    tag_id = bitmap_index_service._tag_ids["단골"]
+    ready_index.set_place(place_id, {("mood", "조용한"), ("situation", "데이트"), ("tag", str(tag_id))})
+    ready_index.set_place(uuid.uuid4(), {("mood", "조용한")})
+
+    filters = SearchFilters(mood=["조용한"], situations=["데이트"], tags=["단골"], parking=True)
+    place_ids, residual = bitmap_index_service.restrict(filters)
+    assert place_ids == [place_id]
+    assert residual == SearchFilters(parking=True)
+
+    # 색인이 아직 모르는 태그는 SQL 조건으로 넘긴다
+    unknown = SearchFilters(tags=["새 태그"])
+    assert bitmap_index_service.restrict(unknown) == (None, unknown)
+    assert bitmap_index_service.restrict(SearchFilters(parking=True)) == (None, SearchFilters(parking=True))
+
+
+def test_restrict_ors_ontology_nodes_and_caps_candidates(ready_index, monkeypatch):
+    parent, child, other = uuid.uuid4(), uuid.uuid4(), uuid.uuid4()
+    first, second = uuid.uuid4(), uuid.uuid4()
+    # 하위 노드에 연결된 장소는 조상 키도 갖는다
+    ready_index.set_place(first, {("ontology", str(child)), ("ontology", str(parent)), ("mood", "조용한")})
+    ready_index.set_place(second, {("ontology", str(other)), ("mood", "조용한")})
+
+    assert bitmap_index_service.restrict(SearchFilters(ontology_nodes=[parent]))[0] == [first]
+    place_ids, residual = bitmap_index_service.restrict(SearchFilters(ontology_nodes=[child, other], mood=["조용한"]))
+    assert place_ids == [first, second]
+    assert residual == SearchFilters()
+
+    monkeypatch.setattr(settings, "bitmap_index_max_candidates", 1)
+    filters = SearchFilters(mood=["조용한"])
+    assert bitmap_index_service.restrict(filters) == (None, filters)
+
+
+def test_restrict_falls_back_to_sql_before_build(monkeypatch):
+    monkeypatch.setattr(bitmap_index_service, "_ready", False)
+    filters = SearchFilters(mood=["조용한"])
+    assert bitmap_index_service.restrict(filters) == (None, filters)
+
+
+async def test_bitmap_index_follows_writes(client, api_headers):
+    await bitmap_index_service.rebuild()
+    mood = f"mood-{uuid.uuid4().hex[:8]}"
+    name = f"test-place-{uuid.uuid4()}"
+    response = await client.post("/api/v1/places", json={"canonical_name": name, "mood": [mood]}, headers=api_headers)
+    assert response.status_code == 201, response.text
+    place_id = uuid.UUID(response.json()["place"]["id"])
+
+    assert bitmap_index_service.restrict(SearchFilters(mood=[mood]))[0] == [place_id]
+    await outbox_service.dispatch_pending()
+    async with async_session_factory() as db:
+        hits = await search_document_service.keyword_search(db, name, filters=SearchFilters(mood=[mood]))
+    assert [hit.place_id for hit in hits] == [place_id]
+
+    await client.delete(f"/api/v1/places/{place_id}", headers=api_headers)
+    assert bitmap_index_service.restrict(SearchFilters(mood=[mood]))[0] == []
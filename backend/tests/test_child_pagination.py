@@ -0,0 +1,84 @@
+"""Cursor pagination tests for notes, visits and place detail children."""
+
+from __future__ import annotations
+
+import uuid
+
+from app.services import place_service
+
+
+async def _create_place(client, api_headers, **overrides):
+    payload = {"canonical_name": f"paging-place-{uuid.uuid4()}"}
+    payload.update(overrides)
+    response = await client.post("/api/v1/places", json=payload, headers=api_headers)
+    assert response.status_code == 201, response.text
+    return response.json()["place"]
+
+
+async def _collect(client, api_headers, path, place_id, limit):
+    items, cursor, pages = [], None, 0
+    while True:
+        params = {"place_id": place_id, "limit": limit}
+        if cursor:
+            params["cursor"] = cursor
+        response = await client.get(path, params=params, headers=api_headers)
+        assert response.status_code == 200, response.text
+        body = response.json()
+        items.extend(body["items"])
+        pages += 1
+        cursor = body["next_cursor"]
+        if cursor is None:
+            return items, pages
+
+
+async def test_notes_are_paginated(client, api_headers):
+    place = await _create_place(client, api_headers, notes=[f"note-{i}" for i in range(5)])
+
+    items, pages = await _collect(client, api_headers, "/api/v1/notes", place["id"], limit=2)
+
+    assert pages == 3
+    assert sorted(item["content"] for item in items) == [f"note-{i}" for i in range(5)]
+    assert len({item["id"] for item in items}) == 5
+
+    await client.delete(f"/api/v1/places/{place['id']}", headers=api_headers)
+
+
+async def test_visits_are_paginated_by_visit_date(client, api_headers):
+    place = await _create_place(client, api_headers)
+    days = ["2026-01-03", "2026-01-01", "2026-01-03", "2026-01-02"]
+    for day in days:
+        response = await client.post(
+            "/api/v1/visits",
+            json={"place_id": place["id"], "visited_at": day},
+            headers=api_headers,
+        )
+        assert response.status_code == 201
+
+    items, _ = await _collect(client, api_headers, "/api/v1/visits", place["id"], limit=1)
+
+    assert [item["visited_at"] for item in items] == sorted(days, reverse=True)
+    assert len({item["id"] for item in items}) == 4
+
+    await client.delete(f"/api/v1/places/{place['id']}", headers=api_headers)
+
+
+async def test_detail_embeds_first_page_only(client, api_headers):
+    count = place_service.DETAIL_CHILD_LIMIT + 1
+    place = await _create_place(client, api_headers, notes=[f"detail-note-{i}" for i in range(count)])
+
+    response = await client.get(f"/api/v1/places/{place['id']}", headers=api_headers)
+    assert response.status_code == 200
+    detail = response.json()
+    assert len(detail["notes"]) == place_service.DETAIL_CHILD_LIMIT
+    assert detail["notes_next_cursor"] is not None
+    assert detail["visits"] == []
+    assert detail["visits_next_cursor"] is None
+
+    rest = await client.get(
+        "/api/v1/notes",
+        params={"place_id": place["id"], "cursor": detail["notes_next_cursor"]},
+        headers=api_headers,
+    )
+    assert len(rest.json()["items"]) == 1
+
+    await client.delete(f"/api/v1/places/{place['id']}", headers=api_headers)
@@ -0,0 +1,62 @@
+"""build_comparison_table tool tests."""
+
+from __future__ import annotations
+
+import uuid
+
+
+async def _create_place(client, api_headers, **overrides):
+    payload = {"canonical_name": f"compare-place-{uuid.uuid4()}"}
+    payload.update(overrides)
+    response = await client.post("/api/v1/places", json=payload, headers=api_headers)
+    assert response.status_code == 201, response.text
+    return response.json()["place"]
+
+
+async def test_build_comparison_table(client, api_headers):
+    first = await _create_place(client, api_headers, parking=True, mood=["quiet"], tags=["compare-tag"])
+    second = await _create_place(client, api_headers, parking=False)
+    visit_res = await client.post(
+        "/api/v1/visits",
+        json={"place_id": first["id"], "visited_at": "2026-01-10", "rating": 4},
+        headers=api_headers,
+    )
+    assert visit_res.status_code == 201
+
+    response = await client.post(
+        "/api/v1/tools/build_comparison_table",
+        json={"place_ids": [second["id"], first["id"]], "columns": ["parking", "tags", "visit_count", "last_visit"]},
+        headers=api_headers,
+    )
+    assert response.status_code == 200, response.text
+    lines = response.json()["markdown"].splitlines()
+    assert lines[0] == "| Place | Parking | Tags | Visits | Last visit |"
+    assert lines[2].startswith(f"| {second['canonical_name']} | no |")
+    assert lines[3] == f"| {first['canonical_name']} | yes | compare-tag | 1 | 2026-01-10 |"
+
+    # A new visit must invalidate the memoized table.
+    await client.post(
+        "/api/v1/visits",
+        json={"place_id": first["id"], "visited_at": "2026-02-01"},
+        headers=api_headers,
+    )
+    again = await client.post(
+        "/api/v1/tools/build_comparison_table",
+        json={"place_ids": [second["id"], first["id"]], "columns": ["parking", "tags", "visit_count", "last_visit"]},
+        headers=api_headers,
+    )
+    assert again.json()["markdown"].splitlines()[3].endswith("| 2 | 2026-02-01 |")
+
+    for place in (first, second):
+        await client.delete(f"/api/v1/places/{place['id']}", headers=api_headers)
+
+
+async def test_build_comparison_table_rejects_unknown_column(client, api_headers):
+    place = await _create_place(client, api_headers)
+    response = await client.post(
+        "/api/v1/tools/build_comparison_table",
+        json={"place_ids": [place["id"]], "columns": ["secret_sauce"]},
+        headers=api_headers,
+    )
+    assert response.status_code == 400
+    await client.delete(f"/api/v1/places/{place['id']}", headers=api_headers)
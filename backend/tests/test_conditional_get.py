@@ -0,0 +1,76 @@
+"""ETag revalidation and response compression tests."""
+
+from __future__ import annotations
+
+import uuid
+
+from starlette.requests import Request
+
+from app.api.responses import not_modified, weak_etag
+
+
+def _request(if_none_match: str | None) -> Request:
+    headers = [(b"if-none-match", if_none_match.encode())] if if_none_match else []
+    return Request({"type": "http", "method": "GET", "path": "/", "headers": headers})
+
+
+async def _create_place(client, api_headers, **overrides):
+    payload = {"canonical_name": f"etag-place-{uuid.uuid4()}"}
+    payload.update(overrides)
+    response = await client.post("/api/v1/places", json=payload, headers=api_headers)
+    assert response.status_code == 201, response.text
+    return response.json()["place"]
+
+
+def test_not_modified_uses_weak_comparison():
+    etag = weak_etag(("place", 1))
+
+    assert etag.startswith('W/"')
+    assert weak_etag(("place", 1)) == etag != weak_etag(("place", 2))
+    assert not_modified(_request(None), etag) is None
+    assert not_modified(_request('W/"other"'), etag) is None
+    assert not_modified(_request(f'W/"other", {etag.removeprefix("W/")}'), etag).status_code == 304
+    assert not_modified(_request("*"), etag).headers["etag"] == etag
+
+
+async def test_place_detail_revalidates_until_children_change(client, api_headers):
+    place = await _create_place(client, api_headers, notes=["첫 메모"])
+    url = f"/api/v1/places/{place['id']}"
+
+    first = await client.get(url, headers=api_headers)
+    etag = first.headers["etag"]
+    cached = await client.get(url, headers={**api_headers, "If-None-Match": etag})
+    assert cached.status_code == 304
+    assert cached.content == b""
+
+    note_id = first.json()["notes"][0]["id"]
+    await client.delete(f"/api/v1/notes/{note_id}", headers=api_headers)
+    changed = await client.get(url, headers={**api_headers, "If-None-Match": etag})
+    assert changed.status_code == 200
+    assert changed.headers["etag"] != etag
+    assert changed.json()["notes"] == []
+
+    await client.delete(url, headers=api_headers)
+
+
+async def test_place_list_revalidates_and_is_compressed(client, api_headers):
+    category = f"etag-{uuid.uuid4()}"
+    places = [await _create_place(client, api_headers, category_primary=category) for _ in range(6)]
+    params = {"category_primary": category, "limit": 100}
+
+    first = await client.get("/api/v1/places", params=params, headers={**api_headers, "Accept-Encoding": "gzip"})
+    assert first.status_code == 200
+    assert first.headers["content-encoding"] == "gzip"
+    cached = await client.get(
+        "/api/v1/places", params=params, headers={**api_headers, "If-None-Match": first.headers["etag"]}
+    )
+    assert cached.status_code == 304
+
+    await client.patch(f"/api/v1/places/{places[0]['id']}", json={"is_favorite": True}, headers=api_headers)
+    changed = await client.get(
+        "/api/v1/places", params=params, headers={**api_headers, "If-None-Match": first.headers["etag"]}
+    )
+    assert changed.status_code == 200
+
+    for place in places:
+        await client.delete(f"/api/v1/places/{place['id']}", headers=api_headers)
@@ -0,0 +1,174 @@
+"""Embedding search and re-embedding cutover tests."""
+
+from __future__ import annotations
+
+import math
+import uuid
+
+import pytest
+from sqlalchemy import delete, func, select, text
+from sqlalchemy.dialects import postgresql
+
+from app.config import settings
+from app.deps import async_session_factory
+from app.llm.embedder import StubEmbedder, get_embedder
+from app.models.embedding import Embedding, ReembedJob
+from app.schemas.search import SearchFilters
+from app.services import embedding_service
+
+
+async def test_stub_embedder_is_deterministic_and_normalized():
+    embedder = StubEmbedder("stub-test", 32)
+    first, again, other = await embedder.embed(["조용한 카페", "조용한 카페", "시끄러운 술집"])
+    assert first == again
+    assert math.isclose(sum(x * x for x in first), 1.0)
+    assert first != other
+
+
+def test_get_embedder_uses_stub_for_stub_models():
+    embedder = get_embedder("stub-small", 8)
+    assert isinstance(embedder, StubEmbedder)
+    assert (embedder.model, embedder.dimensions) == ("stub-small", 8)
+
+
+def test_ef_search_per_request_class():
+    assert embedding_service.ef_search_for("interactive") == settings.hnsw_ef_search_interactive
+    assert embedding_service.ef_search_for("batch") == settings.hnsw_ef_search_batch
+    with pytest.raises(ValueError):
+        embedding_service.ef_search_for("bulk")
+
+
+def test_rerank_orders_candidate_pool_by_exact_distance():
+    plain = embedding_service._nearest([0.0, 1.0], "m", "place", 10, 10)
+    reranked = embedding_service._nearest([0.0, 1.0], "m", "place", 10, 200)
+    assert str(plain.compile(dialect=postgresql.dialect())).count("<=>") == 1
+    sql = str(reranked.compile(dialect=postgresql.dialect()))
+    assert sql.count("<=>") == 2 and "anon_1" in sql
+
+
+def test_type_filter_is_inlined_for_partial_index():
+    stmt = embedding_service._nearest([0.0, 1.0], "m", "note", 10, 10)
+    sql = str(stmt.compile(dialect=postgresql.dialect(), compile_kwargs={"render_postcompile": True}))
+    assert "embeddings.entity_type = 'note'" in sql
+
+
+def test_quantized_index_candidates_are_reranked_at_full_precision():
+    for indexed, operator in (("halfvec", "<=>"), ("bit", "<~>")):
+        stmt = embedding_service._nearest([0.0, 1.0], "m", "place", 10, 10, indexed)
+        sql = str(stmt.compile(dialect=postgresql.dialect()))
+        assert operator in sql and f"{indexed.upper()}(2)" in sql
+        # 바깥 쿼리는 원본 vector로 정확한 거리를 다시 계산한다
+        assert sql.rindex("<=>") > sql.index("anon_1")
+
+
+def test_place_restriction_searches_small_candidate_sets_exactly(monkeypatch):
+    monkeypatch.setattr(settings, "vector_prefilter_exact_max", 2)
+
+    def sql(kind, place_ids=None, filters=None):
+        places, exact = embedding_service._allowed_places(place_ids, filters)
+        stmt = embedding_service._nearest([0.0, 1.0], "m", kind, 10, 10, places=places, exact=exact)
+        return str(stmt.compile(dialect=postgresql.dialect()))
+
+    few = [uuid.uuid4(), uuid.uuid4()]
+    exact = sql("note", few)
+    assert "AS MATERIALIZED" in exact and "places.id = ANY" in exact and "notes.place_id IN" in exact
+    # 후보가 많거나 SQL 조건뿐이면 HNSW 스캔에 장소 조건을 더한다
+    many = sql("place", [*few, uuid.uuid4()])
+    assert "MATERIALIZED" not in many and "embeddings.entity_id IN" in many
+    filtered = sql("place", filters=SearchFilters(parking=True))
+    assert "MATERIALIZED" not in filtered and "places.parking IS true" in filtered
+    assert embedding_service._allowed_places(None, None) == (None, False)
+
+
+async def test_search_rejects_unknown_entity_type():
+    async with async_session_factory() as db:
+        with pytest.raises(ValueError):
+            await embedding_service.search(db, "카페", entity_type="visit")
+
+
+async def test_rebuild_vector_index_rejects_invalid_params():
+    with pytest.raises(ValueError):
+        await embedding_service.rebuild_vector_index(m=1)
+    with pytest.raises(ValueError):
+        await embedding_service.rebuild_vector_index(m=16, ef_construction=16)
+    with pytest.raises(ValueError):
+        await embedding_service.rebuild_vector_index(indexed="int8")
+
+
+async def _table_exists(db, name: str) -> bool:
+    return await db.scalar(select(func.to_regclass(name))) is not None
+
+
+@pytest.fixture
+async def restore_embedding_model():
+    """Undo a re-embedding cutover: live table, retired table, job rows and module caches.
+
+    Yields a list the test fills with (entity_type, entity_id) keys whose
+    live-model embeddings should be deleted once the original table is back.
+    """
+    async with async_session_factory() as db:
+        jobs = list(await db.scalars(select(ReembedJob.id)))
+        kept_retired = await _table_exists(db, "embeddings_retired")
+        if kept_retired:
+            # cutover가 지우지 않도록 기존 retired 테이블을 옆으로 치워 둔다
+            await embedding_service._rename_table(db, "embeddings_retired", "embeddings_retired_saved")
+            await db.commit()
+    created: list[tuple[str, uuid.UUID]] = []
+    try:
+        yield created
+    finally:
+        async with async_session_factory() as db:
+            added = (await db.scalars(select(ReembedJob).where(ReembedJob.id.not_in(jobs)))).all()
+            if any(job.status == "completed" for job in added):
+                await db.execute(text("DROP TABLE embeddings"))
+                await embedding_service._rename_table(db, "embeddings_retired", "embeddings")
+            await db.execute(text("DROP TABLE IF EXISTS embeddings_shadow"))
+            if kept_retired:
+                await db.execute(text("DROP TABLE IF EXISTS embeddings_retired"))
+                await embedding_service._rename_table(db, "embeddings_retired_saved", "embeddings_retired")
+            await db.execute(delete(ReembedJob).where(ReembedJob.id.not_in(jobs)))
+            for entity_type, entity_id in created:
+                await db.execute(
+                    delete(Embedding).where(Embedding.entity_type == entity_type, Embedding.entity_id == entity_id)
+                )
+            await db.commit()
+        embedding_service._active = None
+        embedding_service._index_type = None
+
+
+async def test_reembed_switches_search_to_new_model(client, api_headers, restore_embedding_model):
+    name = f"reembed-{uuid.uuid4()}"
+    response = await client.post("/api/v1/places", json={"canonical_name": name}, headers=api_headers)
+    assert response.status_code == 201, response.text
+    place_id = uuid.UUID(response.json()["place"]["id"])
+    restore_embedding_model.append(("place", place_id))
+
+    async with async_session_factory() as db:
+        old_model = await embedding_service.active_model(db)
+        await embedding_service.upsert_embeddings(db, "place", [place_id], StubEmbedder(*old_model))
+        await db.commit()
+
+        target = ("stub-reembed", 64)
+        job = await embedding_service.start_reembed(db, *target)
+
+    job = await embedding_service.run_reembed(job.id, StubEmbedder(*target), batch_size=50, interval=0)
+    assert job.status == "completed"
+
+    async with async_session_factory() as db:
+        assert await embedding_service.active_model(db) == target
+        hits = await embedding_service.search(db, name, entity_type="place", limit=1)
+        reranked = await embedding_service.search(
+            db, name, entity_type="place", limit=1, request_class="agent", rerank=True
+        )
+        merged = await embedding_service.search(db, name, limit=1)
+    assert hits[0].entity_id == place_id
+    assert reranked == hits
+    assert merged == hits
+
+    await client.delete(f"/api/v1/places/{place_id}", headers=api_headers)
+
+
+def test_shadow_staleness_compares_text_hashes():
+    sql = str(embedding_service._stale_keys().compile(dialect=postgresql.dialect()))
+    assert "embeddings_shadow.source_hash IS DISTINCT FROM embeddings.text_hash" in sql
+    assert "updated_at" not in sql
@@ -0,0 +1,127 @@
+"""Place filter compiler and facet count tests."""
+
+from __future__ import annotations
+
+import uuid
+
+import pytest
+from sqlalchemy.dialects import postgresql
+
+from app.schemas.search import PlaceFacets, SearchFilters
+from app.services import cache_service, facet_service, filter_service
+
+
+def _sql(filters: SearchFilters | None) -> str:
+    return str(filter_service.compile_filters(filters).compile(dialect=postgresql.dialect()))
+
+
+def test_empty_filters_compile_to_true():
+    assert _sql(None) == "true"
+    assert _sql(SearchFilters()) == "true"
+
+
+def test_array_filters_use_index_operators():
+    sql = _sql(SearchFilters(mood=["조용한", " "], situations=["데이트"], companions=["친구", "가족"]))
+    assert "places.mood @> " in sql
+    assert "places.situations @> " in sql
+    assert "places.companions && " in sql
+
+
+def test_scalar_tag_and_distance_filters():
+    sql = _sql(
+        SearchFilters(
+            parking=True,
+            category_primary="카페",
+            min_rating=4,
+            tags=["단골", "단골"],
+            max_distance_km=1.5,
+            lat=37.5,
+            lng=127.0,
+        )
+    )
+    assert "places.parking IS true" in sql
+    assert "places.category_primary = " in sql
+    assert "places.user_rating >= " in sql
+    assert "HAVING count(*) = " in sql
+    assert "ST_DWithin(places.location" in sql
+
+
+def test_ontology_filter_walks_descendants():
+    sql = _sql(SearchFilters(ontology_nodes=[uuid.uuid4()]))
+    assert "WITH RECURSIVE ontology_tree" in sql
+    assert "relations.to_entity_id IN (SELECT ontology_tree.id" in sql
+
+
+def test_distance_requires_origin():
+    with pytest.raises(ValueError):
+        filter_service.compile_filters(SearchFilters(max_distance_km=1))
+
+
+async def test_list_places_filters_by_mood(client, api_headers):
+    mood = f"mood-{uuid.uuid4().hex[:8]}"
+    payload = {"canonical_name": f"test-place-{uuid.uuid4()}", "mood": [mood, "아늑한"], "companions": ["친구"]}
+    response = await client.post("/api/v1/places", json=payload, headers=api_headers)
+    assert response.status_code == 201, response.text
+    place = response.json()["place"]
+
+    matched = await client.get(
+        "/api/v1/places", params={"mood": [mood, "아늑한"], "companions": ["가족", "친구"]}, headers=api_headers
+    )
+    assert [item["id"] for item in matched.json()["items"]] == [place["id"]]
+    missed = await client.get("/api/v1/places", params={"mood": [mood, "시끄러운"]}, headers=api_headers)
+    assert missed.json()["items"] == []
+
+    await client.delete(f"/api/v1/places/{place['id']}", headers=api_headers)
+
+
+async def test_distance_filter_requires_origin(client, api_headers):
+    response = await client.get("/api/v1/places", params={"max_distance_km": 1}, headers=api_headers)
+    assert response.status_code == 400
+
+
+def test_facets_are_one_grouping_sets_query():
+    sql = str(facet_service._facet_statement(SearchFilters(tags=["단골"])).compile(dialect=postgresql.dialect()))
+    assert sql.count("SELECT") == 3  # 필터 CTE, 태그 서브쿼리, 집계
+    assert "GROUP BY GROUPING SETS(" in sql
+    assert "LATERAL unnest(filtered.mood)" in sql
+
+
+async def test_facets_cached_per_filter_and_data_version():
+    filters = SearchFilters(mood=["조용한"])
+    cached = PlaceFacets(total=3)
+    facet_service._facet_cache.set((facet_service.filter_hash(filters), cache_service.data_version()), cached)
+
+    assert await facet_service.place_facets(None, SearchFilters(mood=["조용한"])) is cached  # type: ignore[arg-type]
+    assert facet_service.filter_hash(filters) != facet_service.filter_hash(SearchFilters(mood=["시끄러운"]))
+    cache_service.invalidate_place(uuid.uuid4())
+    assert facet_service._facet_cache.get((facet_service.filter_hash(filters), cache_service.data_version())) is None
+
+
+async def test_place_facets_counts(client, api_headers):
+    mood = f"mood-{uuid.uuid4().hex[:8]}"
+    tag = f"tag-{uuid.uuid4().hex[:8]}"
+    created = []
+    for category in ("카페", "카페", "식당"):
+        payload = {
+            "canonical_name": f"test-place-{uuid.uuid4()}",
+            "category_primary": category,
+            "mood": [mood, "아늑한"],
+            "tags": [tag],
+        }
+        response = await client.post("/api/v1/places", json=payload, headers=api_headers)
+        assert response.status_code == 201, response.text
+        created.append(response.json()["place"]["id"])
+
+    response = await client.get("/api/v1/places/facets", params={"mood": mood}, headers=api_headers)
+    assert response.status_code == 200, response.text
+    facets = response.json()
+    assert facets["total"] == 3
+    assert facets["category_primary"] == [
+        {"value": "카페", "count": 2, "parent": None},
+        {"value": "식당", "count": 1, "parent": None},
+    ]
+    assert {"value": mood, "count": 3, "parent": None} in facets["mood"]
+    assert facets["tags"] == [{"value": tag, "count": 3, "parent": None}]
+
+    for place_id in created:
+        await client.delete(f"/api/v1/places/{place_id}", headers=api_headers)
@@ -0,0 +1,85 @@
+"""Itinerary solver and draft_itinerary tool tests."""
+
+from __future__ import annotations
+
+import itertools
+import random
+import uuid
+
+from app.utils.itinerary import distance_matrix, estimate_travel, haversine_m, path_cost, solve_path
+
+
+def _random_points(rng: random.Random, n: int) -> list[tuple[float, float]]:
+    return [(37.50 + rng.random() * 0.1, 127.00 + rng.random() * 0.1) for _ in range(n)]
+
+
+def test_haversine_seoul_busan():
+    distance = haversine_m(37.5665, 126.9780, 35.1796, 129.0756)
+    assert 320_000 < distance < 330_000
+
+
+def test_estimate_travel_modes():
+    assert estimate_travel(300)[0] == "walk"
+    mode, minutes = estimate_travel(5_000)
+    assert mode == "transit"
+    assert minutes > 8
+
+
+def test_exact_solver_matches_brute_force():
+    rng = random.Random(7)
+    for n in range(1, 8):
+        cost = distance_matrix(_random_points(rng, n))
+        order = solve_path(cost, start=0)
+        best = min(path_cost(cost, p) for p in itertools.permutations(range(n)) if p[0] == 0)
+        assert order[0] == 0
+        assert sorted(order) == list(range(n))
+        assert abs(path_cost(cost, order) - best) < 1e-6
+
+
+def test_two_opt_visits_every_node_once():
+    rng = random.Random(11)
+    cost = distance_matrix(_random_points(rng, 25))
+    order = solve_path(cost, start=0)
+    assert order[0] == 0
+    assert sorted(order) == list(range(25))
+
+
+async def _create_place(client, api_headers, **overrides):
+    payload = {"canonical_name": f"itinerary-place-{uuid.uuid4()}"}
+    payload.update(overrides)
+    response = await client.post("/api/v1/places", json=payload, headers=api_headers)
+    assert response.status_code == 201, response.text
+    return response.json()["place"]
+
+
+async def test_draft_itinerary_tool(client, api_headers):
+    far = await _create_place(client, api_headers, lat=37.5796, lng=126.9770)
+    near = await _create_place(client, api_headers, lat=37.5665, lng=126.9780)
+    unlocated = await _create_place(client, api_headers)
+
+    response = await client.post(
+        "/api/v1/tools/draft_itinerary",
+        json={
+            "place_ids": [far["id"], near["id"], unlocated["id"]],
+            "start_location": {"lat": 37.5651, "lng": 126.9895},
+        },
+        headers=api_headers,
+    )
+    assert response.status_code == 200, response.text
+    body = response.json()
+    assert [p["id"] for p in body["places_ordered"]] == [near["id"], far["id"], unlocated["id"]]
+    assert body["legs"][0]["from_place_id"] is None
+    assert body["unlocated_place_ids"] == [unlocated["id"]]
+    assert "Total estimated travel" in body["markdown"]
+
+    for place in (far, near, unlocated):
+        await client.delete(f"/api/v1/places/{place['id']}", headers=api_headers)
+
+
+async def test_draft_itinerary_missing_place(client, api_headers):
+    response = await client.post(
+        "/api/v1/tools/draft_itinerary",
+        json={"place_ids": [str(uuid.uuid4())]},
+        headers=api_headers,
+    )
+    assert response.status_code == 404
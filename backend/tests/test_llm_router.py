@@ -0,0 +1,98 @@
+"""LLM router tests using offline stub providers."""
+
+from __future__ import annotations
+
+import asyncio
+
+import pytest
+
+from app.llm.base import LLMCompletion, LLMError, LLMTimeoutError
+from app.llm.router import LLMRouter
+from app.llm.stub_llm import StubLLM
+
+MESSAGES = [{"role": "user", "content": "hello there"}]
+
+
+def _router(providers: dict[str, StubLLM], costs: list[tuple[LLMCompletion, str]], **kwargs) -> LLMRouter:
+    async def record(completion: LLMCompletion, action: str) -> None:
+        costs.append((completion, action))
+
+    return LLMRouter(providers=providers, default_provider="primary", cost_logger=record, **kwargs)
+
+
+async def test_complete_accounts_cost():
+    costs: list[tuple[LLMCompletion, str]] = []
+    router = _router({"primary": StubLLM("primary", reply="hi")}, costs, hedge_provider="")
+
+    completion = await router.complete(MESSAGES, action="chat")
+
+    assert completion.text == "hi"
+    assert [(c.provider, action) for c, action in costs] == [("primary", "chat")]
+    assert costs[0][0].tokens_in == 2
+
+
+async def test_per_provider_concurrency_limit():
+    stub = StubLLM("primary", latency=0.02)
+    router = _router({"primary": stub}, [], max_concurrency=2, hedge_provider="")
+
+    await asyncio.gather(*(router.complete(MESSAGES) for _ in range(6)))
+
+    assert stub.calls == 6
+    assert stub.max_in_flight == 2
+
+
+async def test_deadline_raises_timeout():
+    router = _router({"primary": StubLLM("primary", latency=1.0)}, [], hedge_provider="")
+
+    with pytest.raises(LLMTimeoutError):
+        await router.complete(MESSAGES, timeout=0.05)
+
+
+async def test_hedges_to_second_provider_when_slow():
+    slow = StubLLM("primary", reply="slow", latency=1.0)
+    fast = StubLLM("secondary", reply="fast")
+    costs: list[tuple[LLMCompletion, str]] = []
+    router = _router({"primary": slow, "secondary": fast}, costs, hedge_after=0.02, hedge_provider="secondary")
+
+    completion = await router.complete(MESSAGES, timeout=0.5)
+
+    assert completion.text == "fast"
+    assert [c.provider for c, _ in costs] == ["secondary"]
+
+
+async def test_fails_over_when_primary_errors():
+    broken = StubLLM("primary", error=RuntimeError("boom"))
+    backup = StubLLM("secondary", reply="backup")
+    router = _router({"primary": broken, "secondary": backup}, [], hedge_after=5.0, hedge_provider="secondary")
+
+    completion = await router.complete(MESSAGES, timeout=0.5)
+
+    assert completion.text == "backup"
+
+
+async def test_all_providers_fail():
+    router = _router({"primary": StubLLM("primary", error=RuntimeError("boom"))}, [], hedge_provider="")
+
+    with pytest.raises(LLMError):
+        await router.complete(MESSAGES)
+
+
+async def test_parse_search_intent_through_router():
+    reply = '```json\n{"search_text": "데이트", "filters": {"parking": true, "mood": ["quiet"], "min_rating": null}}'
+    reply += "\n```"
+    router = _router({"primary": StubLLM("primary", reply=reply)}, [], hedge_provider="")
+
+    intent = await router.parse_search_intent("주차 되는 조용한 데이트")
+
+    assert intent.search_text == "데이트"
+    assert intent.filters.parking is True
+    assert intent.filters.mood == ["quiet"]
+
+
+async def test_parse_search_intent_falls_back_on_bad_json():
+    router = _router({"primary": StubLLM("primary", reply="not json")}, [], hedge_provider="")
+
+    intent = await router.parse_search_intent("비 오는 날")
+
+    assert intent.search_text == "비 오는 날"
+    assert intent.filters.mood is None
@@ -0,0 +1,152 @@
+"""Transactional outbox delivery tests."""
+
+from __future__ import annotations
+
+import uuid
+
+from sqlalchemy import func, select
+
+from app.deps import async_session_factory
+from app.models.outbox import OutboxEvent, OutboxOffset
+from app.services import outbox_service
+
+
+async def _create_place(client, api_headers, **overrides):
+    payload = {"canonical_name": f"outbox-place-{uuid.uuid4()}"}
+    payload.update(overrides)
+    response = await client.post("/api/v1/places", json=payload, headers=api_headers)
+    assert response.status_code == 201, response.text
+    return response.json()["place"]
+
+
+async def test_mutations_write_events_in_their_transaction(client, api_headers):
+    place = await _create_place(client, api_headers, notes=["outbox note"])
+    place_id = uuid.UUID(place["id"])
+    await client.patch(f"/api/v1/places/{place['id']}", json={"is_favorite": True}, headers=api_headers)
+    await client.delete(f"/api/v1/places/{place['id']}", headers=api_headers)
+
+    async with async_session_factory() as db:
+        rows = (
+            await db.execute(select(OutboxEvent).where(OutboxEvent.place_id == place_id).order_by(OutboxEvent.id))
+        ).scalars()
+        events = [(row.entity_type, row.op) for row in rows]
+
+    assert events == [("place", "insert"), ("note", "insert"), ("place", "update"), ("place", "delete")]
+
+
+async def test_durable_handler_resumes_and_redelivers_after_failure(client, api_headers):
+    name = f"test-{uuid.uuid4()}"
+    seen: list[outbox_service.ChangeEvent] = []
+    fail = True
+
+    async def handler(events):
+        if fail:
+            raise RuntimeError("boom")
+        seen.extend(events)
+
+    place = await _create_place(client, api_headers)
+    outbox_service.register_handler(name, handler, durable=True)
+    try:
+        await outbox_service.dispatch_pending()
+        async with async_session_factory() as db:
+            assert await db.get(OutboxOffset, name) is None
+
+        fail = False
+        await outbox_service.dispatch_pending(batch_size=50)
+        assert any(event.place_id == uuid.UUID(place["id"]) for event in seen)
+        assert [(e.tx_id, e.id) for e in seen] == sorted((e.tx_id, e.id) for e in seen)
+
+        delivered = len(seen)
+        await outbox_service.dispatch_pending()
+        assert len(seen) == delivered
+    finally:
+        outbox_service.unregister_handler(name)
+        async with async_session_factory() as db:
+            offset = await db.get(OutboxOffset, name)
+            if offset is not None:
+                await db.delete(offset)
+                await db.commit()
+        await client.delete(f"/api/v1/places/{place['id']}", headers=api_headers)
+
+
+async def test_commit_delivers_own_events_while_another_transaction_is_open(client, api_headers):
+    name = f"test-{uuid.uuid4()}"
+    seen: list[outbox_service.ChangeEvent] = []
+
+    async def handler(events):
+        seen.extend(events)
+
+    outbox_service.register_handler(name, handler)
+    try:
+        async with async_session_factory() as blocker:
+            # xid를 가진 채 열려 있는 트랜잭션이 snapshot xmin을 붙잡는다
+            await blocker.execute(select(func.pg_current_xact_id()))
+            place = await _create_place(client, api_headers)
+            assert any(event.place_id == uuid.UUID(place["id"]) for event in seen)
+            await blocker.rollback()
+    finally:
+        outbox_service.unregister_handler(name)
+    await client.delete(f"/api/v1/places/{place['id']}", headers=api_headers)
+
+
+async def test_commit_leaves_durable_consumers_to_the_dispatcher(client, api_headers):
+    name = f"test-{uuid.uuid4()}"
+    seen: list[outbox_service.ChangeEvent] = []
+
+    async def handler(events):
+        seen.extend(events)
+
+    outbox_service.register_handler(name, handler, durable=True)
+    try:
+        place = await _create_place(client, api_headers)
+        # 쓰기 요청은 내구성 소비자를 기다리지 않는다 — NOTIFY를 받은 디스패처가 전달한다
+        assert seen == []
+        await outbox_service.dispatch_pending()
+        assert any(event.place_id == uuid.UUID(place["id"]) for event in seen)
+    finally:
+        outbox_service.unregister_handler(name)
+        async with async_session_factory() as db:
+            offset = await db.get(OutboxOffset, name)
+            if offset is not None:
+                await db.delete(offset)
+                await db.commit()
+        await client.delete(f"/api/v1/places/{place['id']}", headers=api_headers)
+
+
+async def test_durable_consumer_is_delivered_by_one_process_at_a_time(client, api_headers):
+    name = f"test-{uuid.uuid4()}"
+    seen: list[outbox_service.ChangeEvent] = []
+
+    async def handler(events):
+        seen.extend(events)
+
+    place = await _create_place(client, api_headers)
+    outbox_service.register_handler(name, handler, durable=True)
+    try:
+        async with async_session_factory() as db:
+            db.add(OutboxOffset(consumer=name))
+            await db.commit()
+        async with async_session_factory() as other:
+            # 다른 워커가 오프셋 행을 잠그고 전달하는 중
+            await other.execute(select(OutboxOffset).where(OutboxOffset.consumer == name).with_for_update())
+            assert await outbox_service.dispatch_pending() >= 0
+            assert seen == []
+            await other.rollback()
+
+        await outbox_service.dispatch_pending()
+        assert any(event.place_id == uuid.UUID(place["id"]) for event in seen)
+
+        async with async_session_factory() as db:
+            offset = await db.get(OutboxOffset, name)
+            # 뒤처진 워커가 저장하려 해도 오프셋은 뒤로 가지 않는다
+            await outbox_service._save_position(db, name, outbox_service._handlers[name], (0, 0))
+            await db.refresh(offset)
+            assert (offset.tx_id, offset.event_id) > (0, 0)
+    finally:
+        outbox_service.unregister_handler(name)
+        async with async_session_factory() as db:
+            offset = await db.get(OutboxOffset, name)
+            if offset is not None:
+                await db.delete(offset)
+                await db.commit()
+        await client.delete(f"/api/v1/places/{place['id']}", headers=api_headers)
@@ -0,0 +1,75 @@
+"""Keyset pagination engine tests."""
+
+from __future__ import annotations
+
+import base64
+import uuid
+from datetime import UTC, date, datetime
+
+import pytest
+from sqlalchemy.dialects import postgresql
+
+from app.models.place import Place
+from app.utils.pagination import InvalidCursorError, Keyset, SortKey
+
+CREATED = Keyset("test:created", (SortKey(Place.created_at), SortKey(Place.id)))
+
+
+def _compile(clause) -> str:
+    return str(clause.compile(dialect=postgresql.dialect()))
+
+
+def test_cursor_round_trip_is_compact():
+    values = (datetime(2026, 3, 1, 12, 30, 5, 123456, tzinfo=UTC), uuid.uuid4())
+
+    cursor = CREATED.encode(values)
+
+    assert CREATED.decode(cursor) == values
+    assert len(cursor) <= 48
+    assert "=" not in cursor
+
+
+def test_cursor_round_trips_mixed_value_types():
+    keyset = Keyset(
+        "test:mixed",
+        tuple(SortKey(column) for column in (Place.last_visited_at, Place.visit_count, Place.canonical_name, Place.id)),
+    )
+    values = (date(2025, 12, 31), 42, "을지로 노가리", uuid.uuid4())
+
+    assert keyset.decode(keyset.encode(values)) == values
+
+
+def test_tampered_or_foreign_cursor_is_rejected():
+    cursor = CREATED.encode((datetime.now(UTC), uuid.uuid4()))
+    raw = bytearray(base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4)))
+    raw[3] ^= 0x01
+    tampered = base64.urlsafe_b64encode(bytes(raw)).rstrip(b"=").decode()
+    other = Keyset("test:other", CREATED.keys)
+
+    for bad in (tampered, "not-a-cursor", "", "%%%"):
+        with pytest.raises(InvalidCursorError):
+            CREATED.decode(bad)
+    with pytest.raises(InvalidCursorError):
+        other.decode(cursor)
+
+
+def test_after_uses_row_value_comparison_for_uniform_direction():
+    sql = _compile(CREATED.after((datetime.now(UTC), uuid.uuid4())))
+
+    assert "(places.created_at, places.id) < (" in sql
+
+
+def test_after_expands_mixed_directions():
+    keyset = Keyset("test:mixed-dir", (SortKey(Place.visit_count), SortKey(Place.id, descending=False)))
+
+    sql = _compile(keyset.after((3, uuid.uuid4())))
+
+    assert "places.visit_count < " in sql
+    assert "places.visit_count = " in sql and "places.id > " in sql
+    assert [str(clause) for clause in keyset.order_by()] == ["places.visit_count DESC", "places.id ASC"]
+
+
+async def test_malformed_cursor_returns_400(client, api_headers):
+    response = await client.get("/api/v1/places", params={"cursor": "bm90LWEtY3Vyc29y"}, headers=api_headers)
+
+    assert response.status_code == 400
@@ -4,6 +4,11 @@ from __future__ import annotations
 
 import uuid
 
+from sqlalchemy.dialects import postgresql
+
+from app.deps import async_session_factory
+from app.services import cache_service, outbox_service, place_service, search_document_service
+
 
 async def _create_place(client, api_headers, **overrides):
     payload = {"canonical_name": f"test-place-{uuid.uuid4()}"}
@@ -85,3 +90,145 @@ async def test_delete_place(client, api_headers):
 
     get_res = await client.get(f"/api/v1/places/{place['id']}", headers=api_headers)
     assert get_res.status_code == 404
+
+
+async def test_delete_place_cascades_children(client, api_headers):
+    place = await _create_place(client, api_headers, notes=["first", "second"])
+    await client.post("/api/v1/visits", json={"place_id": place["id"], "visited_at": "2026-01-02"}, headers=api_headers)
+    source = await client.post(
+        "/api/v1/sources", json={"place_id": place["id"], "raw_text": "page"}, headers=api_headers
+    )
+
+    delete_res = await client.delete(f"/api/v1/places/{place['id']}", headers=api_headers)
+    assert delete_res.status_code == 204
+    notes = await client.get("/api/v1/notes", params={"place_id": place["id"]}, headers=api_headers)
+    assert notes.json()["items"] == []
+    raw = await client.get(f"/api/v1/sources/{source.json()['id']}/raw", headers=api_headers)
+    assert raw.status_code == 404
+
+
+async def test_bulk_delete_places(client, api_headers):
+    places = [await _create_place(client, api_headers, notes=["memo"]) for _ in range(3)]
+    missing = str(uuid.uuid4())
+
+    response = await client.post(
+        "/api/v1/places/bulk-delete",
+        json={"place_ids": [place["id"] for place in places] + [missing]},
+        headers=api_headers,
+    )
+    assert response.status_code == 200
+    body = response.json()
+    assert sorted(body["deleted"]) == sorted(place["id"] for place in places)
+    assert body["not_found"] == [missing]
+
+    for place in places:
+        get_res = await client.get(f"/api/v1/places/{place['id']}", headers=api_headers)
+        assert get_res.status_code == 404
+
+    empty = await client.post("/api/v1/places/bulk-delete", json={"place_ids": []}, headers=api_headers)
+    assert empty.status_code == 422
+
+
+async def test_place_detail_json_matches_orm_loader(client, api_headers):
+    notes = [f"note-{i}" for i in range(place_service.DETAIL_CHILD_LIMIT + 2)]
+    place = await _create_place(client, api_headers, tags=["pytest-b", "pytest-a"], notes=notes)
+    place_id = uuid.UUID(place["id"])
+
+    async with async_session_factory() as db:
+        single = await place_service.get_place_detail(db, place_id)
+        reference = await place_service.get_place_detail_orm(db, place_id)
+        missing = await place_service.get_place_detail(db, uuid.uuid4())
+
+    assert missing is None
+    assert single is not None and reference is not None
+    assert len(single.notes) == place_service.DETAIL_CHILD_LIMIT
+    assert single.notes_next_cursor == reference.notes_next_cursor is not None
+    # 관계 컬렉션은 ORM 쪽 순서가 정해져 있지 않으므로 정렬해서 비교한다
+    reference.tags.sort(key=lambda tag: tag.name)
+    assert single == reference
+
+    await client.delete(f"/api/v1/places/{place['id']}", headers=api_headers)
+
+
+async def test_place_detail_cache_invalidated_by_child_write(client, api_headers):
+    place = await _create_place(client, api_headers)
+
+    first = await client.get(f"/api/v1/places/{place['id']}", headers=api_headers)
+    assert first.status_code == 200
+    assert first.json()["notes"] == []
+    assert uuid.UUID(place["id"]) in place_service._detail_cache._data
+
+    note_res = await client.post(
+        "/api/v1/notes", json={"place_id": place["id"], "content": "cache-note"}, headers=api_headers
+    )
+    assert note_res.status_code == 201
+    second = await client.get(f"/api/v1/places/{place['id']}", headers=api_headers)
+    assert [note["content"] for note in second.json()["notes"]] == ["cache-note"]
+    assert second.headers["etag"] != first.headers["etag"]
+
+    await client.delete(f"/api/v1/places/{place['id']}", headers=api_headers)
+
+
+def test_place_detail_cache_evicted_on_invalidation():
+    place_id = uuid.uuid4()
+    place_service._detail_cache.set(place_id, (cache_service.place_version(place_id), None, b"{}"))
+
+    cache_service.invalidate_place(place_id)
+
+    assert place_service._detail_cache.get(place_id) is None
+
+
+async def test_keyword_search_matches_note_text(client, api_headers):
+    word = f"kw{uuid.uuid4().hex[:12]}"
+    place = await _create_place(client, api_headers, notes=[f"창가 자리 {word} 추천"])
+    # 테스트 클라이언트는 lifespan을 돌리지 않으므로 디스패처 대신 직접 전달한다
+    await outbox_service.dispatch_pending()
+
+    response = await client.get("/api/v1/places/search", params={"q": word}, headers=api_headers)
+    assert response.status_code == 200
+    hits = response.json()
+    assert [hit["place_id"] for hit in hits] == [place["id"]]
+    assert hits[0]["rank"] > 0
+
+    # 어절 일부도 트라이그램 인덱스로 찾는다
+    partial = await client.get("/api/v1/places/search", params={"q": word[:-2]}, headers=api_headers)
+    assert place["id"] in [hit["place_id"] for hit in partial.json()]
+
+    await client.delete(f"/api/v1/places/{place['id']}", headers=api_headers)
+    await outbox_service.dispatch_pending()
+    gone = await client.get("/api/v1/places/search", params={"q": word}, headers=api_headers)
+    assert gone.json() == []
+
+
+async def test_short_keyword_query_skips_substring_scan():
+    class _Capture:
+        statement = None
+
+        async def execute(self, stmt):
+            self.statement = stmt
+            return []
+
+    db = _Capture()
+    await search_document_service.keyword_search(db, "카페")
+    short = db.statement.compile(dialect=postgresql.dialect())
+    await search_document_service.keyword_search(db, "카페라")
+    long = db.statement.compile(dialect=postgresql.dialect())
+    # 트라이그램이 없는 2글자 검색어에는 인덱스 전체를 훑는 ILIKE 대신 접두 tsquery를 쓴다
+    assert "ILIKE" not in str(short)
+    assert "'카페':*" in short.params.values()
+    assert "ILIKE" in str(long)
+    assert "'카페라':*" not in long.params.values()
+
+
+async def test_short_keyword_query_matches_word_prefix(client, api_headers):
+    syllables = "".join(chr(0xAC00 + int(c, 16) * 97) for c in uuid.uuid4().hex[:2])
+    place = await _create_place(client, api_headers, notes=[f"{syllables}에서 만나요"])
+    await outbox_service.dispatch_pending()
+    response = await client.get("/api/v1/places/search", params={"q": syllables}, headers=api_headers)
+    assert place["id"] in [hit["place_id"] for hit in response.json()]
+    await client.delete(f"/api/v1/places/{place['id']}", headers=api_headers)
+
+
+async def test_keyword_search_rejects_blank_query(client, api_headers):
+    response = await client.get("/api/v1/places/search", params={"q": "   "}, headers=api_headers)
+    assert response.status_code == 400
@@ -0,0 +1,126 @@
+"""Provider gateway tests using offline fake providers."""
+
+from __future__ import annotations
+
+import asyncio
+import uuid
+
+import pytest
+
+from app.providers.base import BaseProvider, EnrichmentQuery, ProviderError
+from app.providers.fake import FakeProvider
+from app.providers.gateway import ProviderGateway
+from app.utils.rate_limit import TokenBucket
+
+QUERY = EnrichmentQuery(name="테스트 카페", address="서울 성동구", lat=37.54, lng=127.05)
+
+
+def _gateway(providers: list[BaseProvider], costs: list[str], **kwargs) -> ProviderGateway:
+    async def record(provider: BaseProvider, action: str) -> None:
+        costs.append(f"{provider.name}:{action}")
+
+    return ProviderGateway(providers, cost_logger=record, **kwargs)
+
+
+async def test_lookup_is_cached_and_cost_logged_once():
+    provider = FakeProvider("kakao", data={"category": "카페"}, cost_krw_per_call=1.5)
+    costs: list[str] = []
+    gateway = _gateway([provider], costs, cache_ttl=60)
+
+    first = await gateway.lookup("kakao", QUERY)
+    second = await gateway.lookup("kakao", QUERY)
+
+    assert first.data == {"category": "카페"}
+    assert (first.cached, second.cached) == (False, True)
+    assert len(provider.calls) == 1
+    assert costs == ["kakao:enrich"]
+
+
+async def test_not_found_is_cached_but_errors_are_not():
+    empty = FakeProvider("empty", data=None)
+    broken = FakeProvider("broken", error=ProviderError("upstream 500"))
+    gateway = _gateway([empty, broken], [])
+
+    assert (await gateway.lookup("empty", QUERY)).data is None
+    assert (await gateway.lookup("empty", QUERY)).cached is True
+
+    for _ in range(2):
+        with pytest.raises(ProviderError):
+            await gateway.lookup("broken", QUERY)
+    assert len(broken.calls) == 2
+
+
+async def test_concurrent_identical_lookups_are_coalesced():
+    provider = FakeProvider("kakao", data={"ok": True}, latency=0.05)
+    costs: list[str] = []
+    gateway = _gateway([provider], costs)
+
+    results = await asyncio.gather(*(gateway.lookup("kakao", QUERY) for _ in range(10)))
+
+    assert all(result.data == {"ok": True} for result in results)
+    assert len(provider.calls) == 1
+    assert len(costs) == 1
+
+
+async def test_distinct_queries_are_not_coalesced():
+    provider = FakeProvider("kakao", data=lambda query: {"name": query.name}, latency=0.01)
+    gateway = _gateway([provider], [])
+
+    results = await asyncio.gather(*(gateway.lookup("kakao", EnrichmentQuery(name=f"p{i}")) for i in range(3)))
+
+    assert [result.data["name"] for result in results] == ["p0", "p1", "p2"]
+    assert len(provider.calls) == 3
+
+
+async def test_token_bucket_spaces_out_calls():
+    now = [0.0]
+    sleeps: list[float] = []
+
+    async def fake_sleep(seconds: float) -> None:
+        sleeps.append(seconds)
+        now[0] += seconds
+
+    bucket = TokenBucket(rate=2, capacity=2, clock=lambda: now[0], sleep=fake_sleep)
+    for _ in range(4):
+        await bucket.acquire()
+
+    assert len(sleeps) == 2
+    assert now[0] == pytest.approx(1.0)
+
+
+async def test_enrich_place_unknown(client, api_headers):
+    response = await client.get(f"/api/v1/places/{uuid.uuid4()}/enrich", headers=api_headers)
+    assert response.status_code == 404
+
+
+async def test_enrich_place_with_fake_providers(client, api_headers):
+    from app.deps import async_session_factory
+    from app.services import enrichment_service
+
+    created = await client.post(
+        "/api/v1/places",
+        json={"canonical_name": "보강 테스트", "lat": 37.54, "lng": 127.05},
+        headers=api_headers,
+    )
+    assert created.status_code == 201
+    place_id = uuid.UUID(created.json()["place"]["id"])
+
+    gateway = _gateway(
+        [
+            FakeProvider("kakao", data={"category": "카페"}),
+            FakeProvider("google_places", data={"rating": 4.5}, requires_place_id=True),
+            FakeProvider("naver", error=ProviderError("timeout")),
+        ],
+        [],
+    )
+    async with async_session_factory() as db:
+        enriched = await enrichment_service.enrich_place(db, place_id, gateway=gateway)
+
+    assert enriched is not None
+    statuses = {result.provider: result.status for result in enriched.results}
+    assert statuses == {"kakao": "ok", "google_places": "skipped", "naver": "error"}
+
+    response = await client.get(f"/api/v1/places/{place_id}/enrich", headers=api_headers)
+    assert response.status_code == 200
+
+    await client.delete(f"/api/v1/places/{place_id}", headers=api_headers)
@@ -0,0 +1,109 @@
+"""Rule-based query parser and parse_query tool tests."""
+
+from __future__ import annotations
+
+import json
+
+from app.llm.base import LLMError
+from app.llm.stub_llm import StubLLM
+from app.services.query_parser_service import QueryParser, parser_stats, resolve_query
+from app.utils.aho_corasick import AhoCorasick
+
+ONTOLOGY = [("파스타", "cuisine"), ("이탈리안", "cuisine"), ("테라스", "feature"), ("조용", "mood")]
+
+
+def test_aho_corasick_overlapping_and_longest():
+    automaton: AhoCorasick[str] = AhoCorasick()
+    for pattern in ("he", "she", "his", "hers"):
+        automaton.add(pattern, pattern.upper())
+
+    assert [(m.start, m.end, m.value) for m in automaton.iter_matches("ushers")] == [
+        (1, 4, "SHE"),
+        (2, 4, "HE"),
+        (2, 6, "HERS"),
+    ]
+    assert [m.pattern for m in automaton.find_longest("ushers")] == ["she"]
+    assert len(automaton) == 4
+
+
+def test_parse_keyword_combo_on_fast_path():
+    intent, confidence, matched = QueryParser.from_ontology(ONTOLOGY).parse("주차 조용 데이트")
+
+    assert confidence == 1.0
+    assert intent.filters.parking is True
+    assert intent.filters.mood == ["quiet"]
+    assert intent.filters.companions == ["date"]
+    assert matched == ["parking", "mood:quiet", "companions:date"]
+
+
+def test_parse_particles_patterns_and_ontology_features():
+    parser = QueryParser.from_ontology(ONTOLOGY)
+
+    intent, confidence, _ = parser.parse("주차 가능한 가족 식당 3km 이내")
+    assert confidence == 1.0
+    assert intent.filters.max_distance_km == 3.0
+    assert intent.filters.category_primary == "음식점"
+
+    intent, confidence, _ = parser.parse("4점 이상 테라스 있는 카페")
+    assert confidence == 1.0
+    assert intent.filters.min_rating == 4
+    assert intent.filters.tags == ["테라스"]
+
+
+def test_parse_unknown_words_lower_confidence():
+    intent, confidence, matched = QueryParser.from_ontology(ONTOLOGY).parse("성수동 파스타 맛집")
+
+    assert 0 < confidence < 1
+    assert intent.search_text == "성수동 파스타"
+    assert matched == ["cuisine:파스타"]
+
+    assert QueryParser.from_ontology(ONTOLOGY).parse("아무말")[1] == 0.0
+
+
+async def test_resolve_uses_rules_without_llm_call():
+    llm = StubLLM(reply="{}")
+    before = parser_stats()
+
+    parsed = await resolve_query(QueryParser.from_ontology(ONTOLOGY), "조용한 카페", llm=llm, min_confidence=0.6)
+
+    assert parsed.source == "rules"
+    assert llm.calls == 0
+    after = parser_stats()
+    assert after.fast_path == before.fast_path + 1
+    assert after.total == before.total + 1
+
+
+async def test_resolve_escalates_and_merges_rule_filters():
+    reply = json.dumps({"search_text": "성수동 파스타", "filters": {"category_primary": "음식점"}}, ensure_ascii=False)
+    llm = StubLLM(reply=reply)
+
+    parsed = await resolve_query(QueryParser.from_ontology(ONTOLOGY), "성수동 파스타 주차", llm=llm, min_confidence=0.9)
+
+    assert parsed.source == "llm"
+    assert llm.calls == 1
+    assert parsed.intent.search_text == "성수동 파스타"
+    assert parsed.intent.filters.category_primary == "음식점"
+    assert parsed.intent.filters.parking is True
+
+
+async def test_resolve_keeps_rules_when_llm_fails():
+    before = parser_stats()
+    llm = StubLLM(error=LLMError("down"))
+
+    parsed = await resolve_query(QueryParser.from_ontology(ONTOLOGY), "성수동 데이트", llm=llm, min_confidence=0.9)
+
+    assert parsed.source == "rules"
+    assert parsed.intent.filters.companions == ["date"]
+    assert parser_stats().llm_failed == before.llm_failed + 1
+
+
+async def test_parse_query_tool(client, api_headers):
+    response = await client.post("/api/v1/tools/parse_query", json={"query": "주차 조용 데이트"}, headers=api_headers)
+    assert response.status_code == 200
+    data = response.json()
+    assert data["source"] == "rules"
+    assert data["intent"]["filters"]["parking"] is True
+
+    stats = await client.get("/api/v1/tools/parse_query/stats", headers=api_headers)
+    assert stats.status_code == 200
+    assert stats.json()["fast_path"] >= 1
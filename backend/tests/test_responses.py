@@ -0,0 +1,65 @@
+"""ModelResponse serialization and response middleware tests."""
+
+from __future__ import annotations
+
+import json
+import uuid
+from datetime import UTC, datetime
+from types import SimpleNamespace
+
+import httpx
+from fastapi import FastAPI, Response
+
+from app.api.responses import ModelResponse, SelectiveGZipMiddleware, type_adapter
+from app.schemas.common import PaginatedResponse
+from app.schemas.tag import TagResponse
+
+
+def _tag_row(name: str) -> SimpleNamespace:
+    now = datetime(2026, 1, 1, tzinfo=UTC)
+    return SimpleNamespace(id=uuid.uuid4(), name=name, type="freeform", created_at=now, updated_at=now)
+
+
+def test_validate_reads_orm_attributes_and_matches_model_dump():
+    rows = [_tag_row("조용한"), _tag_row("주차")]
+
+    response = ModelResponse.validate(PaginatedResponse[TagResponse], {"items": rows, "next_cursor": "abc"})
+
+    expected = PaginatedResponse[TagResponse](
+        items=[TagResponse.model_validate(row) for row in rows],
+        next_cursor="abc",
+    ).model_dump(mode="json")
+    assert json.loads(response.body) == expected
+    assert response.media_type == "application/json"
+
+
+def test_explicit_annotation_serializes_containers():
+    tags = [TagResponse.model_validate(_tag_row("데이트"))]
+
+    response = ModelResponse(tags, list[TagResponse], status_code=201)
+
+    assert response.status_code == 201
+    assert json.loads(response.body)[0]["name"] == "데이트"
+    assert type_adapter(list[TagResponse]) is type_adapter(list[TagResponse])
+
+
+async def test_selective_gzip_skips_excluded_paths():
+    app = FastAPI()
+    body = b"x" * 4096
+
+    @app.get("/raw")
+    async def raw() -> Response:
+        return Response(body, media_type="text/plain")
+
+    @app.get("/text")
+    async def text() -> Response:
+        return Response(body, media_type="text/plain")
+
+    app.add_middleware(SelectiveGZipMiddleware, minimum_size=1024, exclude_paths=(r"/raw",))
+    async with httpx.AsyncClient(transport=httpx.ASGITransport(app=app), base_url="http://test") as client:
+        raw_response = await client.get("/raw", headers={"Accept-Encoding": "gzip"})
+        text_response = await client.get("/text", headers={"Accept-Encoding": "gzip"})
+
+    assert "content-encoding" not in raw_response.headers
+    assert raw_response.content == body
+    assert text_response.headers["content-encoding"] == "gzip"
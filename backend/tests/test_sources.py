@@ -0,0 +1,132 @@
+"""Source raw-text blob and range endpoint tests."""
+
+from __future__ import annotations
+
+import hashlib
+import uuid
+
+import pytest
+from sqlalchemy import func, select
+
+from app.api.responses import RangeNotSatisfiableError, byte_range
+from app.deps import async_session_factory
+from app.models.source import SourceBlob
+
+RAW_TEXT = "가나다 raw page text " * 400
+
+
+def test_byte_range_forms():
+    assert byte_range(None, 10) is None
+    assert byte_range("bytes=2-4", 10) == (2, 4)
+    assert byte_range("bytes=7-", 10) == (7, 9)
+    assert byte_range("bytes=-3", 10) == (7, 9)
+    assert byte_range("bytes=0-100", 10) == (0, 9)
+    # 여러 범위나 잘못된 형식은 전체 응답으로 처리
+    assert byte_range("bytes=0-1,4-5", 10) is None
+    assert byte_range("bytes=5-2", 10) is None
+    assert byte_range("lines=1-2", 10) is None
+    with pytest.raises(RangeNotSatisfiableError):
+        byte_range("bytes=10-", 10)
+
+
+async def _create_place(client, api_headers) -> str:
+    response = await client.post(
+        "/api/v1/places", json={"canonical_name": f"source-place-{uuid.uuid4()}"}, headers=api_headers
+    )
+    assert response.status_code == 201, response.text
+    return response.json()["place"]["id"]
+
+
+async def _create_source(client, api_headers, place_id: str, raw_text: str | None) -> dict:
+    response = await client.post(
+        "/api/v1/sources",
+        json={"place_id": place_id, "title": "scrape", "raw_text": raw_text},
+        headers=api_headers,
+    )
+    assert response.status_code == 201, response.text
+    return response.json()
+
+
+async def _blob_count(raw_text: str) -> int:
+    content_hash = hashlib.sha256(raw_text.encode()).hexdigest()
+    async with async_session_factory() as db:
+        return await db.scalar(
+            select(func.count()).select_from(SourceBlob).where(SourceBlob.content_hash == content_hash)
+        )
+
+
+async def test_raw_text_is_deduplicated_and_not_listed(client, api_headers):
+    place_id = await _create_place(client, api_headers)
+    raw_text = f"{uuid.uuid4()} {RAW_TEXT}"
+    first = await _create_source(client, api_headers, place_id, raw_text)
+    second = await _create_source(client, api_headers, place_id, raw_text)
+
+    assert "raw_text" not in first
+    assert first["raw_text_size"] == len(raw_text.encode())
+    listed = await client.get("/api/v1/sources", params={"place_id": place_id}, headers=api_headers)
+    assert all("raw_text" not in item for item in listed.json()["items"])
+    assert await _blob_count(raw_text) == 1
+
+    await client.delete(f"/api/v1/sources/{first['id']}", headers=api_headers)
+    assert await _blob_count(raw_text) == 1
+    await client.delete(f"/api/v1/sources/{second['id']}", headers=api_headers)
+    assert await _blob_count(raw_text) == 0
+
+    await client.delete(f"/api/v1/places/{place_id}", headers=api_headers)
+
+
+async def test_raw_endpoint_ranges_and_encoding(client, api_headers):
+    place_id = await _create_place(client, api_headers)
+    raw_text = f"{uuid.uuid4()} {RAW_TEXT}"
+    data = raw_text.encode()
+    source = await _create_source(client, api_headers, place_id, raw_text)
+    url = f"/api/v1/sources/{source['id']}/raw"
+
+    full = await client.get(url, headers={**api_headers, "Accept-Encoding": "identity"})
+    assert full.status_code == 200
+    assert full.content == data
+    assert full.headers["accept-ranges"] == "bytes"
+
+    deflated = await client.get(url, headers={**api_headers, "Accept-Encoding": "deflate"})
+    assert deflated.headers["content-encoding"] == "deflate"
+    assert deflated.content == data
+    assert deflated.headers["etag"] != full.headers["etag"]
+
+    partial = await client.get(url, headers={**api_headers, "Range": "bytes=10-19"})
+    assert partial.status_code == 206
+    assert partial.content == data[10:20]
+    assert partial.headers["content-range"] == f"bytes 10-19/{len(data)}"
+
+    suffix = await client.get(url, headers={**api_headers, "Range": "bytes=-5"})
+    assert suffix.content == data[-5:]
+
+    beyond = await client.get(url, headers={**api_headers, "Range": f"bytes={len(data)}-"})
+    assert beyond.status_code == 416
+    assert beyond.headers["content-range"] == f"bytes */{len(data)}"
+
+    stale_range = await client.get(url, headers={**api_headers, "Range": "bytes=0-0", "If-Range": '"other"'})
+    assert stale_range.status_code == 200
+
+    revalidated = await client.get(
+        url, headers={**api_headers, "Accept-Encoding": "identity", "If-None-Match": full.headers["etag"]}
+    )
+    assert revalidated.status_code == 304
+
+    # 일반 브라우저 Accept-Encoding — 1 KiB가 넘는 구간도 압축되지 않은 바이트 그대로 온다
+    browser = {**api_headers, "Accept-Encoding": "gzip, deflate"}
+    large = await client.get(url, headers={**browser, "Range": "bytes=0-2047"})
+    assert large.status_code == 206
+    assert "content-encoding" not in large.headers
+    assert large.content == data[:2048]
+    assert large.headers["content-range"] == f"bytes 0-2047/{len(data)}"
+
+    gzip_only = await client.get(url, headers={**api_headers, "Accept-Encoding": "gzip"})
+    assert "content-encoding" not in gzip_only.headers
+    assert gzip_only.content == data
+    assert gzip_only.headers["etag"] == full.headers["etag"]
+
+    no_text = await _create_source(client, api_headers, place_id, None)
+    missing = await client.get(f"/api/v1/sources/{no_text['id']}/raw", headers=api_headers)
+    assert missing.status_code == 404
+
+    await client.delete(f"/api/v1/places/{place_id}", headers=api_headers)
@@ -0,0 +1,61 @@
+"""Batch text normalization tests."""
+
+import uuid
+
+from sqlalchemy import select, update
+
+from app.deps import async_session_factory
+from app.models.place import Place
+from app.services import place_service
+from app.utils.text_normalize import normalize_phone, normalize_phones, normalize_place_name, normalize_place_names
+
+
+def test_batch_names_match_single():
+    names = ["스타벅스 강남점", "Blue Bottle (Seongsu)", "", "  ", "카페-드-파리 2호점!"]
+    assert normalize_place_names(names) == [normalize_place_name(name) for name in names]
+    assert normalize_place_names(names)[:2] == ["스타벅스강남점", "bluebottleseongsu"]
+
+
+def test_fullwidth_forms_are_folded():
+    assert normalize_place_name("ＣＡＦＥ　１２３") == "cafe123"
+    assert normalize_phone("０２－１２３４－５６７８") == "0212345678"
+
+
+def test_batch_phones_match_single():
+    phones = ["+82 10-1234-5678", "02-123-4567", "", "(031) 555 0000", "tel: 8210 1111 2222"]
+    assert normalize_phones(phones) == ["01012345678", "021234567", "", "0315550000", "01011112222"]
+    assert normalize_phones(phones) == [normalize_phone(phone) for phone in phones]
+
+
+def test_country_code_only_at_start_of_each_value():
+    assert normalize_phones(["02 8282", "82-2-123"]) == ["028282", "02123"]
+
+
+def test_embedded_nul_does_not_shift_results():
+    assert normalize_place_names(["a\x00b", "c"]) == ["ab", "c"]
+    assert normalize_phones(["010\x001234", "02"]) == ["0101234", "02"]
+
+
+def test_empty_batch():
+    assert normalize_place_names([]) == []
+    assert normalize_phones([]) == []
+
+
+async def test_renormalize_chunk_rewrites_stale_names(client, api_headers):
+    response = await client.post(
+        "/api/v1/places", json={"canonical_name": f"Ｒｅｎｏｒｍ {uuid.uuid4()}"}, headers=api_headers
+    )
+    assert response.status_code == 201, response.text
+    place_id = uuid.UUID(response.json()["place"]["id"])
+
+    async with async_session_factory() as db:
+        await db.execute(update(Place).where(Place.id == place_id).values(normalized_name="stale"))
+        await db.commit()
+        before = await db.scalar(select(Place.id).where(Place.id < place_id).order_by(Place.id.desc()).limit(1))
+        last_id, scanned, changed = await place_service.renormalize_chunk(db, before, 1)
+        await db.commit()
+        assert (last_id, scanned, changed) == (place_id, 1, 1)
+        name = await db.scalar(select(Place.normalized_name).where(Place.id == place_id))
+    assert name.startswith("renorm")
+
+    await client.delete(f"/api/v1/places/{place_id}", headers=api_headers)
@@ -0,0 +1,114 @@
+"""Denormalized visit aggregate tests."""
+
+from __future__ import annotations
+
+import uuid
+
+from sqlalchemy import update
+
+from app.deps import async_session_factory
+from app.models.place import Place
+from app.services import visit_stats_service
+
+
+async def _create_place(client, api_headers, **overrides):
+    payload = {"canonical_name": f"stats-place-{uuid.uuid4()}"}
+    payload.update(overrides)
+    response = await client.post("/api/v1/places", json=payload, headers=api_headers)
+    assert response.status_code == 201, response.text
+    return response.json()["place"]
+
+
+async def _add_visit(client, api_headers, place_id, visited_at, rating=None):
+    response = await client.post(
+        "/api/v1/visits",
+        json={"place_id": place_id, "visited_at": visited_at, "rating": rating},
+        headers=api_headers,
+    )
+    assert response.status_code == 201, response.text
+    return response.json()
+
+
+async def _get_place(client, api_headers, place_id):
+    response = await client.get(f"/api/v1/places/{place_id}", headers=api_headers)
+    assert response.status_code == 200
+    return response.json()
+
+
+async def test_visit_create_and_delete_update_aggregates(client, api_headers):
+    place = await _create_place(client, api_headers)
+    assert place["visit_count"] == 0
+    assert place["last_visited_at"] is None
+
+    await _add_visit(client, api_headers, place["id"], "2026-01-10", rating=4)
+    latest = await _add_visit(client, api_headers, place["id"], "2026-03-01", rating=2)
+
+    detail = await _get_place(client, api_headers, place["id"])
+    assert detail["visit_count"] == 2
+    assert detail["last_visited_at"] == "2026-03-01"
+
+    delete_res = await client.delete(f"/api/v1/visits/{latest['id']}", headers=api_headers)
+    assert delete_res.status_code == 204
+    detail = await _get_place(client, api_headers, place["id"])
+    assert detail["visit_count"] == 1
+    assert detail["last_visited_at"] == "2026-01-10"
+
+    missing = await client.delete(f"/api/v1/visits/{latest['id']}", headers=api_headers)
+    assert missing.status_code == 404
+
+    await client.delete(f"/api/v1/places/{place['id']}", headers=api_headers)
+
+
+async def test_list_sorted_by_visits(client, api_headers):
+    category = f"stats-{uuid.uuid4()}"
+    often = await _create_place(client, api_headers, category_primary=category)
+    once = await _create_place(client, api_headers, category_primary=category)
+    never = await _create_place(client, api_headers, category_primary=category)
+    for day in ("2026-01-01", "2026-01-02", "2026-01-03"):
+        await _add_visit(client, api_headers, often["id"], day)
+    await _add_visit(client, api_headers, once["id"], "2026-02-01")
+
+    params = {"category_primary": category, "limit": 1}
+    most = await client.get("/api/v1/places", params={**params, "sort": "most_visited"}, headers=api_headers)
+    assert most.status_code == 200
+    assert most.json()["items"][0]["id"] == often["id"]
+    second_page = await client.get(
+        "/api/v1/places",
+        params={**params, "sort": "most_visited", "cursor": most.json()["next_cursor"]},
+        headers=api_headers,
+    )
+    assert second_page.json()["items"][0]["id"] == once["id"]
+
+    recent = await client.get("/api/v1/places", params={**params, "sort": "recently_visited"}, headers=api_headers)
+    assert recent.json()["total"] == 2
+    assert recent.json()["items"][0]["id"] == once["id"]
+
+    for place in (often, once, never):
+        await client.delete(f"/api/v1/places/{place['id']}", headers=api_headers)
+
+
+async def test_merge_and_recompute_aggregates(client, api_headers):
+    keep = await _create_place(client, api_headers)
+    merge = await _create_place(client, api_headers)
+    await _add_visit(client, api_headers, keep["id"], "2026-01-01", rating=5)
+    await _add_visit(client, api_headers, merge["id"], "2026-04-01", rating=3)
+
+    merge_res = await client.post(
+        f"/api/v1/places/{keep['id']}/merge",
+        json={"merge_with": merge["id"]},
+        headers=api_headers,
+    )
+    assert merge_res.status_code == 200
+    assert merge_res.json()["visit_count"] == 2
+    assert merge_res.json()["last_visited_at"] == "2026-04-01"
+
+    keep_id = uuid.UUID(keep["id"])
+    async with async_session_factory() as db:
+        await db.execute(update(Place).where(Place.id == keep_id).values(visit_count=99, visit_rating_sum=0))
+        await db.commit()
+        assert await visit_stats_service.recompute(db, [keep_id]) == 1
+        await db.commit()
+        place = await db.get(Place, keep_id)
+        assert (place.visit_count, place.visit_rating_sum, place.visit_rating_count) == (2, 8, 2)
+
+    await client.delete(f"/api/v1/places/{keep['id']}", headers=api_headers)